@@ -1,3 +1,4 @@
 from .main import router as main_router
+from .well_known import router as well_known_router
 
-__all__ = ['main_router']
+__all__ = ['main_router', 'well_known_router']
@@ -1,55 +1,117 @@
-from typing import List
+from typing import Annotated, List
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 
-from app.core.dependencies import AdminDep, DBAnnotation, UserAnnotation
+from app.core.dependencies import (
+    AdminDep,
+    DBAnnotation,
+    InMemoryAnnotation,
+    UserAnnotation,
+)
+from app.core.settings import settings
+from app.exceptions import ImportFileTooLargeError, InvalidCursorError
 from app.models.user_models import (
     UserModel,
     UserUpdate,
     UserCreationWithRoles,
     UserModelWithRoles,
     UserUpdateFull,
+    UserListGet,
+    UserImportResult,
+    UserRoles,
+    UserRolesChange,
 )
-from app.services import UserService, RoleService
+from app.services import UserService, RoleService, TokenService
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.records import parse_records
 
 router = APIRouter()
 
 
+async def _read_body(request: Request, max_bytes: int) -> bytes:
+    """Read request body, rejecting it once it exceeds ``max_bytes``."""
+    content_length = request.headers.get('content-length', '')
+    if content_length.isdigit() and int(content_length) > max_bytes:
+        raise ImportFileTooLargeError
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > max_bytes:
+            raise ImportFileTooLargeError
+    return bytes(body)
+
+
 @router.get('/me')
-async def get_me(
-    user: UserAnnotation, uow: DBAnnotation
-) -> UserModelWithRoles:
+async def get_me(user: UserAnnotation) -> UserModelWithRoles:
     """Get the current user."""
-    user_roles = await RoleService.get_roles(uow, user.id_)
-    roles = []
-    for role in user_roles:
-        roles.append(role.role)
-    user_model = UserModelWithRoles(**user.model_dump(), roles=roles)
-    return user_model
+    return UserModelWithRoles(**user.model_dump())
 
 
 @router.post('/update')
 async def update_me(
-    update_data: UserUpdate, user: UserAnnotation, uow: DBAnnotation
+    update_data: UserUpdate,
+    user: UserAnnotation,
+    uow: DBAnnotation,
+    inmemory: InMemoryAnnotation,
 ) -> UserModel:
     """Update the current user."""
     data = update_data.model_dump(exclude_none=True)
     result = await UserService.update_user(uow, user.id_, data)
+    if 'password' in data:
+        await TokenService.revoke_user_tokens(inmemory, user.id_)
     return result
 
 
 @router.get('/', dependencies=[AdminDep])
 async def get_all_users(
+    data: Annotated[UserListGet, Query()],
     uow: DBAnnotation,
-    from_: int = Query(default=0, title='from', ge=0),
-    count: int = Query(default=100, ge=0, le=100),
+    response: Response,
 ) -> List[UserModelWithRoles]:
-    """Get all users."""
-    users = await UserService.get_all_users(uow, from_, count)
+    """
+    Get all users.
+
+    Pass ``X-Next-Cursor`` response header as ``cursor``
+    to get the next page.
+    """
+    after = None
+    if data.cursor is not None:
+        cursor = decode_cursor(data.cursor, {'sort_by', 'value', 'id'})
+        value_type = int if data.sort_by == 'id' else str
+        if (
+            cursor['sort_by'] != data.sort_by
+            or not isinstance(cursor['id'], int)
+            or not isinstance(cursor['value'], value_type)
+        ):
+            raise InvalidCursorError
+        after = (cursor['value'], cursor['id'])
+    users = await UserService.get_users_page(
+        uow,
+        sort_by=data.sort_by,
+        after=after,
+        offset=data.from_,
+        limit=data.count + 1,
+        role=data.role,
+        is_active=data.is_active,
+    )
+    has_next_page = len(users) > data.count
+    users = users[: data.count]
+    if has_next_page and users:
+        last_user = users[-1]
+        sort_field = 'id_' if data.sort_by == 'id' else data.sort_by
+        response.headers['X-Next-Cursor'] = encode_cursor(
+            {
+                'sort_by': data.sort_by,
+                'value': getattr(last_user, sort_field),
+                'id': last_user.id_,
+            }
+        )
+    users_roles = await RoleService.get_roles_by_user_ids(
+        uow, [user.id_ for user in users]
+    )
     result = []
     for user in users:
-        user_roles = await RoleService.get_roles(uow, user.id_)
-        roles = [role.role for role in user_roles]
+        roles = [role.role for role in users_roles[user.id_]]
         user_model = UserModelWithRoles(**user.model_dump(), roles=roles)
         result.append(user_model)
     return result
@@ -71,15 +133,67 @@ async def create_user(
     return result
 
 
+@router.post('/import', dependencies=[AdminDep])
+async def import_users(
+    request: Request, uow: DBAnnotation
+) -> UserImportResult:
+    """
+    Import users with roles from JSON array, NDJSON or CSV body.
+
+    CSV roles are separated by ``;``. Rows with errors are reported
+    and skipped, other rows are created. Files larger than
+    ``USER_IMPORT_MAX_BYTES`` are rejected before they are read.
+    """
+    body = await _read_body(request, settings.USER_IMPORT_MAX_BYTES)
+    records = parse_records(
+        body,
+        request.headers.get('content-type', ''),
+        list_fields=('roles',),
+        max_rows=settings.USER_IMPORT_MAX_ROWS,
+    )
+    return await UserService.import_users(
+        uow, records, settings.USER_IMPORT_BATCH_SIZE
+    )
+
+
+@router.post('/roles/assign', dependencies=[AdminDep])
+async def assign_role(
+    data: UserRolesChange, uow: DBAnnotation
+) -> List[UserRoles]:
+    """Add a role to users, unknown users are skipped."""
+    users_roles = await RoleService.assign_role(uow, data.user_ids, data.role)
+    return [
+        UserRoles(user_id=user_id, roles=[role.role for role in roles])
+        for user_id, roles in users_roles.items()
+    ]
+
+
+@router.post('/roles/revoke', dependencies=[AdminDep])
+async def revoke_role(
+    data: UserRolesChange, uow: DBAnnotation
+) -> List[UserRoles]:
+    """Deactivate a role of users."""
+    users_roles = await RoleService.revoke_role(uow, data.user_ids, data.role)
+    return [
+        UserRoles(user_id=user_id, roles=[role.role for role in roles])
+        for user_id, roles in users_roles.items()
+    ]
+
+
 @router.put('/{user_id}', dependencies=[AdminDep])
 async def update_user(
-    user_id: int, update_data: UserUpdateFull, uow: DBAnnotation
+    user_id: int,
+    update_data: UserUpdateFull,
+    uow: DBAnnotation,
+    inmemory: InMemoryAnnotation,
 ) -> UserModelWithRoles:
     """Update a user."""
     data = update_data.model_dump(exclude_none=True)
     roles = data.pop('roles')
     updated_user = await UserService.update_user(uow, user_id, data)
     updated_roles = await RoleService.update_roles(uow, user_id, roles)
+    if 'password' in data:
+        await TokenService.revoke_user_tokens(inmemory, user_id)
 
     new_roles = [role.role for role in updated_roles]
     result = UserModelWithRoles(**updated_user.model_dump(), roles=new_roles)
@@ -87,8 +201,11 @@ async def update_user(
 
 
 @router.delete('/{user_id}', dependencies=[AdminDep])
-async def delete_user(user_id: int, uow: DBAnnotation) -> UserModel:
+async def delete_user(
+    user_id: int, uow: DBAnnotation, inmemory: InMemoryAnnotation
+) -> UserModel:
     """Delete a user."""
     user = await UserService.delete_user(uow, user_id)
+    await TokenService.revoke_user_tokens(inmemory, user_id)
     result = UserModel(**user.model_dump())
     return result
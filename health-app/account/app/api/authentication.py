@@ -1,26 +1,34 @@
 import uuid
+from typing import Any
 
 from fastapi import APIRouter
 
 from app.core.dependencies import (
     DBAnnotation,
     TokenAnnotation,
+    UserRefreshAnnotation,
     UserRefreshDep,
     InMemoryAnnotation,
 )
+from app.core.hasher import password_hasher
+from app.core.settings import settings
 from app.core.security import (
-    verify_password,
     create_access_token,
     create_refresh_token,
-    decode_token,
-    verify_token,
+    introspect_token,
+)
+from app.exceptions import (
+    InvalidLoginError,
+    InvalidTokenError,
+    NoResultError,
 )
-from app.exceptions import InvalidLoginError, NoResultError
 from app.models.token_models import (
+    InvalidTokenPayload,
     Tokens,
     TokenPayload,
+    TokensIntrospection,
 )
-from app.models.user_models import UserAdd, Authentication
+from app.models.user_models import UserAdd, Authentication, Principal
 from app.services import UserService, TokenService, RoleService
 from app.utils.datetime import get_now, get_access_expires, get_refresh_expires
 from app.utils.enums import TokenStatus, Role
@@ -28,6 +36,13 @@ from app.utils.enums import TokenStatus, Role
 router = APIRouter()
 
 
+def _get_role_claims(principal: Principal) -> dict[str, Any]:
+    """Get role claims of access token if they are enabled."""
+    if not settings.ACCESS_TOKEN_ROLES:
+        return {}
+    return {'roles': principal.roles, 'role_version': principal.role_version}
+
+
 @router.post('/signup')
 async def signup(data: UserAdd, uow: DBAnnotation) -> Tokens:
     """Register a new user."""
@@ -35,11 +50,21 @@ async def signup(data: UserAdd, uow: DBAnnotation) -> Tokens:
     creation_data = data.model_dump(exclude={'password1', 'password2'})
     creation_data['password'] = password
     user = await UserService.add_user(uow, creation_data)
-    await RoleService.add_role(uow, user.id_, Role.USER)
+    # Keep role version 0 which the new access token claims
+    await RoleService.add_role(uow, user.id_, Role.USER, new_user=True)
 
     access_token = create_access_token(
         user_id=user.id_,
         username=user.username,
+        **_get_role_claims(
+            Principal(
+                id_=user.id_,
+                username=user.username,
+                first_name=user.first_name,
+                last_name=user.last_name,
+                roles=[Role.USER],
+            )
+        ),
     )
     refresh_token = create_refresh_token(
         user_id=user.id_,
@@ -49,21 +74,33 @@ async def signup(data: UserAdd, uow: DBAnnotation) -> Tokens:
 
 
 @router.post('/signin')
-async def signin(data: Authentication, uow: DBAnnotation) -> Tokens:
+async def signin(
+    data: Authentication, uow: DBAnnotation, inmemory: InMemoryAnnotation
+) -> Tokens:
     """Authenticate a user."""
     try:
         user = await UserService.get_user(uow, username=data.username)
     except NoResultError:
         raise InvalidLoginError
-    if not verify_password(data.password.get_secret_value(), user.password):
+    is_verified = await password_hasher.verify(
+        data.password.get_secret_value(), user.password
+    )
+    if not is_verified:
         raise InvalidLoginError
+    state = await TokenService.get_user_state(inmemory, user.id_)
+    principal = await UserService.get_principal(
+        uow, user.id_, state.role_version
+    )
     access_token = create_access_token(
         user_id=user.id_,
         username=user.username,
+        epoch=state.epoch,
+        **_get_role_claims(principal),
     )
     refresh_token = create_refresh_token(
         user_id=user.id_,
         username=user.username,
+        epoch=state.epoch,
     )
     return Tokens(access_token=access_token, refresh_token=refresh_token)
 
@@ -74,7 +111,18 @@ async def signout(
 ):
     """Sign out a user."""
     token_id = uuid.UUID(token_payload['jti'])
-    await TokenService.blacklist_token(inmemory, token_id)
+    await TokenService.blacklist_token(
+        inmemory, token_id, expires_at=token_payload['exp']
+    )
+    return {'status': 'ok'}
+
+
+@router.put('/signout/all', dependencies=[UserRefreshDep])
+async def signout_all(
+    token_payload: TokenAnnotation, inmemory: InMemoryAnnotation
+):
+    """Sign out a user from all devices."""
+    await TokenService.revoke_user_tokens(inmemory, token_payload['user_id'])
     return {'status': 'ok'}
 
 
@@ -83,22 +131,50 @@ async def validate(
     access_token: str, inmemory: InMemoryAnnotation
 ) -> TokenPayload:
     """Introspection the token."""
-    decoded_token = decode_token(access_token, verify=False)
-    token_status = TokenStatus.ACTIVE
-    if not verify_token(access_token):
-        token_status = TokenStatus.EXPIRED
-    is_blacklisted = await TokenService.check_blacklist_token(
-        inmemory, decoded_token['jti']
+    decoded_token, token_status = introspect_token(access_token)
+    is_revoked = await TokenService.check_revoked_token(
+        inmemory, decoded_token
     )
-    if is_blacklisted:
+    if is_revoked:
         token_status = TokenStatus.BLACKLISTED
     return TokenPayload(**decoded_token, status=token_status)
 
 
-@router.post(
-    '/access', response_model_exclude_none=True, dependencies=[UserRefreshDep]
-)
-async def access(refresh_payload: TokenAnnotation) -> Tokens:
+@router.post('/introspect')
+async def introspect(
+    data: TokensIntrospection, inmemory: InMemoryAnnotation
+) -> list[TokenPayload | InvalidTokenPayload]:
+    """Introspection many tokens with one blacklist lookup."""
+    decoded_tokens = []
+    for token in data.tokens:
+        try:
+            decoded_tokens.append(introspect_token(token))
+        except InvalidTokenError:
+            decoded_tokens.append(None)
+
+    payloads = [
+        decoded_token[0]
+        for decoded_token in decoded_tokens
+        if decoded_token is not None
+    ]
+    revoked = iter(await TokenService.check_revoked_tokens(inmemory, payloads))
+
+    result: list[TokenPayload | InvalidTokenPayload] = []
+    for decoded_token in decoded_tokens:
+        if decoded_token is None:
+            result.append(InvalidTokenPayload())
+            continue
+        payload, token_status = decoded_token
+        if next(revoked):
+            token_status = TokenStatus.BLACKLISTED
+        result.append(TokenPayload(**payload, status=token_status))
+    return result
+
+
+@router.post('/access', response_model_exclude_none=True)
+async def access(
+    refresh_payload: TokenAnnotation, user: UserRefreshAnnotation
+) -> Tokens:
     """
     Get new access token from refresh token
     (need refresh token in header).
@@ -112,13 +188,17 @@ async def access(refresh_payload: TokenAnnotation) -> Tokens:
         refresh_payload['jti'],
         expires_in=expires_in,
         now=now,
+        epoch=refresh_payload.get('epoch', 0),
+        **_get_role_claims(user),
     )
     result = Tokens(access_token=access_token, expires_at=expires_at)
     return result
 
 
-@router.post('/refresh', dependencies=[UserRefreshDep])
-async def refresh(refresh_payload: TokenAnnotation) -> Tokens:
+@router.post('/refresh')
+async def refresh(
+    refresh_payload: TokenAnnotation, user: UserRefreshAnnotation
+) -> Tokens:
     """Get a new pair of tokens (need refresh token in header)."""
     token_id = uuid.uuid4()
     now = get_now()
@@ -131,6 +211,8 @@ async def refresh(refresh_payload: TokenAnnotation) -> Tokens:
         token_id,
         expires_in=access_expires_in,
         now=now,
+        epoch=refresh_payload.get('epoch', 0),
+        **_get_role_claims(user),
     )
     refresh_token = create_refresh_token(
         refresh_payload['user_id'],
@@ -138,6 +220,7 @@ async def refresh(refresh_payload: TokenAnnotation) -> Tokens:
         token_id,
         expires_in=refresh_expires_in,
         now=now,
+        epoch=refresh_payload.get('epoch', 0),
     )
 
     result = Tokens(access_token=access_token, refresh_token=refresh_token)
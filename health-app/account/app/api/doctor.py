@@ -1,31 +1,58 @@
 from typing import List, Annotated
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
 
 from app.core.dependencies import UserDep, DBAnnotation
-from app.exceptions import NoResultError
+from app.exceptions import InvalidCursorError, NoResultError
 from app.models.user_models import DoctorGet, UserModel
-from app.services import RoleService, UserService
+from app.services import UserService
 from app.utils.enums import Role
+from app.utils.pagination import decode_cursor, encode_cursor
 
 router = APIRouter()
 
 
 @router.get('/', dependencies=[UserDep])
 async def get_doctors(
-    data: Annotated[DoctorGet, Query()], uow: DBAnnotation
+    data: Annotated[DoctorGet, Query()],
+    uow: DBAnnotation,
+    response: Response,
 ) -> List[UserModel]:
-    """Get all doctors."""
-    user_roles = await RoleService.get_all_roles(uow, [Role.DOCTOR])
-    user_ids = [user_roles.user_id for user_roles in user_roles]
+    """
+    Get all doctors.
 
-    doctors = await UserService.get_users_by_ids(
+    Pass ``X-Next-Cursor`` response header as ``cursor``
+    to get the next page. With ``search`` doctors are ranked by name
+    similarity and paginated by ``from`` and ``count``.
+    """
+    if data.search is not None:
+        doctors = await UserService.search_users_by_role(
+            uow,
+            Role.DOCTOR,
+            data.search,
+            offset=data.from_,
+            limit=data.count,
+        )
+        return [UserModel(**doctor.model_dump()) for doctor in doctors]
+
+    after_id = None
+    if data.cursor is not None:
+        after_id = decode_cursor(data.cursor, {'id'})['id']
+        if not isinstance(after_id, int) or isinstance(after_id, bool):
+            raise InvalidCursorError
+    doctors = await UserService.get_users_by_role(
         uow,
-        user_ids,
-        offset=data.from_,
-        limit=data.count,
+        Role.DOCTOR,
+        after_id=after_id,
+        offset=data.from_ if data.cursor is None else None,
+        limit=data.count + 1,
         full_name=data.name_filter,
     )
+    if len(doctors) > data.count:
+        doctors = doctors[: data.count]
+        response.headers['X-Next-Cursor'] = encode_cursor(
+            {'id': doctors[-1].id_}
+        )
     result = []
     for doctor in doctors:
         result.append(UserModel(**doctor.model_dump()))
@@ -36,8 +63,9 @@ async def get_doctors(
 async def get_doctor(user_id: int, uow: DBAnnotation) -> UserModel:
     """Get a doctor by id."""
     try:
-        await RoleService.get_role(uow, user_id, Role.DOCTOR)
+        doctor = await UserService.get_user_with_roles(uow, user_id)
     except NoResultError:
         raise NoResultError('Doctor')
-    doctor = await UserService.get_user_by_id(uow, user_id)
+    if Role.DOCTOR not in [role.role for role in doctor.roles]:
+        raise NoResultError('Doctor')
     return UserModel(**doctor.model_dump())
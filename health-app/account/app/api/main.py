@@ -3,9 +3,10 @@ from fastapi import APIRouter
 from app.api.accounts import router as account_router
 from app.api.authentication import router as auth_router
 from app.api.doctor import router as doctor_router
+from app.api.metrics import router as metrics_router
 
 router = APIRouter(
-    responses={400: {}, 401: {}, 403: {}, 404: {}, 409: {}, 500: {}}
+    responses={400: {}, 401: {}, 403: {}, 404: {}, 409: {}, 500: {}, 503: {}}
 )
 
 router.include_router(account_router, prefix='/accounts', tags=['Accounts'])
@@ -13,3 +14,4 @@ router.include_router(
     auth_router, prefix='/authentication', tags=['Authentication']
 )
 router.include_router(doctor_router, prefix='/doctors', tags=['Doctors'])
+router.include_router(metrics_router, prefix='/metrics', tags=['Metrics'])
@@ -0,0 +1,34 @@
+from typing import Any
+
+from fastapi import APIRouter
+
+from app.core.blacklist_filter import blacklist_filter
+from app.core.db import (
+    compiled_cache_stats,
+    get_db_pool_stats,
+    replica_router,
+)
+from app.core.dependencies import AdminDep
+from app.core.hasher import password_hasher
+from app.core.local_storage import storage
+from app.core.principal_cache import principal_cache
+from app.core.redis import get_pool_stats
+from app.core.token_cache import token_cache
+
+router = APIRouter()
+
+
+@router.get('/', dependencies=[AdminDep])
+async def get_metrics() -> dict[str, Any]:
+    """Get runtime metrics of the service components."""
+    return {
+        'blacklist_filter': blacklist_filter.get_stats(),
+        'database_compiled_cache': compiled_cache_stats.get_stats(),
+        'database_pool': get_db_pool_stats(),
+        'local_storage': storage.get_stats(),
+        'password_hasher': password_hasher.get_stats(),
+        'principal_cache': principal_cache.get_stats(),
+        'redis_pool': get_pool_stats(),
+        'replicas': replica_router.get_stats(),
+        'token_cache': token_cache.get_stats(),
+    }
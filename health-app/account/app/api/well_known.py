@@ -0,0 +1,17 @@
+from typing import Any
+
+from fastapi import APIRouter, Response
+
+from app.core.keys import key_set
+from app.core.settings import settings
+
+router = APIRouter()
+
+
+@router.get('/jwks.json')
+async def get_jwks(response: Response) -> dict[str, list[dict[str, Any]]]:
+    """Get public keys for local verification of tokens."""
+    response.headers['Cache-Control'] = (
+        f'public, max-age={settings.JWKS_CACHE_MAX_AGE}'
+    )
+    return key_set.get_jwks()
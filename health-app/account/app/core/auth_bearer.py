@@ -1,11 +1,10 @@
 from fastapi import Request
 from fastapi.security.http import HTTPBearer, HTTPAuthorizationCredentials
 
-from app.core.security import verify_token
+from app.core.security import decode_token
 from app.exceptions import (
     InvalidAuthCodeError,
     InvalidAuthSchemeError,
-    InvalidTokenError,
 )
 
 
@@ -15,10 +14,13 @@ class JWTBearer(HTTPBearer):
 
     async def __call__(self, request: Request) -> str:
         """
-        Get token payload by request.
+        Get token by request.
+
+        The token is verified and decoded once, its payload is stored
+        in ``request.state.token_payload``.
 
         :param request: Request object.
-        :return: Token payload.
+        :return: JWT token.
         """
         credentials: HTTPAuthorizationCredentials = await super().__call__(
             request
@@ -30,6 +32,5 @@ class JWTBearer(HTTPBearer):
             raise InvalidAuthSchemeError
 
         token = credentials.credentials
-        if not verify_token(token):
-            raise InvalidTokenError
+        request.state.token_payload = decode_token(token)
         return token
@@ -0,0 +1,177 @@
+"""Module for local probabilistic filter of blacklisted tokens."""
+
+import asyncio
+import hashlib
+import logging
+import math
+import time
+import uuid
+from typing import Any, Callable
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from app.core.redis import create_redis
+from app.core.settings import settings
+from app.repositories import BlacklistTokenRepository
+
+
+class BloomFilter:
+    """Bloom filter of strings."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.size = math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+
+        self._bits = bytearray(math.ceil(self.size / 8))
+
+    def _get_positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [
+            (first + i * second) % self.size for i in range(self.hash_count)
+        ]
+
+    def add(self, item: str) -> None:
+        for position in self._get_positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._get_positions(item)
+        )
+
+
+class BlacklistFilter:
+    """
+    Local filter of blacklisted token identifiers.
+
+    The filter is seeded from a SCAN of blacklist keys and kept current by
+    the blacklist pub/sub channel. A token not in the filter is surely not
+    blacklisted, other tokens must be checked in Redis. Until the filter
+    is seeded every token is reported as possibly blacklisted.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        rebuild_seconds: float = 3600,
+        retry_seconds: float = 5,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_seconds = rebuild_seconds
+        self.retry_seconds = retry_seconds
+
+        self._bloom: BloomFilter | None = None
+        self._filtered = 0
+        self._passed = 0
+
+    @property
+    def is_ready(self) -> bool:
+        return self._bloom is not None
+
+    def might_contain(self, token_uuid: str | uuid.UUID) -> bool:
+        """
+        Check if token may be blacklisted.
+
+        :param token_uuid: Token identifier.
+        :return: False if token is surely not blacklisted.
+        """
+        if self._bloom is None or str(token_uuid) in self._bloom:
+            self._passed += 1
+            return True
+        self._filtered += 1
+        return False
+
+    def add(self, token_uuid: str | uuid.UUID) -> None:
+        """Add blacklisted token identifier."""
+        if self._bloom is not None:
+            self._bloom.add(str(token_uuid))
+
+    @staticmethod
+    async def _drain(pubsub: PubSub, blooms: list[BloomFilter]) -> None:
+        while True:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=0
+            )
+            if message is None:
+                return
+            for bloom in blooms:
+                bloom.add(message['data'].decode())
+
+    async def _rebuild(self, connection: Redis, pubsub: PubSub) -> None:
+        bloom = BloomFilter(self.capacity, self.error_rate)
+        blooms = [bloom]
+        if self._bloom is not None:
+            blooms.append(self._bloom)
+
+        repository = BlacklistTokenRepository(connection)
+        scanned = 0
+        async for token_uuid in repository.scan_tokens():
+            bloom.add(token_uuid)
+            scanned += 1
+            if scanned % 1000 == 0:
+                await self._drain(pubsub, blooms)
+        await self._drain(pubsub, blooms)
+
+        if bloom.count > self.capacity:
+            logging.warning(
+                'Blacklist filter holds %s tokens over capacity %s',
+                bloom.count,
+                self.capacity,
+            )
+        self._bloom = bloom
+
+    async def _listen(self, connection: Redis) -> None:
+        async with connection.pubsub() as pubsub:
+            await pubsub.subscribe(BlacklistTokenRepository.channel)
+            while True:
+                await self._rebuild(connection, pubsub)
+                rebuild_at = time.monotonic() + self.rebuild_seconds
+                while (timeout := rebuild_at - time.monotonic()) > 0:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=timeout
+                    )
+                    if message is not None:
+                        self.add(message['data'].decode())
+
+    async def run(
+        self, connection_factory: Callable[[], Redis] = create_redis
+    ) -> None:
+        """Seed the filter and keep it current until cancelled."""
+        while True:
+            connection = connection_factory()
+            try:
+                await self._listen(connection)
+            except RedisError:
+                logging.exception('Blacklist filter is out of sync')
+            finally:
+                self._bloom = None
+            await asyncio.sleep(self.retry_seconds)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get filter state and counters."""
+        return {
+            'ready': self.is_ready,
+            'tokens': self._bloom.count if self._bloom is not None else 0,
+            'capacity': self.capacity,
+            'filtered': self._filtered,
+            'passed': self._passed,
+        }
+
+
+blacklist_filter = BlacklistFilter(
+    capacity=settings.BLACKLIST_FILTER_CAPACITY,
+    error_rate=settings.BLACKLIST_FILTER_ERROR_RATE,
+    rebuild_seconds=settings.BLACKLIST_FILTER_REBUILD_SECONDS,
+)
@@ -1,18 +1,391 @@
 """Database module."""
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+import hashlib
+import itertools
+import time
+import uuid
+from typing import Any, Literal
+
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.dml import UpdateBase
+
+from app.core.settings import Mode, Settings, settings
+
+# Engine options by application mode, overridden by POSTGRES_* settings
+ENGINE_PROFILES: dict[Mode, dict[str, Any]] = {
+    Mode.DEVELOPMENT: {
+        'echo': True,
+        'pool_size': 5,
+        'max_overflow': 10,
+        'pool_timeout': 30,
+        'pool_recycle': -1,
+        'pool_pre_ping': False,
+        'prepared_statement_cache_size': 100,
+        'query_cache_size': 500,
+    },
+    Mode.TESTING: {
+        'echo': False,
+        'pool_size': 5,
+        'max_overflow': 10,
+        'pool_timeout': 30,
+        'pool_recycle': -1,
+        'pool_pre_ping': False,
+        'prepared_statement_cache_size': 100,
+        'query_cache_size': 500,
+    },
+    Mode.PRODUCTION: {
+        'echo': False,
+        'pool_size': 20,
+        'max_overflow': 10,
+        'pool_timeout': 10,
+        'pool_recycle': 1800,
+        'pool_pre_ping': True,
+        'prepared_statement_cache_size': 500,
+        'query_cache_size': 1000,
+    },
+}
+
+
+def _get_statement_name() -> str:
+    return f'__asyncpg_{uuid.uuid4()}__'
+
+
+def get_engine_options(config: Settings) -> dict[str, Any]:
+    """
+    Get engine options of the application mode profile.
+
+    With ``POSTGRES_PGBOUNCER`` statements are safe behind a transaction
+    pooler: prepared statements are not cached by asyncpg or SQLAlchemy
+    and have unique names, because the next transaction may run on
+    another server connection.
+
+    :param config: Settings, not None ``POSTGRES_*`` options override
+        the profile.
+    :return: Keyword arguments of :func:`create_async_engine`.
+    """
+    options = dict(ENGINE_PROFILES[config.MODE])
+    overrides = {
+        'echo': config.POSTGRES_ECHO,
+        'pool_size': config.POSTGRES_POOL_SIZE,
+        'max_overflow': config.POSTGRES_MAX_OVERFLOW,
+        'pool_timeout': config.POSTGRES_POOL_TIMEOUT,
+        'pool_recycle': config.POSTGRES_POOL_RECYCLE,
+        'pool_pre_ping': config.POSTGRES_POOL_PRE_PING,
+        'prepared_statement_cache_size': (
+            config.POSTGRES_STATEMENT_CACHE_SIZE
+        ),
+        'query_cache_size': config.POSTGRES_COMPILED_CACHE_SIZE,
+    }
+    options.update(
+        (key, value) for key, value in overrides.items() if value is not None
+    )
+    options['connect_args'] = {
+        'prepared_statement_cache_size': options.pop(
+            'prepared_statement_cache_size'
+        )
+    }
+    if config.POSTGRES_PGBOUNCER:
+        options['connect_args'] = {
+            'prepared_statement_cache_size': 0,
+            'statement_cache_size': 0,
+            'prepared_statement_name_func': _get_statement_name,
+        }
+    return options
+
+
+class PoolStatsMixin:
+    """Mixin of a queue pool counting checkouts, waits and timeouts."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()  # type: ignore
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        elapsed = time.perf_counter() - started
+        self.checkouts += 1
+        self.wait_seconds += elapsed
+        self.max_wait_seconds = max(self.max_wait_seconds, elapsed)
+        return connection
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Get pool usage and checkout statistics."""
+        return {
+            'size': self.size(),  # type: ignore
+            'checked_out': self.checkedout(),  # type: ignore
+            'overflow': max(0, self.overflow()),  # type: ignore
+            'checkouts': self.checkouts,
+            'timeouts': self.timeouts,
+            'avg_wait_seconds': self.wait_seconds / (self.checkouts or 1),
+            'max_wait_seconds': self.max_wait_seconds,
+        }
+
+
+class InstrumentedPool(PoolStatsMixin, AsyncAdaptedQueuePool):
+    """Async queue pool with checkout statistics."""
+
+    ...  # fmt: off
+
+
+class CompiledCacheStats:
+    """
+    Counter of compiled cache hits and misses of executed statements.
+
+    Statements without a cache key, such as plain SQL strings, are
+    counted as uncached.
+    """
+
+    def __init__(self):
+        self.engines: list[AsyncEngine] = []
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """Count statements executed by engine."""
+        self.engines.append(engine)
+        event.listen(engine.sync_engine, 'before_cursor_execute', self._record)
+
+    def _record(
+        self,
+        _connection,
+        _cursor,
+        _statement,
+        _parameters,
+        context,
+        _executemany,
+    ) -> None:
+        if context is None:
+            return
+        if context.cache_hit is CacheStats.CACHE_HIT:
+            self.hits += 1
+        elif context.cache_hit is CacheStats.CACHE_MISS:
+            self.misses += 1
+        else:
+            self.uncached += 1
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Get compiled cache size and hit/miss counters."""
+        caches = [
+            engine.sync_engine._compiled_cache
+            for engine in self.engines
+            if engine.sync_engine._compiled_cache is not None
+        ]
+        return {
+            'size': sum(len(cache) for cache in caches),
+            'max_size': sum(cache.capacity for cache in caches),
+            'hits': self.hits,
+            'misses': self.misses,
+            'uncached': self.uncached,
+            'hit_ratio': self.hits / ((self.hits + self.misses) or 1),
+        }
+
+
+compiled_cache_stats = CompiledCacheStats()
+
+
+def create_engine(url: str, config: Settings = settings) -> AsyncEngine:
+    """
+    Create engine with the settings profile and instrumented pool.
+
+    Compiled cache usage of the engine is counted by
+    ``compiled_cache_stats``.
+    """
+    engine = create_async_engine(
+        url, poolclass=InstrumentedPool, **get_engine_options(config)
+    )
+    compiled_cache_stats.attach(engine)
+    return engine
 
-from app.core.settings import settings
 
-engine = create_async_engine(settings.POSTGRES_URL, future=True, echo=True)
+engine = create_engine(settings.POSTGRES_URL)
+
+
+class TrackedSession(Session):
+    """Session which marks ``info['has_writes']`` once it writes."""
+
+    ...  # fmt: off
+
+
+@event.listens_for(TrackedSession, 'after_flush')
+def _track_flush(session: Session, _) -> None:
+    session.info['has_writes'] = True
+
+
+@event.listens_for(TrackedSession, 'do_orm_execute')
+def _track_execute(state: ORMExecuteState) -> None:
+    # Selects can write with data-modifying CTEs
+    if not state.is_select or any(
+        isinstance(element, UpdateBase)
+        for element in visitors.iterate(state.statement)
+    ):
+        state.session.info['has_writes'] = True
+
 
 async_session = sessionmaker(  # type: ignore
-    engine, expire_on_commit=False, class_=AsyncSession
+    engine,
+    expire_on_commit=False,
+    class_=AsyncSession,
+    sync_session_class=TrackedSession,
 )
 
 
-async def get_db() -> AsyncSession:
-    """Get database session."""
-    async with async_session() as session:
-        return session
+async def get_db(bind: AsyncEngine | None = None) -> AsyncSession:
+    """
+    Get database session.
+
+    :param bind: Engine of the session, the primary engine by default.
+    :return: Database session.
+    """
+    if bind is None:
+        return async_session()
+    return async_session(bind=bind)
+
+
+class ReplicaRouter:
+    """
+    Selector of read replica engines.
+
+    Replicas are selected round-robin or by the least number of checked
+    out connections. A replica marked unhealthy is skipped for
+    ``retry_seconds``. Clients which wrote to the primary within
+    ``read_your_writes_seconds`` read from the primary too, so they do
+    not miss their writes because of replication lag.
+    """
+
+    def __init__(
+        self,
+        engines: list[AsyncEngine],
+        strategy: Literal['round_robin', 'least_connections'] = (
+            'round_robin'
+        ),
+        read_your_writes_seconds: float = 5,
+        retry_seconds: float = 30,
+    ):
+        self.engines = engines
+        self.strategy = strategy
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.retry_seconds = retry_seconds
+
+        self._counter = itertools.count()
+        self._unhealthy: dict[AsyncEngine, float] = {}
+        self._writes: dict[str, float] = {}
+        self._stats = {'replica': 0, 'primary': 0, 'failures': 0}
+
+    @staticmethod
+    def _get_key(consistency_key: str | None) -> str:
+        if consistency_key is None:
+            return ''
+        return hashlib.blake2b(
+            consistency_key.encode(), digest_size=16
+        ).hexdigest()
+
+    def record_write(self, consistency_key: str | None = None) -> None:
+        """
+        Start read-your-writes window of a client.
+
+        :param consistency_key: Client key, such as its token.
+        """
+        now = time.monotonic()
+        if len(self._writes) >= 10000:
+            self._writes = {
+                key: written_at
+                for key, written_at in self._writes.items()
+                if now - written_at < self.read_your_writes_seconds
+            }
+        self._writes[self._get_key(consistency_key)] = now
+
+    def mark_unhealthy(self, replica: AsyncEngine) -> None:
+        """Skip replica for ``retry_seconds``."""
+        self._unhealthy[replica] = time.monotonic() + self.retry_seconds
+        self._stats['failures'] += 1
+
+    def get_engine(
+        self, consistency_key: str | None = None
+    ) -> AsyncEngine | None:
+        """
+        Select replica for a read-only unit of work.
+
+        :param consistency_key: Client key, such as its token.
+        :return: Replica engine or None to read from the primary.
+        """
+        now = time.monotonic()
+        written_at = self._writes.get(self._get_key(consistency_key))
+        if (
+            written_at is not None
+            and now - written_at < self.read_your_writes_seconds
+        ):
+            self._stats['primary'] += 1
+            return None
+
+        healthy = [
+            replica
+            for replica in self.engines
+            if self._unhealthy.get(replica, 0) <= now
+        ]
+        if not healthy:
+            self._stats['primary'] += 1
+            return None
+        self._stats['replica'] += 1
+        if self.strategy == 'least_connections':
+            return min(
+                healthy,
+                key=lambda replica: replica.pool.checkedout(),  # type: ignore
+            )
+        return healthy[next(self._counter) % len(healthy)]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get replica health and routing counters."""
+        now = time.monotonic()
+        return {
+            'replicas': len(self.engines),
+            'unhealthy': sum(
+                until > now for until in self._unhealthy.values()
+            ),
+            'strategy': self.strategy,
+            **self._stats,
+        }
+
+
+replica_router = ReplicaRouter(
+    [create_engine(url) for url in settings.POSTGRES_REPLICA_URLS],
+    strategy=settings.POSTGRES_REPLICA_STRATEGY,
+    read_your_writes_seconds=settings.POSTGRES_READ_YOUR_WRITES_SECONDS,
+    retry_seconds=settings.POSTGRES_REPLICA_RETRY_SECONDS,
+)
+
+
+def get_db_pool_stats() -> dict[str, Any]:
+    """Get pool statistics of the primary and replica engines."""
+    return {
+        'primary': engine.pool.get_stats(),  # type: ignore
+        'replicas': [
+            replica.pool.get_stats()  # type: ignore
+            for replica in replica_router.engines
+        ],
+    }
+
+
+async def close_db() -> None:
+    """Close connections of the primary and replica engines."""
+    await engine.dispose()
+    for replica in replica_router.engines:
+        await replica.dispose()
@@ -1,12 +1,10 @@
 """Dependencies module."""
 
-import uuid
-from typing import Annotated, Dict, Any
+from typing import Annotated, Any, AsyncIterator, Dict
 
-from fastapi import Depends
+from fastapi import Depends, Request
 
 from app.core.auth_bearer import JWTBearer
-from app.core.security import decode_token
 from app.exceptions import (
     ForbiddenError,
     UnauthorizedError,
@@ -14,23 +12,33 @@ from app.exceptions import (
     InvalidTokenError,
     InvalidTokenTypeError,
 )
-from app.models.role_models import UserRole
-from app.models.user_models import User
-from app.services import UserService, TokenService, RoleService
+from app.models.user_models import Principal
+from app.services import UserService, TokenService
 from app.uow.database import SQLAlchemyUOW, IDatabaseUnitOfWork
-from app.uow.inmemory import IInMemoryUnitOfWork, RedisUOW
+from app.uow.inmemory import IInMemoryUnitOfWork, create_inmemory_uow
 from app.utils.enums import Role, TokenType
 
 
 # UOW Section
-def create_db_uow() -> IDatabaseUnitOfWork:
-    """Create and initialize Unit Of Work instance."""
-    return SQLAlchemyUOW()
-
+async def create_db_uow(
+    request: Request,
+) -> AsyncIterator[IDatabaseUnitOfWork]:
+    """
+    Create request-scoped Unit Of Work instance.
 
-def create_inmemory_uow() -> IInMemoryUnitOfWork:
-    """Create and initialize InMemory Unit Of Work instance."""
-    return RedisUOW()
+    Services of the request share one transaction,
+    committed once after the endpoint returns. ``GET`` and ``HEAD``
+    requests are read-only and may be served by a replica. The session
+    is opened by the first service, so requests served from caches
+    do not touch the database.
+    """
+    uow = SQLAlchemyUOW(
+        read_only=request.method in ('GET', 'HEAD'),
+        consistency_key=request.headers.get('Authorization'),
+        lazy=True,
+    )
+    async with uow:
+        yield uow
 
 
 DBDep = Depends(create_db_uow)
@@ -42,20 +50,25 @@ InMemoryAnnotation = Annotated[IInMemoryUnitOfWork, InMemoryDep]
 
 # Authentication Section
 async def get_current_token_payload(
-    inmemory: InMemoryAnnotation, token: str = Depends(JWTBearer())
+    request: Request,
+    inmemory: InMemoryAnnotation,
+    _: str = Depends(JWTBearer()),
 ):
     """
     Check token and get token payload.
 
+    Token state with the role version of the user is kept
+    in ``request.state.token_state``.
+
+    :param request: Request object with token payload decoded by bearer.
     :param inmemory: In-memory Unit of Work instance.
-    :param token: JWT Token.
     :return: Token payload.
     """
-    payload = decode_token(token)
-    token_id = uuid.UUID(payload['jti'])
-    in_blacklist = await TokenService.check_blacklist_token(inmemory, token_id)
-    if in_blacklist:
+    payload = request.state.token_payload
+    state = await TokenService.get_token_state(inmemory, payload)
+    if TokenService.is_revoked_token(payload, state):
         raise InvalidTokenError
+    request.state.token_state = state
     return payload
 
 
@@ -64,66 +77,101 @@ TokenAnnotation = Annotated[Dict[str, Any], TokenDep]
 
 
 async def __get_current_user(
-    uow: DBAnnotation, payload: Dict[str, Any], by_token: TokenType
-) -> User:
-    """Get current user."""
+    request: Request, payload: Dict[str, Any], by_token: TokenType
+) -> Principal:
+    """
+    Get current user.
+
+    Principals missing in the cache are read from the primary,
+    a lagging replica could cache roles which were just changed.
+    """
     if payload is None:
         raise UnauthorizedError
     if payload['type'] != by_token.value:
         raise InvalidTokenTypeError
     try:
-        user = await UserService.get_user_by_id(uow, payload['user_id'])
-        return user
+        user = await UserService.get_principal(
+            SQLAlchemyUOW(),
+            payload['user_id'],
+            request.state.token_state.role_version,
+        )
     except NoResultError:
         raise UnauthorizedError
+    if not user.is_active:
+        raise UnauthorizedError
+    return user
 
 
 async def get_current_user(
-    uow: DBAnnotation, payload: TokenAnnotation
-) -> User:
+    request: Request, payload: TokenAnnotation
+) -> Principal:
     """
     Get current user.
 
-    :param uow: Unit Of Work instance.
+    :param request: Request object with token state.
     :param payload: Token payload.
-    :return: Current active user.
+    :return: Principal of current active user.
     """
-    return await __get_current_user(uow, payload, TokenType.ACCESS)
+    return await __get_current_user(request, payload, TokenType.ACCESS)
 
 
 async def get_current_user_by_refresh(
-    uow: DBAnnotation, payload: TokenAnnotation
-) -> User:
+    request: Request, payload: TokenAnnotation
+) -> Principal:
     """
     Get current user by refresh token.
 
-    :param uow: Unit Of Work instance.
+    :param request: Request object with token state.
     :param payload: Token payload.
-    :return: Current active user.
+    :return: Principal of current active user.
     """
-    return await __get_current_user(uow, payload, TokenType.REFRESH)
+    return await __get_current_user(request, payload, TokenType.REFRESH)
 
 
 UserDep = Depends(get_current_user)
-UserAnnotation = Annotated[User, UserDep]
+UserAnnotation = Annotated[Principal, UserDep]
 
 UserRefreshDep = Depends(get_current_user_by_refresh)
-UserRefreshAnnotation = Annotated[User, UserRefreshDep]
+UserRefreshAnnotation = Annotated[Principal, UserRefreshDep]
 
 
-async def get_current_admin(uow: DBAnnotation, user: UserAnnotation) -> User:
+async def get_current_roles(
+    request: Request, payload: TokenAnnotation
+) -> list[Role]:
     """
-    Get current admin user.
+    Get active roles of current user.
+
+    Roles claimed by the access token are trusted while the role
+    version of the user is unchanged, otherwise roles of the principal
+    are used.
 
-    :param uow: Unit of work instance.
-    :param user: User instance from dependency.
-    :return: Current active admin user.
+    :param request: Request object with token state.
+    :param payload: Token payload.
+    :return: Active roles of current user.
+    """
+    if payload['type'] != TokenType.ACCESS.value:
+        raise InvalidTokenTypeError
+    roles = TokenService.get_token_roles(payload, request.state.token_state)
+    if roles is not None:
+        return roles
+    user = await __get_current_user(request, payload, TokenType.ACCESS)
+    return user.roles
+
+
+RolesDep = Depends(get_current_roles)
+RolesAnnotation = Annotated[list[Role], RolesDep]
+
+
+async def get_current_admin(roles: RolesAnnotation) -> list[Role]:
+    """
+    Check that current user is admin.
+
+    :param roles: Active roles of current user from dependency.
+    :return: Active roles of current admin user.
     """
-    user_roles: list[UserRole] = await RoleService.get_roles(uow, user.id_)
-    roles = [role.role for role in user_roles]
     if Role.ADMIN not in roles:
         raise ForbiddenError
-    return user
+    return roles
 
 
 AdminDep = Depends(get_current_admin)
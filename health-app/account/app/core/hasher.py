@@ -0,0 +1,171 @@
+"""Module for hashing passwords outside the event loop."""
+
+import asyncio
+import time
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Any, Callable, Literal
+
+from app.core.security import get_hashed_password, verify_password
+from app.core.settings import settings
+from app.exceptions import OverloadedError
+
+
+def _timed(func: Callable, *args) -> tuple[Any, float]:
+    """Call function in a worker and measure its execution time."""
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+class OperationStats:
+    """Timing statistics of one hashing operation."""
+
+    def __init__(self):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.work_seconds = 0.0
+
+    def observe(self, elapsed: float, work: float) -> None:
+        self.calls += 1
+        self.total_seconds += elapsed
+        self.work_seconds += work
+        self.max_seconds = max(self.max_seconds, elapsed)
+
+    def as_dict(self) -> dict[str, int | float]:
+        calls = self.calls or 1
+        return {
+            'calls': self.calls,
+            'avg_seconds': self.total_seconds / calls,
+            'avg_wait_seconds': (self.total_seconds - self.work_seconds)
+            / calls,
+            'max_seconds': self.max_seconds,
+        }
+
+
+class PasswordHasher:
+    """
+    Password hasher running bcrypt in a bounded worker pool.
+
+    Up to ``workers`` calls run at the same time and up to ``queue_size``
+    more wait for a free worker, other calls are rejected with
+    :class:`OverloadedError`. Batches of :meth:`hash_many` leave a
+    worker free for other calls.
+    """
+
+    def __init__(
+        self,
+        executor: Literal['thread', 'process'] = 'thread',
+        workers: int = 4,
+        queue_size: int = 64,
+    ):
+        self.executor_type = executor
+        self.workers = workers
+        self.queue_size = queue_size
+
+        self._executor: Executor | None = None
+        self._batch_slots = asyncio.Semaphore(max(1, workers - 1))
+        self._pending = 0
+        self._rejected = 0
+        self._stats = {'hash': OperationStats(), 'verify': OperationStats()}
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == 'process':
+                self._executor = ProcessPoolExecutor(self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    self.workers, thread_name_prefix='password-hasher'
+                )
+        return self._executor
+
+    async def _run(self, operation: str, func: Callable, *args) -> Any:
+        if self._pending >= self.workers + self.queue_size:
+            self._rejected += 1
+            raise OverloadedError
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            started = time.perf_counter()
+            result, work = await loop.run_in_executor(
+                self.executor, _timed, func, *args
+            )
+            self._stats[operation].observe(time.perf_counter() - started, work)
+            return result
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash password in the worker pool.
+
+        :param password: Plaintext password.
+        :return: Hashed password.
+        """
+        return await self._run('hash', get_hashed_password, password)
+
+    async def _hash_in_batch(self, password: str) -> str:
+        async with self._batch_slots:
+            return await self.hash(password)
+
+    async def hash_many(self, passwords: list[str]) -> list[str]:
+        """
+        Hash passwords of a batch in the worker pool.
+
+        Every password is a separate call and batches take up to
+        ``workers - 1`` workers together, so verification of sign-ins
+        is not queued behind a batch and is admitted against its load.
+
+        :param passwords: Plaintext passwords.
+        :return: Hashed passwords in the same order.
+        """
+        tasks = [
+            asyncio.ensure_future(self._hash_in_batch(password))
+            for password in passwords
+        ]
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify password against hashed password in the worker pool.
+
+        :param plain_password: Plaintext password.
+        :param hashed_password: Hashed password.
+        :return: Verified password or not.
+        """
+        return await self._run(
+            'verify', verify_password, plain_password, hashed_password
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pool utilisation and timing statistics."""
+        return {
+            'executor': self.executor_type,
+            'workers': self.workers,
+            'queue_size': self.queue_size,
+            'pending': self._pending,
+            'rejected': self._rejected,
+            **{name: stats.as_dict() for name, stats in self._stats.items()},
+        }
+
+    def shutdown(self) -> None:
+        """Shutdown the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    executor=settings.PASSWORD_HASHER_EXECUTOR,
+    workers=settings.PASSWORD_HASHER_WORKERS,
+    queue_size=settings.PASSWORD_HASHER_QUEUE_SIZE,
+)
@@ -0,0 +1,118 @@
+"""Module for JWT signing and verification keys."""
+
+import hashlib
+from pathlib import Path
+from typing import Any
+
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    PublicFormat,
+)
+from jwt.algorithms import get_default_algorithms
+
+from app.core.settings import Settings, settings
+
+
+class KeySet:
+    """
+    Set of keys for JWT tokens.
+
+    Tokens are signed with one key and verified with any key of the set,
+    selected by the ``kid`` token header, so old keys can stay in the set
+    while tokens signed by them are still alive. Public keys of asymmetric
+    algorithms are published as JWKS.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        signing_key: Any,
+        signing_key_id: str | None = None,
+        verification_keys: dict[str | None, Any] | None = None,
+    ):
+        self.algorithm = algorithm
+        self.signing_key = signing_key
+        self.signing_key_id = signing_key_id
+        self.verification_keys = verification_keys or {}
+
+        self.__jwks: dict[str, list[dict[str, Any]]] | None = None
+
+    @property
+    def is_symmetric(self) -> bool:
+        return self.algorithm.startswith('HS')
+
+    @staticmethod
+    def _get_key_id(public_key: Any) -> str:
+        der = public_key.public_bytes(
+            Encoding.DER, PublicFormat.SubjectPublicKeyInfo
+        )
+        return hashlib.sha256(der).hexdigest()[:16]
+
+    @classmethod
+    def from_settings(cls, config: Settings) -> 'KeySet':
+        """Load key set from settings."""
+        if config.JWT_ALGORITHM.startswith('HS'):
+            return cls(
+                config.JWT_ALGORITHM,
+                config.SECRET_KEY,
+                config.JWT_KEY_ID,
+                {config.JWT_KEY_ID: config.SECRET_KEY},
+            )
+
+        if config.JWT_PRIVATE_KEY_FILE is None:
+            raise ValueError(
+                f'JWT_PRIVATE_KEY_FILE is required for {config.JWT_ALGORITHM}'
+            )
+        algorithm = get_default_algorithms()[config.JWT_ALGORITHM]
+
+        def load(path: Path) -> Any:
+            return algorithm.prepare_key(path.read_bytes())
+
+        signing_key = load(config.JWT_PRIVATE_KEY_FILE)
+        public_key = signing_key.public_key()
+        signing_key_id = config.JWT_KEY_ID or cls._get_key_id(public_key)
+
+        verification_keys = {
+            key_id: load(path)
+            for key_id, path in config.JWT_PUBLIC_KEY_FILES.items()
+        }
+        verification_keys[signing_key_id] = public_key
+        return cls(
+            config.JWT_ALGORITHM,
+            signing_key,
+            signing_key_id,
+            verification_keys,
+        )
+
+    def get_headers(self) -> dict[str, str] | None:
+        """Get JWT headers for signed tokens."""
+        if self.signing_key_id is None:
+            return None
+        return {'kid': self.signing_key_id}
+
+    def get_verification_key(self, key_id: str | None) -> Any | None:
+        """
+        Get key for token verification.
+
+        :param key_id: ``kid`` header of the token.
+        :return: Verification key or None if key is unknown.
+        """
+        if key_id is None:
+            key_id = self.signing_key_id
+        return self.verification_keys.get(key_id)
+
+    def get_jwks(self) -> dict[str, list[dict[str, Any]]]:
+        """Get public keys as JSON Web Key Set."""
+        if self.__jwks is None:
+            keys = []
+            if not self.is_symmetric:
+                algorithm = get_default_algorithms()[self.algorithm]
+                for key_id, key in self.verification_keys.items():
+                    jwk = algorithm.to_jwk(key, as_dict=True)
+                    jwk.update(kid=key_id, alg=self.algorithm, use='sig')
+                    keys.append(jwk)
+            self.__jwks = {'keys': keys}
+        return self.__jwks
+
+
+key_set = KeySet.from_settings(settings)
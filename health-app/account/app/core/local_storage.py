@@ -0,0 +1,169 @@
+"""Module for in-process key-value storage."""
+
+import datetime
+import fnmatch
+import sys
+import time
+from collections import OrderedDict
+from typing import Iterator
+
+from app.core.settings import settings
+
+
+class LocalStorage:
+    """
+    Bounded LRU storage of strings with Redis-like expiry.
+
+    Expired keys are dropped on access and by :meth:`purge`, least
+    recently used keys are evicted once ``max_size`` is reached.
+    Keys written with ``evictable=False``, such as revocation state,
+    are never evicted and are kept until they expire. Their expired keys
+    are purged whenever their number doubles.
+    """
+
+    def __init__(self, max_size: int = 1_000_000):
+        self.max_size = max_size
+
+        self._values: OrderedDict[str, tuple[str, float | None]] = (
+            OrderedDict()
+        )
+        self._pinned: dict[str, tuple[str, float | None]] = {}
+        self._pinned_purge_size = max_size
+        self._evictions = 0
+
+    @staticmethod
+    def _get_expires_at(
+        ex: int | datetime.timedelta | None = None,
+        exat: int | datetime.datetime | None = None,
+    ) -> float | None:
+        if isinstance(ex, datetime.timedelta):
+            ex = ex.total_seconds()
+        if isinstance(exat, datetime.datetime):
+            exat = exat.timestamp()
+        if ex is not None:
+            return time.time() + ex
+        return exat
+
+    def _get_item(self, key: str) -> tuple[str, float | None] | None:
+        values = self._pinned if key in self._pinned else self._values
+        item = values.get(key)
+        if item is None:
+            return None
+        if item[1] is not None and item[1] <= time.time():
+            del values[key]
+            return None
+        if values is self._values:
+            self._values.move_to_end(key)
+        return item
+
+    def get(self, key: str) -> str | None:
+        item = self._get_item(key)
+        return item[0] if item is not None else None
+
+    def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.get(key) for key in keys]
+
+    def set(
+        self,
+        key: str,
+        value: str,
+        ex: int | datetime.timedelta | None = None,
+        exat: int | datetime.datetime | None = None,
+        keepttl: bool = False,
+        evictable: bool = True,
+    ) -> None:
+        expires_at = self._get_expires_at(ex, exat)
+        if keepttl and (item := self._get_item(key)) is not None:
+            expires_at = item[1]
+        if not evictable or key in self._pinned:
+            self._values.pop(key, None)
+            self._pinned[key] = (value, expires_at)
+            if len(self._pinned) >= self._pinned_purge_size:
+                self._purge(self._pinned)
+                self._pinned_purge_size = max(
+                    self.max_size, 2 * len(self._pinned)
+                )
+            return
+        self._values[key] = (value, expires_at)
+        self._values.move_to_end(key)
+        while len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+            self._evictions += 1
+
+    def incr(self, key: str, evictable: bool = True) -> int:
+        item = self._get_item(key)
+        value = int(item[0]) + 1 if item is not None else 1
+        self.set(key, str(value), keepttl=True, evictable=evictable)
+        return value
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._values.pop(key, None)
+            self._pinned.pop(key, None)
+
+    def ttl(self, key: str) -> int:
+        """Get key TTL in seconds, ``-1`` without TTL, ``-2`` if missing."""
+        item = self._get_item(key)
+        if item is None:
+            return -2
+        if item[1] is None:
+            return -1
+        return max(0, round(item[1] - time.time()))
+
+    def expire(self, key: str, ex: int | datetime.timedelta) -> None:
+        item = self._get_item(key)
+        if item is not None:
+            values = self._pinned if key in self._pinned else self._values
+            values[key] = (item[0], self._get_expires_at(ex))
+
+    def scan_iter(self, match: str = '*') -> Iterator[str]:
+        now = time.time()
+        items = [*self._values.items(), *self._pinned.items()]
+        for key, (_, expires_at) in items:
+            if expires_at is not None and expires_at <= now:
+                continue
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def memory_usage(self, key: str) -> int | None:
+        item = self._get_item(key)
+        if item is None:
+            return None
+        return sys.getsizeof(key) + sys.getsizeof(item[0])
+
+    @staticmethod
+    def _purge(values: dict[str, tuple[str, float | None]]) -> int:
+        now = time.time()
+        expired = [
+            key
+            for key, (_, expires_at) in values.items()
+            if expires_at is not None and expires_at <= now
+        ]
+        for key in expired:
+            del values[key]
+        return len(expired)
+
+    def purge(self) -> int:
+        """Remove expired keys and get their number."""
+        return self._purge(self._values) + self._purge(self._pinned)
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._pinned.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get storage size and eviction counter."""
+        return {
+            'size': len(self._values) + len(self._pinned),
+            'pinned': len(self._pinned),
+            'max_size': self.max_size,
+            'evictions': self._evictions,
+        }
+
+
+storage = LocalStorage(settings.INMEMORY_LOCAL_MAX_SIZE)
+
+
+def create_local_storage() -> LocalStorage:
+    """Get shared in-process storage."""
+    return storage
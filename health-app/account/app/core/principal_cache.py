@@ -0,0 +1,160 @@
+"""Module for caching authenticated principals."""
+
+import datetime
+import logging
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable
+
+from pydantic import ValidationError
+from redis.exceptions import RedisError
+
+from app.core.settings import settings
+from app.models.user_models import Principal
+from app.uow.inmemory import IInMemoryUnitOfWork, create_inmemory_uow
+
+
+class PrincipalCache:
+    """
+    Two-tier cache of authenticated principals.
+
+    Principals are kept in a bounded local LRU for ``local_ttl`` seconds
+    in front of in-memory storage, which shares them between workers for
+    ``ttl`` seconds. Invalidation removes both tiers of the current
+    process, local tiers of other workers expire after ``local_ttl``.
+
+    Principals keep the role version read before they were loaded.
+    Invalidation increments role versions of users, so principals loaded
+    before a change are stale in all workers, even if they are cached
+    after the invalidation.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        local_ttl: float = 5,
+        ttl: int = 300,
+        uow_factory: Callable[[], IInMemoryUnitOfWork] = create_inmemory_uow,
+    ):
+        self.max_size = max_size
+        self.local_ttl = local_ttl
+        self.ttl = ttl
+        self.uow_factory = uow_factory
+
+        self._principals: OrderedDict[int, tuple[Principal, float]] = (
+            OrderedDict()
+        )
+        self._local_hits = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def _get_local(
+        self, user_id: int, role_version: int = 0
+    ) -> Principal | None:
+        item = self._principals.get(user_id)
+        if item is None:
+            return None
+        if item[1] <= time.monotonic() or item[0].role_version < role_version:
+            del self._principals[user_id]
+            return None
+        self._principals.move_to_end(user_id)
+        return item[0]
+
+    def _add_local(self, principal: Principal) -> None:
+        if self.max_size <= 0 or self.local_ttl <= 0:
+            return
+        self._principals[principal.id_] = (
+            principal,
+            time.monotonic() + self.local_ttl,
+        )
+        self._principals.move_to_end(principal.id_)
+        while len(self._principals) > self.max_size:
+            self._principals.popitem(last=False)
+
+    async def get(
+        self, user_id: int, role_version: int = 0
+    ) -> Principal | None:
+        """
+        Get cached principal.
+
+        :param user_id: User id.
+        :param role_version: Current role version of user.
+        :return: Principal or None if user is not cached or stale.
+        """
+        principal = self._get_local(user_id, role_version)
+        if principal is not None:
+            self._local_hits += 1
+            return principal
+        if self.ttl > 0:
+            async with self.uow_factory() as uow:
+                try:
+                    principal = await uow.principal_repository.get_principal(
+                        user_id
+                    )
+                except ValidationError:
+                    principal = None
+        if principal is None or principal.role_version < role_version:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._add_local(principal)
+        return principal
+
+    async def add(self, principal: Principal) -> None:
+        """Cache principal loaded from the database."""
+        self._add_local(principal)
+        if self.ttl > 0:
+            async with self.uow_factory() as uow:
+                await uow.principal_repository.add_principal(
+                    principal, datetime.timedelta(seconds=self.ttl)
+                )
+
+    async def invalidate(self, user_ids: Iterable[int]) -> None:
+        """
+        Remove cached principals of users and increment their versions.
+
+        Roles claimed by current tokens of users are then checked
+        against their principals. Errors of in-memory storage are
+        logged, cached principals then expire after ``ttl`` and roles
+        claimed by tokens after the token lifetime.
+
+        :param user_ids: User ids.
+        """
+        user_ids = list(set(user_ids))
+        if not user_ids:
+            return
+        for user_id in user_ids:
+            self._principals.pop(user_id, None)
+        self._invalidations += len(user_ids)
+        try:
+            async with self.uow_factory() as uow:
+                if self.ttl > 0:
+                    await uow.principal_repository.remove_principals(user_ids)
+                await uow.token_state_repository.increment_role_versions(
+                    user_ids
+                )
+        except RedisError:
+            logging.exception('Principals %s are not invalidated', user_ids)
+
+    def clear(self) -> None:
+        """Remove all locally cached principals."""
+        self._principals.clear()
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Get local cache size and hit/miss counters."""
+        return {
+            'size': len(self._principals),
+            'max_size': self.max_size,
+            'local_hits': self._local_hits,
+            'hits': self._hits,
+            'misses': self._misses,
+            'invalidations': self._invalidations,
+        }
+
+
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_SIZE,
+    local_ttl=settings.PRINCIPAL_CACHE_LOCAL_SECONDS,
+    ttl=settings.PRINCIPAL_CACHE_SECONDS,
+)
@@ -1,12 +1,31 @@
 """Module for manage redis connection."""
 
-from redis.asyncio import ConnectionPool, Redis
+from redis.asyncio import BlockingConnectionPool, Redis
 
 from app.core.settings import settings
 
-pool = ConnectionPool.from_url(settings.REDIS_URL)
+pool = BlockingConnectionPool.from_url(
+    settings.REDIS_URL,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    timeout=settings.REDIS_POOL_TIMEOUT,
+)
+client = Redis(connection_pool=pool)
 
 
-def create_redis():
-    """Create redis connection instance."""
-    return Redis(connection_pool=pool)
+def create_redis() -> Redis:
+    """Get shared redis client."""
+    return client
+
+
+async def close_redis() -> None:
+    """Close connections of shared redis client."""
+    await pool.disconnect()
+
+
+def get_pool_stats() -> dict[str, int]:
+    """Get connection pool utilisation."""
+    return {
+        'max_connections': pool.max_connections,
+        'in_use': len(pool._in_use_connections),
+        'available': len(pool._available_connections),
+    }
@@ -2,16 +2,18 @@
 
 import datetime
 import logging
+import time
 import uuid
 from typing import Any
 
 import jwt
 from passlib.context import CryptContext
 
-from app.core.settings import settings
+from app.core.keys import key_set
+from app.core.token_cache import token_cache
 from app.exceptions import InvalidTokenError
 from app.utils.datetime import get_access_expires, get_now
-from app.utils.enums import TokenType
+from app.utils.enums import Role, TokenStatus, TokenType
 
 # PASSWORD ENCRYPTION
 context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -71,30 +73,73 @@ def encode_token(
         'jti': jti,
     }
     token = jwt.encode(
-        payload, key=settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM
+        payload,
+        key=key_set.signing_key,
+        algorithm=key_set.algorithm,
+        headers=key_set.get_headers(),
     )
     return token
 
 
+def _decode_token(
+    token: str, verify_signature: bool = True, verify_exp: bool = True
+) -> dict[str, Any]:
+    try:
+        key = None
+        if verify_signature:
+            key_id = jwt.get_unverified_header(token).get('kid')
+            key = key_set.get_verification_key(key_id)
+            if key is None:
+                raise jwt.InvalidSignatureError(f'Unknown key id {key_id}')
+        return jwt.decode(
+            token,
+            key=key,
+            algorithms=[key_set.algorithm],
+            options={
+                'verify_signature': verify_signature,
+                'verify_exp': verify_exp,
+            },
+        )
+    except jwt.InvalidTokenError as e:
+        logging.error(str(e))
+        raise InvalidTokenError
+
+
 def decode_token(token: str, verify: bool = True) -> dict[str, Any]:
     """
     Decode JWT token.
 
+    Verified payloads are cached until the token expires,
+    so a token is verified only once.
+
     :param token: JWT token.
     :param verify: Need to verify token.
     :return: Token payload.
     """
-    try:
-        data = jwt.decode(
-            token,
-            key=settings.SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
-            verify=verify,
-        )
-        return data
-    except jwt.InvalidTokenError as e:
-        logging.error(str(e))
-        raise InvalidTokenError
+    if not verify:
+        return _decode_token(token, verify_signature=False, verify_exp=False)
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = _decode_token(token)
+        token_cache.add(token, payload)
+    return payload
+
+
+def introspect_token(token: str) -> tuple[dict[str, Any], TokenStatus]:
+    """
+    Decode JWT token with verified signature and get its status.
+
+    :param token: JWT token.
+    :return: Token payload and status (active or expired).
+    """
+    payload = token_cache.get(token)
+    if payload is not None:
+        return payload, TokenStatus.ACTIVE
+    payload = _decode_token(token, verify_exp=False)
+    if payload['exp'] <= time.time():
+        return payload, TokenStatus.EXPIRED
+    token_cache.add(token, payload)
+    return payload, TokenStatus.ACTIVE
 
 
 def verify_token(token: str) -> bool:
@@ -102,12 +147,12 @@ def verify_token(token: str) -> bool:
     Verify JWT token.
 
     :param token: JWT token.
-    :return:
+    :return: Token is valid or not.
     """
     try:
         decode_token(token)
         return True
-    except jwt.InvalidTokenError:
+    except InvalidTokenError:
         return False
 
 
@@ -117,6 +162,9 @@ def create_access_token(
     jti: str | uuid.UUID = None,
     expires_in: datetime.timedelta = None,
     now: datetime.datetime = None,
+    epoch: int = 0,
+    roles: list[Role] | None = None,
+    role_version: int = 0,
 ) -> str:
     """
     Create JWT access token.
@@ -126,8 +174,17 @@ def create_access_token(
     :param jti: Token identifier (UUID4 by default).
     :param expires_in: Expiration time.
     :param now: Current time in UTC without timezone.
+    :param epoch: Revocation epoch of the user.
+    :param roles: Active roles of the user, not embedded by default.
+    :param role_version: Role version of the user read before its roles.
     :return: JWT access token.
     """
+    claims = {}
+    if roles is not None:
+        claims = {
+            'roles': [Role(role).value for role in roles],
+            'role_version': role_version,
+        }
     return encode_token(
         sub=username,
         user_id=user_id,
@@ -135,6 +192,8 @@ def create_access_token(
         jti=jti,
         expires_in=expires_in,
         now=now,
+        epoch=epoch,
+        **claims,
     )
 
 
@@ -144,6 +203,7 @@ def create_refresh_token(
     jti: str | uuid.UUID = None,
     expires_in: datetime.timedelta = None,
     now: datetime.datetime = None,
+    epoch: int = 0,
 ) -> str:
     """
     Create JWT refresh token.
@@ -153,6 +213,7 @@ def create_refresh_token(
     :param jti: Token identifier (UUID4 by default).
     :param expires_in: Expiration time.
     :param now: Current time in UTC without timezone.
+    :param epoch: Revocation epoch of the user.
     :return: JWT refresh token.
     """
     return encode_token(
@@ -162,4 +223,5 @@ def create_refresh_token(
         jti=jti,
         expires_in=expires_in,
         now=now,
+        epoch=epoch,
     )
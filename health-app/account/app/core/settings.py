@@ -2,6 +2,7 @@ import datetime
 import secrets
 from enum import Enum
 from pathlib import Path
+from typing import Literal
 from urllib.parse import urlencode
 
 from pydantic import AnyHttpUrl, computed_field, field_validator
@@ -51,6 +52,23 @@ class Settings(BaseSettings):
             f'{self.POSTGRES_ARGUMENTS_URL}'
         )
 
+    POSTGRES_ECHO: bool | None = None
+    POSTGRES_POOL_SIZE: int | None = None
+    POSTGRES_MAX_OVERFLOW: int | None = None
+    POSTGRES_POOL_TIMEOUT: float | None = None
+    POSTGRES_POOL_RECYCLE: int | None = None
+    POSTGRES_POOL_PRE_PING: bool | None = None
+    POSTGRES_STATEMENT_CACHE_SIZE: int | None = None
+    POSTGRES_COMPILED_CACHE_SIZE: int | None = None
+    POSTGRES_PGBOUNCER: bool = False
+    POSTGRES_FAST_PATH: bool = False
+    POSTGRES_REPLICA_URLS: list[str] = []
+    POSTGRES_REPLICA_STRATEGY: Literal['round_robin', 'least_connections'] = (
+        'round_robin'
+    )
+    POSTGRES_READ_YOUR_WRITES_SECONDS: float = 5
+    POSTGRES_REPLICA_RETRY_SECONDS: float = 30
+
     # KAFKA
     KAFKA_PROTOCOL: str = 'kafka'
     KAFKA_HOST: str
@@ -68,6 +86,8 @@ class Settings(BaseSettings):
     REDIS_USER: str
     REDIS_PASSWORD: str
     REDIS_DB: int = 0
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: float = 5
 
     @computed_field  # type: ignore
     @property
@@ -81,11 +101,32 @@ class Settings(BaseSettings):
             f'{self.REDIS_DB}?'
         )
 
+    # IN-MEMORY STORAGE
+    INMEMORY_BACKEND: Literal['redis', 'local'] = 'redis'
+    INMEMORY_LOCAL_MAX_SIZE: int = 1_000_000
+
+    # BLACKLIST FILTER
+    BLACKLIST_FILTER_ENABLED: bool = True
+    BLACKLIST_FILTER_CAPACITY: int = 1_000_000
+    BLACKLIST_FILTER_ERROR_RATE: float = 0.001
+    BLACKLIST_FILTER_REBUILD_SECONDS: int = 3600
+
+    # PRINCIPAL CACHE
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_LOCAL_SECONDS: float = 5
+    PRINCIPAL_CACHE_SECONDS: int = 300
+
     # SECURITY
     JWT_ALGORITHM: str = 'HS256'
+    JWT_KEY_ID: str | None = None
+    JWT_PRIVATE_KEY_FILE: Path | None = None
+    JWT_PUBLIC_KEY_FILES: dict[str, Path] = {}
+    JWKS_CACHE_MAX_AGE: int = 3600
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    ACCESS_TOKEN_ROLES: bool = True
     REFRESH_TOKEN_EXPIRE_DAYS: int = 180
     SECRET_KEY: str = secrets.token_urlsafe(32)
+    TOKEN_CACHE_SIZE: int = 10000
     BACKEND_CORS_ORIGINS: list[str | AnyHttpUrl] = [
         '*',
     ]
@@ -100,6 +141,16 @@ class Settings(BaseSettings):
     def REFRESH_TOKEN_EXPIRE_TIMEDELTA(self) -> datetime.timedelta:
         return datetime.timedelta(days=self.REFRESH_TOKEN_EXPIRE_DAYS)
 
+    # PASSWORD HASHING
+    PASSWORD_HASHER_EXECUTOR: Literal['thread', 'process'] = 'thread'
+    PASSWORD_HASHER_WORKERS: int = 4
+    PASSWORD_HASHER_QUEUE_SIZE: int = 64
+
+    # USER IMPORT
+    USER_IMPORT_MAX_ROWS: int = 10000
+    USER_IMPORT_MAX_BYTES: int = 5 * 1024 * 1024
+    USER_IMPORT_BATCH_SIZE: int = 1000
+
     @field_validator('BACKEND_CORS_ORIGINS')
     @classmethod
     def assemble_backend_cors_origins(cls, v: str | list[str]):
@@ -0,0 +1,81 @@
+"""Module for caching verified JWT payloads."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.core.settings import settings
+
+
+class TokenCache:
+    """
+    Bounded LRU cache of verified token payloads.
+
+    Tokens are keyed by SHA-256 digest, so raw tokens are never kept
+    in memory, and entries are dropped once the token ``exp`` is reached.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+
+        self._payloads: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _get_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """
+        Get verified token payload.
+
+        :param token: JWT token.
+        :return: Copy of token payload or None if token is not cached.
+        """
+        if self.max_size <= 0:
+            return None
+        key = self._get_key(token)
+        payload = self._payloads.get(key)
+        if payload is None:
+            self._misses += 1
+            return None
+        if payload['exp'] <= time.time():
+            del self._payloads[key]
+            self._misses += 1
+            return None
+        self._payloads.move_to_end(key)
+        self._hits += 1
+        return payload.copy()
+
+    def add(self, token: str, payload: dict[str, Any]) -> None:
+        """
+        Add verified token payload.
+
+        :param token: JWT token.
+        :param payload: Verified token payload.
+        """
+        if self.max_size <= 0 or 'exp' not in payload:
+            return
+        key = self._get_key(token)
+        self._payloads[key] = payload.copy()
+        self._payloads.move_to_end(key)
+        while len(self._payloads) > self.max_size:
+            self._payloads.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached payloads."""
+        self._payloads.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache size and hit/miss counters."""
+        return {
+            'size': len(self._payloads),
+            'max_size': self.max_size,
+            'hits': self._hits,
+            'misses': self._misses,
+        }
+
+
+token_cache = TokenCache(settings.TOKEN_CACHE_SIZE)
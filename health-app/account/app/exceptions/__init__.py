@@ -1,23 +1,31 @@
 from .already_exists import AlreadyExistsError
 from .base import AppError
 from .forbidden import ForbiddenError
+from .import_file_too_large import ImportFileTooLargeError
 from .invalid_auth_code import InvalidAuthCodeError
 from .invalid_auth_scheme import InvalidAuthSchemeError
+from .invalid_cursor import InvalidCursorError
+from .invalid_import_file import InvalidImportFileError
 from .invalid_login import InvalidLoginError
 from .invalid_token import InvalidTokenError
 from .invalid_token_type import InvalidTokenTypeError
 from .no_result import NoResultError
+from .overloaded import OverloadedError
 from .unauthorized import UnauthorizedError
 
 __all__ = [
     'AppError',
     'AlreadyExistsError',
     'ForbiddenError',
+    'ImportFileTooLargeError',
     'InvalidAuthCodeError',
     'InvalidAuthSchemeError',
+    'InvalidCursorError',
+    'InvalidImportFileError',
     'InvalidLoginError',
     'InvalidTokenError',
     'InvalidTokenTypeError',
     'NoResultError',
+    'OverloadedError',
     'UnauthorizedError',
 ]
@@ -5,14 +5,18 @@ from fastapi.responses import JSONResponse
 
 from app.exceptions import (
     AlreadyExistsError,
+    ImportFileTooLargeError,
     InvalidAuthCodeError,
     InvalidAuthSchemeError,
+    InvalidCursorError,
+    InvalidImportFileError,
     InvalidLoginError,
     InvalidTokenError,
     NoResultError,
     UnauthorizedError,
     ForbiddenError,
     InvalidTokenTypeError,
+    OverloadedError,
 )
 
 
@@ -41,6 +45,12 @@ async def forbidden_error_handler(_: Request, __: ForbiddenError | Exception):
     return get_error_response(403, ['Forbidden'])
 
 
+async def import_file_too_large_error_handler(
+    _: Request, __: ImportFileTooLargeError | Exception
+):
+    return get_error_response(413, ["Import file is too large"])
+
+
 async def invalid_auth_code_error_handler(
     _: Request, __: InvalidAuthCodeError | Exception
 ):
@@ -53,6 +63,18 @@ async def invalid_auth_scheme_error_handler(
     return get_error_response(400, ["Invalid authentication scheme"])
 
 
+async def invalid_cursor_error_handler(
+    _: Request, __: InvalidCursorError | Exception
+):
+    return get_error_response(400, ["Invalid pagination cursor"])
+
+
+async def invalid_import_file_error_handler(
+    _: Request, __: InvalidImportFileError | Exception
+):
+    return get_error_response(400, ["Invalid import file"])
+
+
 async def invalid_login_error_handler(
     _: Request, __: InvalidLoginError | Exception
 ):
@@ -84,6 +106,12 @@ async def no_result_error_handler(_: Request, exc: NoResultError | Exception):
     return get_error_response(400, [f"{name} not found"])
 
 
+async def overloaded_error_handler(
+    _: Request, __: OverloadedError | Exception
+):
+    return get_error_response(503, ["Service is overloaded, try later"])
+
+
 async def unauthorized_error_handler(
     _: Request, __: UnauthorizedError | Exception
 ):
@@ -98,17 +126,25 @@ async def other_error_handler(_: Request, __: Exception):
 def add_exception_handlers(app: FastAPI):
     app.add_exception_handler(AlreadyExistsError, already_exists_error_handler)
     app.add_exception_handler(ForbiddenError, forbidden_error_handler)
+    app.add_exception_handler(
+        ImportFileTooLargeError, import_file_too_large_error_handler
+    )
     app.add_exception_handler(
         InvalidAuthCodeError, invalid_auth_code_error_handler
     )
     app.add_exception_handler(
         InvalidAuthSchemeError, invalid_auth_scheme_error_handler
     )
+    app.add_exception_handler(InvalidCursorError, invalid_cursor_error_handler)
+    app.add_exception_handler(
+        InvalidImportFileError, invalid_import_file_error_handler
+    )
     app.add_exception_handler(InvalidLoginError, invalid_login_error_handler)
     app.add_exception_handler(InvalidTokenError, invalid_token_error_handler)
     app.add_exception_handler(
         InvalidTokenTypeError, invalid_token_type_error_handler
     )
     app.add_exception_handler(NoResultError, no_result_error_handler)
+    app.add_exception_handler(OverloadedError, overloaded_error_handler)
     app.add_exception_handler(UnauthorizedError, unauthorized_error_handler)
     app.add_exception_handler(Exception, other_error_handler)
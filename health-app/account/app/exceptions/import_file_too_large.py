@@ -0,0 +1,7 @@
+from app.exceptions.invalid_import_file import InvalidImportFileError
+
+
+class ImportFileTooLargeError(InvalidImportFileError):
+    """Import file larger than the allowed size error."""
+
+    ...  # fmt: off
@@ -0,0 +1,7 @@
+from app.exceptions.base import AppError
+
+
+class InvalidCursorError(AppError):
+    """Invalid or foreign pagination cursor error."""
+
+    ...  # fmt: off
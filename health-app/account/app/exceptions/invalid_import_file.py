@@ -0,0 +1,7 @@
+from app.exceptions.base import AppError
+
+
+class InvalidImportFileError(AppError):
+    """Unreadable, unsupported or too large import file error."""
+
+    ...  # fmt: off
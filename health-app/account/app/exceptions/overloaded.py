@@ -0,0 +1,7 @@
+from app.exceptions.base import AppError
+
+
+class OverloadedError(AppError):
+    """Overloaded error, the request is shed instead of being queued."""
+
+    ...  # fmt: off
@@ -1,12 +1,39 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api import main_router
+from app.api import main_router, well_known_router
+from app.core.blacklist_filter import blacklist_filter
+from app.core.db import close_db
+from app.core.hasher import password_hasher
+from app.core.redis import close_redis
 from app.core.settings import settings
 from app.exceptions.handlers import add_exception_handlers
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """Start and stop application resources."""
+    tasks = []
+    if (
+        settings.BLACKLIST_FILTER_ENABLED
+        and settings.INMEMORY_BACKEND == 'redis'
+    ):
+        tasks.append(asyncio.create_task(blacklist_filter.run()))
+    yield
+    for task in tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    password_hasher.shutdown()
+    await close_redis()
+    await close_db()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,  # type: ignore
@@ -14,9 +41,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 app.include_router(main_router, prefix='/api')
+app.include_router(
+    well_known_router, prefix='/.well-known', tags=['Well-known']
+)
 
 add_exception_handlers(app)
 
@@ -0,0 +1,40 @@
+from typing import Any, NamedTuple
+
+from app.utils.enums import Role
+
+
+class RoleRecord(NamedTuple):
+    """Immutable user role row read without the ORM."""
+
+    id_: int
+    user_id: int
+    role: Role
+    is_active_: bool
+
+    @property
+    def is_active(self) -> bool:
+        return self.is_active_
+
+    def model_dump(self) -> dict[str, Any]:
+        return self._asdict()
+
+
+class UserRecord(NamedTuple):
+    """Immutable user row read without the ORM."""
+
+    id_: int
+    first_name: str
+    last_name: str
+    username: str
+    password: str
+    is_active_: bool
+    roles: tuple[RoleRecord, ...] = ()
+
+    @property
+    def is_active(self) -> bool:
+        return self.is_active_
+
+    def model_dump(self) -> dict[str, Any]:
+        data = self._asdict()
+        del data['roles']
+        return data
@@ -1,3 +1,4 @@
+from sqlalchemy import Index, text
 from sqlmodel import UniqueConstraint, Field, Relationship, Enum
 
 from app.models.base import BaseTableActiveModel
@@ -10,6 +11,12 @@ class UserRole(BaseTableActiveModel, table=True):
     __tablename__ = 'user_role'
     __table_args__ = (
         UniqueConstraint('user_id', 'role', name='user_id_role'),
+        Index(
+            'ix_user_role_active_role_user_id',
+            'role',
+            'user_id',
+            postgresql_where=text('is_active'),
+        ),
     )
 
     user_id: int | None = Field(
@@ -1,7 +1,9 @@
 from datetime import datetime
 
+from sqlmodel import Field
+
 from app.models.base import BaseModel
-from app.utils.enums import TokenStatus
+from app.utils.enums import Role, TokenStatus
 
 
 class Tokens(BaseModel):
@@ -21,4 +23,27 @@ class TokenPayload(BaseModel):
     iat: datetime
     exp: datetime
     type: str
+    epoch: int = 0
+    roles: list[Role] | None = None
+    role_version: int | None = None
     status: TokenStatus
+
+
+class InvalidTokenPayload(BaseModel):
+    """Status of the token which can not be decoded."""
+
+    status: TokenStatus = TokenStatus.INVALID
+
+
+class TokensIntrospection(BaseModel):
+    """Tokens for batch introspection."""
+
+    tokens: list[str] = Field(min_length=1, max_length=1000)
+
+
+class TokenState(BaseModel):
+    """Revocation state of the token."""
+
+    blacklisted: bool = False
+    epoch: int = 0
+    role_version: int = 0
@@ -1,7 +1,8 @@
 import re
-from typing import Self, List
+from typing import Literal, Self, List
 
 from pydantic import SecretStr, field_validator, model_validator
+from sqlalchemy import Index, literal_column
 from sqlmodel import Field, Relationship
 
 from app.models.base import BaseModel, BaseTableActiveModel, BaseTableModel
@@ -45,10 +46,49 @@ class UserModelWithRoles(UserModel):
     roles: List[Role]
 
 
+class Principal(BaseModel):
+    """Authenticated user with active roles."""
+
+    id_: int
+    username: str
+    first_name: str
+    last_name: str
+    is_active: bool = True
+    roles: List[Role] = []
+    role_version: int = 0
+
+
+class UserRoles(BaseModel):
+    """Active roles of a user."""
+
+    user_id: int
+    roles: List[Role]
+
+
+class UserRolesChange(BaseModel):
+    """Role change of many users model."""
+
+    user_ids: list[int] = Field(min_length=1, max_length=1000)
+    role: Role
+
+
 class User(BaseUser, BaseTableActiveModel, table=True):
     """User database model."""
 
     __tablename__ = 'users'
+    __table_args__ = (
+        Index('ix_users_first_name_id', 'first_name', 'id'),
+        Index('ix_users_last_name_id', 'last_name', 'id'),
+        # Trigram index of the full name, needs the pg_trgm extension
+        Index(
+            'ix_users_full_name_trgm',
+            literal_column("(first_name || ' ' || last_name)").label(
+                'full_name'
+            ),
+            postgresql_using='gin',
+            postgresql_ops={'full_name': 'gin_trgm_ops'},
+        ),
+    )
 
     password: str
 
@@ -109,6 +149,21 @@ class UserCreationWithRoles(UserCreation):
     roles: list[Role]
 
 
+class UserImportRowError(BaseModel):
+    """Rejected row of user import."""
+
+    row: int
+    username: str | None = Field(default=None)
+    errors: list[str]
+
+
+class UserImportResult(BaseModel):
+    """User import result model."""
+
+    created: int
+    errors: list[UserImportRowError]
+
+
 class UserUpdate(BaseModel):
     """User update model."""
 
@@ -148,7 +203,21 @@ class UserGet(BaseModel):
     count: int = Field(ge=1, le=100, default=100)
 
 
+class UserListGet(UserGet):
+    """User list get data model."""
+
+    count: int = Field(ge=0, le=100, default=100)
+    cursor: str | None = Field(default=None)
+    sort_by: Literal['id', 'username', 'first_name', 'last_name'] = Field(
+        default='id'
+    )
+    role: Role | None = Field(default=None)
+    is_active: bool | None = Field(default=True)
+
+
 class DoctorGet(UserGet):
     """Doctor get data model."""
 
     name_filter: str = Field(default='')
+    cursor: str | None = Field(default=None)
+    search: str | None = Field(default=None, min_length=1, max_length=100)
@@ -1,7 +1,23 @@
+from app.repositories.fast.role_repository import FastRoleRepository
+from app.repositories.fast.user_repository import FastUserRepository
 from app.repositories.redis.blacklist_token_repository import (
     BlacklistTokenRepository,
 )
+from app.repositories.redis.principal_repository import (
+    PrincipalRepository,
+)
+from app.repositories.redis.token_state_repository import (
+    TokenStateRepository,
+)
 from app.repositories.sqlalchemy.role_repository import RoleRepository
 from app.repositories.sqlalchemy.user_repository import UserRepository
 
-__all__ = ['RoleRepository', 'BlacklistTokenRepository', 'UserRepository']
+__all__ = [
+    'RoleRepository',
+    'BlacklistTokenRepository',
+    'FastRoleRepository',
+    'FastUserRepository',
+    'PrincipalRepository',
+    'TokenStateRepository',
+    'UserRepository',
+]
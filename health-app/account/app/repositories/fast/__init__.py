@@ -0,0 +1,4 @@
+from .role_repository import FastRoleRepository
+from .user_repository import FastUserRepository
+
+__all__ = ['FastRoleRepository', 'FastUserRepository']
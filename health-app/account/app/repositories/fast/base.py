@@ -0,0 +1,24 @@
+from typing import Any, Sequence
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class FastPathMixin:
+    """
+    Mixin of repositories running plain SQL through the driver.
+
+    Statements skip construction, compilation, ORM loading and the
+    identity map. asyncpg prepares them once per connection and reuses
+    them from its statement cache.
+    """
+
+    session: AsyncSession
+
+    async def _fetch_rows(self, sql: str, *params: Any) -> Sequence[Row]:
+        # Pending ORM changes are flushed as autoflush would do
+        if self.session.new or self.session.dirty or self.session.deleted:
+            await self.session.flush()
+        connection = await self.session.connection()
+        result = await connection.exec_driver_sql(sql, params)
+        return result.all()
@@ -0,0 +1,29 @@
+from abc import ABC
+
+from app.models.records import RoleRecord
+from app.repositories.fast.base import FastPathMixin
+from app.repositories.sqlalchemy.role_repository import RoleRepository
+from app.utils.enums import Role
+
+
+class FastRoleRepository(FastPathMixin, RoleRepository, ABC):
+    """
+    Role repository with a plain SQL lookup of roles of a user.
+
+    Lookups return immutable :class:`RoleRecord` instead of ``UserRole``,
+    other queries and writes are inherited from the ORM repository.
+    """
+
+    roles_sql = {
+        only_active: (
+            'SELECT id, user_id, role, is_active FROM user_role '
+            'WHERE user_id = $1' + (' AND is_active' if only_active else '')
+        )
+        for only_active in (True, False)
+    }
+
+    async def get_roles(self, user_id: int, only_active: bool = True):
+        rows = await self._fetch_rows(self.roles_sql[only_active], user_id)
+        return [
+            RoleRecord(row[0], row[1], Role[row[2]], row[3]) for row in rows
+        ]
@@ -0,0 +1,93 @@
+from abc import ABC
+
+from app.exceptions import NoResultError
+from app.models.records import RoleRecord, UserRecord
+from app.models.user_models import User
+from app.repositories.fast.base import FastPathMixin
+from app.repositories.sqlalchemy.user_repository import UserRepository
+from app.utils.enums import Role
+
+_USER_COLUMNS = (
+    'users.id, users.first_name, users.last_name, users.username, '
+    'users.password, users.is_active'
+)
+_ROLE_COLUMNS = (
+    'user_role.id, user_role.user_id, user_role.role, user_role.is_active'
+)
+_FILTERS = {'id_': 'users.id = $1', 'username': 'users.username = $1'}
+
+
+def _get_user_sql(column: str, only_active: bool) -> str:
+    sql = f'SELECT {_USER_COLUMNS} FROM users WHERE {_FILTERS[column]}'
+    if only_active:
+        sql += ' AND users.is_active'
+    return sql
+
+
+def _get_user_with_roles_sql(column: str, only_active: bool) -> str:
+    sql = (
+        f'SELECT {_USER_COLUMNS}, {_ROLE_COLUMNS} FROM users '
+        'LEFT OUTER JOIN user_role ON user_role.user_id = users.id '
+        f'AND user_role.is_active WHERE {_FILTERS[column]}'
+    )
+    if only_active:
+        sql += ' AND users.is_active'
+    return sql
+
+
+class FastUserRepository(FastPathMixin, UserRepository, ABC):
+    """
+    User repository with plain SQL lookups of a user by id or username.
+
+    Lookups return immutable :class:`UserRecord` instead of ``User``,
+    other queries and writes are inherited from the ORM repository.
+    """
+
+    user_sql = {
+        (column, only_active): _get_user_sql(column, only_active)
+        for column in _FILTERS
+        for only_active in (True, False)
+    }
+    user_with_roles_sql = {
+        (column, only_active): _get_user_with_roles_sql(column, only_active)
+        for column in _FILTERS
+        for only_active in (True, False)
+    }
+
+    @staticmethod
+    def _get_filter(data: dict) -> tuple[str, object] | None:
+        if len(data) != 1:
+            return None
+        [(column, value)] = data.items()
+        if column not in _FILTERS:
+            return None
+        return column, value
+
+    async def get_user(self, only_active: bool = True, **data):
+        lookup = self._get_filter(data)
+        if lookup is None:
+            return await super().get_user(only_active, **data)
+        column, value = lookup
+        rows = await self._fetch_rows(
+            self.user_sql[column, only_active], value
+        )
+        if not rows:
+            raise NoResultError(model=User)
+        return UserRecord._make(rows[0])
+
+    async def get_user_with_roles(self, only_active: bool = True, **data):
+        lookup = self._get_filter(data)
+        if lookup is None:
+            return await super().get_user_with_roles(only_active, **data)
+        column, value = lookup
+        rows = await self._fetch_rows(
+            self.user_with_roles_sql[column, only_active], value
+        )
+        if not rows:
+            raise NoResultError(model=User)
+        roles = tuple(
+            RoleRecord(row[6], row[7], Role[row[8]], row[9])
+            for row in rows
+            if row[6] is not None
+        )
+        return UserRecord(*rows[0][:6], roles=roles)
@@ -0,0 +1,9 @@
+from .blacklist_token_repository import LocalBlacklistTokenRepository
+from .principal_repository import LocalPrincipalRepository
+from .token_state_repository import LocalTokenStateRepository
+
+__all__ = [
+    'LocalBlacklistTokenRepository',
+    'LocalPrincipalRepository',
+    'LocalTokenStateRepository',
+]
@@ -0,0 +1,47 @@
+from abc import ABC
+from functools import partial
+from typing import Callable
+
+from app.core.local_storage import LocalStorage
+from app.repositories.base import AbstractRepository
+
+
+class ILocalRepository(AbstractRepository, ABC):
+    """Interface for in-process repository."""
+
+    ...
+
+
+class LocalRepository(ILocalRepository, ABC):
+    """Repository for in-process storage."""
+
+    prefix: str
+
+    def __init__(
+        self,
+        storage: LocalStorage,
+        writes: list[Callable[[], None]] | None = None,
+    ):
+        self.__storage = storage
+        self.__writes = writes
+
+    @property
+    def storage(self) -> LocalStorage:
+        return self.__storage
+
+    def write(self, func: Callable, *args, **kwargs) -> None:
+        """Queue write of unit of work, execute it at once without it."""
+        if self.__writes is None:
+            func(*args, **kwargs)
+        else:
+            self.__writes.append(partial(func, *args, **kwargs))
+
+    async def get_one(self, key: str):
+        return self.storage.get(key)
+
+    async def get_all(self, offset: int = 0, limit: int = 100): ...
+
+    async def add_one(self, key: str, value: str, **kwargs):
+        self.write(self.storage.set, key, value, **kwargs)
+
+    async def update_one(self, key: str, value: str, **kwargs): ...
@@ -0,0 +1,108 @@
+import datetime
+import uuid
+from abc import ABC
+from itertools import islice
+from typing import AsyncIterator, Optional
+
+from app.repositories.local.base import LocalRepository
+from app.repositories.redis.blacklist_token_repository import (
+    BlacklistTokenRepository,
+    IBlacklistRepository,
+)
+
+
+class LocalBlacklistTokenRepository(
+    IBlacklistRepository, LocalRepository, ABC
+):
+    """Repository for blacklist tokens in process memory."""
+
+    prefix = BlacklistTokenRepository.prefix
+    default_value = BlacklistTokenRepository.default_value
+
+    @classmethod
+    def __get_key(cls, name: str) -> str:
+        return f'{cls.prefix}:{name}'
+
+    async def add_token(
+        self,
+        token_uuid: str | uuid.UUID,
+        expires_in: Optional[int | datetime.timedelta] = None,
+        expires_at: Optional[int | datetime.datetime] = None,
+    ) -> None:
+        """Add token to blacklist."""
+        self.write(
+            self.storage.set,
+            self.__get_key(str(token_uuid)),
+            self.default_value,
+            ex=expires_in,
+            exat=expires_at,
+            evictable=False,
+        )
+
+    async def exists_token(self, token_uuid: str | uuid.UUID) -> bool:
+        """Check if token exists."""
+        result = self.storage.get(self.__get_key(str(token_uuid)))
+        return result == self.default_value
+
+    async def exists_tokens(
+        self, token_uuids: list[str | uuid.UUID]
+    ) -> list[bool]:
+        """Check if tokens exist."""
+        keys = [self.__get_key(str(token_uuid)) for token_uuid in token_uuids]
+        return [
+            result == self.default_value for result in self.storage.mget(keys)
+        ]
+
+    async def remove_token(self, token_uuid: str | uuid.UUID) -> None:
+        """Remove token from blacklist."""
+        self.write(
+            self.storage.set,
+            self.__get_key(str(token_uuid)),
+            'revoked',
+            keepttl=True,
+            evictable=False,
+        )
+
+    async def get_all_tokens(
+        self, offset: int = 0, limit: int = 100
+    ) -> tuple[int, list[str]]:
+        """Get all blacklisted tokens."""
+        keys = list(
+            islice(
+                self.storage.scan_iter(self.__get_key('*')),
+                offset,
+                offset + limit,
+            )
+        )
+        next_offset = offset + limit if len(keys) == limit else 0
+        return next_offset, keys
+
+    async def scan_tokens(self, count: int = 1000) -> AsyncIterator[str]:
+        """Iterate over identifiers of all blacklisted tokens."""
+        prefix_length = len(self.prefix) + 1
+        for key in self.storage.scan_iter(self.__get_key('*')):
+            yield key[prefix_length:]
+
+    async def compact_tokens(
+        self, expires_in: int | datetime.timedelta, count: int = 1000
+    ) -> dict[str, int]:
+        """Remove stale blacklist keys and set TTL on keys without it."""
+        result = {'scanned': 0, 'deleted': 0, 'expired': 0}
+        for key in self.storage.scan_iter(self.__get_key('*')):
+            result['scanned'] += 1
+            if self.storage.get(key) != self.default_value:
+                self.storage.delete(key)
+                result['deleted'] += 1
+            elif self.storage.ttl(key) == -1:
+                self.storage.expire(key, expires_in)
+                result['expired'] += 1
+        return result
+
+    async def get_memory_usage(self, count: int = 1000) -> dict[str, int]:
+        """Get approximate memory usage of the blacklist keyspace."""
+        result = {'keys': 0, 'persistent_keys': 0, 'bytes': 0}
+        for key in self.storage.scan_iter(self.__get_key('*')):
+            result['keys'] += 1
+            result['bytes'] += self.storage.memory_usage(key) or 0
+            result['persistent_keys'] += self.storage.ttl(key) == -1
+        return result
@@ -0,0 +1,45 @@
+import datetime
+from abc import ABC
+from typing import Optional
+
+from app.models.user_models import Principal
+from app.repositories.local.base import LocalRepository
+from app.repositories.redis.principal_repository import (
+    IPrincipalRepository,
+    PrincipalRepository,
+)
+
+
+class LocalPrincipalRepository(IPrincipalRepository, LocalRepository, ABC):
+    """Repository for cached principals in process memory."""
+
+    prefix = PrincipalRepository.prefix
+
+    @classmethod
+    def __get_key(cls, user_id: int) -> str:
+        return f'{cls.prefix}:{user_id}'
+
+    async def get_principal(self, user_id: int) -> Optional[Principal]:
+        """Get cached principal of user."""
+        result = self.storage.get(self.__get_key(user_id))
+        if result is None:
+            return None
+        return Principal.model_validate_json(result)
+
+    async def add_principal(
+        self, principal: Principal, expires_in: datetime.timedelta
+    ) -> None:
+        """Cache principal of user for ``expires_in``."""
+        self.write(
+            self.storage.set,
+            self.__get_key(principal.id_),
+            principal.model_dump_json(),
+            ex=expires_in,
+        )
+
+    async def remove_principals(self, user_ids: list[int]) -> None:
+        """Remove cached principals of users."""
+        self.write(
+            self.storage.delete,
+            *(self.__get_key(user_id) for user_id in user_ids),
+        )
@@ -0,0 +1,70 @@
+import uuid
+from abc import ABC
+from typing import Optional
+
+from app.models.token_models import TokenState
+from app.repositories.local.base import LocalRepository
+from app.repositories.redis.blacklist_token_repository import (
+    BlacklistTokenRepository,
+)
+from app.repositories.redis.token_state_repository import (
+    ITokenStateRepository,
+    TokenStateRepository,
+)
+
+
+class LocalTokenStateRepository(ITokenStateRepository, LocalRepository, ABC):
+    """Repository for revocation state of tokens in process memory."""
+
+    prefix = TokenStateRepository.prefix
+
+    @classmethod
+    def __get_key(cls, user_id: int) -> str:
+        return f'{cls.prefix}:{user_id}'
+
+    @staticmethod
+    def __get_role_version_key(user_id: int) -> str:
+        return f'{TokenStateRepository.role_version_prefix}:{user_id}'
+
+    async def get_epoch(self, user_id: int) -> int:
+        """Get current revocation epoch of user."""
+        return int(self.storage.get(self.__get_key(user_id)) or 0)
+
+    async def increment_epoch(self, user_id: int) -> None:
+        """Revoke all tokens of user."""
+        self.write(self.storage.incr, self.__get_key(user_id), evictable=False)
+
+    async def increment_role_versions(self, user_ids: list[int]) -> None:
+        """Distrust roles claimed by current tokens of users."""
+        for user_id in user_ids:
+            self.write(
+                self.storage.incr,
+                self.__get_role_version_key(user_id),
+                evictable=False,
+            )
+
+    async def get_states(
+        self, tokens: list[tuple[Optional[str | uuid.UUID], int]]
+    ) -> list[TokenState]:
+        """Get blacklist flags, user epochs and role versions of tokens."""
+        states = []
+        for token_uuid, user_id in tokens:
+            blacklisted = (
+                token_uuid is not None
+                and self.storage.get(
+                    f'{BlacklistTokenRepository.prefix}:{token_uuid}'
+                )
+                == BlacklistTokenRepository.default_value
+            )
+            epoch = int(self.storage.get(self.__get_key(user_id)) or 0)
+            role_version = int(
+                self.storage.get(self.__get_role_version_key(user_id)) or 0
+            )
+            states.append(
+                TokenState(
+                    blacklisted=blacklisted,
+                    epoch=epoch,
+                    role_version=role_version,
+                )
+            )
+        return states
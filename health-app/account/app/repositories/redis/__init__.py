@@ -2,8 +2,20 @@ from .blacklist_token_repository import (
     BlacklistTokenRepository,
     IBlacklistRepository,
 )
+from .principal_repository import (
+    IPrincipalRepository,
+    PrincipalRepository,
+)
+from .token_state_repository import (
+    ITokenStateRepository,
+    TokenStateRepository,
+)
 
 __all__ = [
     'BlacklistTokenRepository',
     'IBlacklistRepository',
+    'IPrincipalRepository',
+    'ITokenStateRepository',
+    'PrincipalRepository',
+    'TokenStateRepository',
 ]
@@ -3,6 +3,7 @@ from abc import ABC
 from typing import Literal, Optional
 
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
 
 from app.repositories.base import AbstractRepository
 from app.utils.datetime import get_now
@@ -19,13 +20,21 @@ class RedisRepository(IRedisRepository, ABC):
 
     prefix: str
 
-    def __init__(self, connection):
+    def __init__(self, connection, pipeline=None):
         self.__connection = connection
+        self.__pipeline = pipeline
 
     @property
     def connection(self) -> Redis:
         return self.__connection
 
+    @property
+    def pipeline(self) -> Pipeline | Redis:
+        """Pipeline of unit of work for writes, connection without it."""
+        if self.__pipeline is None:
+            return self.__connection
+        return self.__pipeline
+
     async def get_one(self, key: str): ...  # GET with limit 1 and error
 
     async def get_all(
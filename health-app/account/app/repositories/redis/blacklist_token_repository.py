@@ -1,7 +1,7 @@
 import datetime
 import uuid
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from app.repositories.redis.base import RedisRepository
 from app.repositories.sqlalchemy.base import AbstractRepository
@@ -24,7 +24,13 @@ class IBlacklistRepository(AbstractRepository, ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def remove_token(self, token_uuid: str | uuid.UUID) -> bool:
+    async def exists_tokens(
+        self, token_uuids: list[str | uuid.UUID]
+    ) -> list[bool]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_token(self, token_uuid: str | uuid.UUID) -> None:
         raise NotImplementedError
 
     async def get_all_tokens(
@@ -32,11 +38,23 @@ class IBlacklistRepository(AbstractRepository, ABC):
     ) -> list[dict[str, str]]:
         raise NotImplementedError
 
+    def scan_tokens(self, count: int = 1000) -> AsyncIterator[str]:
+        raise NotImplementedError
+
+    async def compact_tokens(
+        self, expires_in: int | datetime.timedelta, count: int = 1000
+    ) -> dict[str, int]:
+        raise NotImplementedError
+
+    async def get_memory_usage(self, count: int = 1000) -> dict[str, int]:
+        raise NotImplementedError
+
 
 class BlacklistTokenRepository(IBlacklistRepository, RedisRepository, ABC):
     """Repository for blacklist tokens."""
 
     prefix = 'ms-accounts:blacklist-tokens'
+    channel = 'ms-accounts:blacklist-tokens-events'
     default_value = 'blacklisted'
 
     @classmethod
@@ -49,14 +67,15 @@ class BlacklistTokenRepository(IBlacklistRepository, RedisRepository, ABC):
         expires_in: Optional[int | datetime.timedelta] = None,
         expires_at: Optional[int | datetime.datetime] = None,
     ) -> None:
-        """Add token to blacklist."""
+        """Add token to blacklist and notify blacklist filters."""
         token_uuid = str(token_uuid)
-        return await self.connection.set(
+        await self.pipeline.set(
             self.__get_key(token_uuid),
             self.default_value,
             ex=expires_in,
             exat=expires_at,
         )
+        await self.pipeline.publish(self.channel, token_uuid)
 
     async def exists_token(self, token_uuid: str | uuid.UUID) -> bool:
         """Check if token exists."""
@@ -66,9 +85,22 @@ class BlacklistTokenRepository(IBlacklistRepository, RedisRepository, ABC):
             result is not None and result.decode('ascii') == self.default_value
         )
 
+    async def exists_tokens(
+        self, token_uuids: list[str | uuid.UUID]
+    ) -> list[bool]:
+        """Check if tokens exist with one round-trip."""
+        if not token_uuids:
+            return []
+        keys = [self.__get_key(str(token_uuid)) for token_uuid in token_uuids]
+        results = await self.connection.mget(keys)
+        return [
+            result is not None and result.decode('ascii') == self.default_value
+            for result in results
+        ]
+
     async def remove_token(self, token_uuid: str | uuid.UUID) -> None:
         """Remove token from blacklist."""
-        return await self.connection.set(
+        await self.pipeline.set(
             self.__get_key(token_uuid), 'revoked', keepttl=True
         )
 
@@ -79,3 +111,88 @@ class BlacklistTokenRepository(IBlacklistRepository, RedisRepository, ABC):
         return await self.connection.scan(
             offset, self.__get_key('*'), limit, _type='STRING'
         )
+
+    async def _scan_keys(self, count: int) -> AsyncIterator[list[bytes]]:
+        keys = []
+        async for key in self.connection.scan_iter(
+            self.__get_key('*'), count, _type='STRING'
+        ):
+            keys.append(key)
+            if len(keys) >= count:
+                yield keys
+                keys = []
+        if keys:
+            yield keys
+
+    async def scan_tokens(self, count: int = 1000) -> AsyncIterator[str]:
+        """Iterate over identifiers of all blacklisted tokens."""
+        prefix_length = len(self.prefix) + 1
+        async for key in self.connection.scan_iter(
+            self.__get_key('*'), count, _type='STRING'
+        ):
+            yield key[prefix_length:].decode()
+
+    async def compact_tokens(
+        self, expires_in: int | datetime.timedelta, count: int = 1000
+    ) -> dict[str, int]:
+        """
+        Remove stale blacklist keys and set TTL on keys without it.
+
+        Revoked tokens are deleted, blacklisted tokens without TTL expire
+        after ``expires_in``, so they outlive any token signed before.
+
+        :param expires_in: TTL of blacklisted tokens without TTL.
+        :param count: Number of keys scanned per round-trip.
+        :return: Number of scanned, deleted and expired keys.
+        """
+        result = {'scanned': 0, 'deleted': 0, 'expired': 0}
+        async for keys in self._scan_keys(count):
+            async with self.connection.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.get(key)
+                    pipe.ttl(key)
+                replies = await pipe.execute()
+
+            deleted, expired = [], []
+            for key, value, ttl in zip(keys, replies[::2], replies[1::2]):
+                if value is None:
+                    continue
+                if value.decode('ascii') != self.default_value:
+                    deleted.append(key)
+                elif ttl == -1:
+                    expired.append(key)
+
+            async with self.connection.pipeline(transaction=False) as pipe:
+                if deleted:
+                    pipe.delete(*deleted)
+                for key in expired:
+                    pipe.expire(key, expires_in, nx=True)
+                await pipe.execute()
+
+            result['scanned'] += len(keys)
+            result['deleted'] += len(deleted)
+            result['expired'] += len(expired)
+        return result
+
+    async def get_memory_usage(self, count: int = 1000) -> dict[str, int]:
+        """
+        Get memory usage of the blacklist keyspace.
+
+        :param count: Number of keys scanned per round-trip.
+        :return: Number of keys, keys without TTL and their memory in bytes.
+        """
+        result = {'keys': 0, 'persistent_keys': 0, 'bytes': 0}
+        async for keys in self._scan_keys(count):
+            async with self.connection.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.memory_usage(key, samples=0)
+                    pipe.ttl(key)
+                replies = await pipe.execute()
+
+            for usage, ttl in zip(replies[::2], replies[1::2]):
+                if usage is None:
+                    continue
+                result['keys'] += 1
+                result['bytes'] += usage
+                result['persistent_keys'] += ttl == -1
+        return result
@@ -0,0 +1,59 @@
+import datetime
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.models.user_models import Principal
+from app.repositories.redis.base import RedisRepository
+from app.repositories.sqlalchemy.base import AbstractRepository
+
+
+class IPrincipalRepository(AbstractRepository, ABC):
+    """Interface for principal repository."""
+
+    @abstractmethod
+    async def get_principal(self, user_id: int) -> Optional[Principal]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_principal(
+        self, principal: Principal, expires_in: datetime.timedelta
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_principals(self, user_ids: list[int]) -> None:
+        raise NotImplementedError
+
+
+class PrincipalRepository(IPrincipalRepository, RedisRepository, ABC):
+    """Repository for cached principals of authenticated users."""
+
+    prefix = 'ms-accounts:principals'
+
+    @classmethod
+    def __get_key(cls, user_id: int) -> str:
+        return f'{cls.prefix}:{user_id}'
+
+    async def get_principal(self, user_id: int) -> Optional[Principal]:
+        """Get cached principal of user."""
+        result = await self.connection.get(self.__get_key(user_id))
+        if result is None:
+            return None
+        return Principal.model_validate_json(result)
+
+    async def add_principal(
+        self, principal: Principal, expires_in: datetime.timedelta
+    ) -> None:
+        """Cache principal of user for ``expires_in``."""
+        await self.pipeline.set(
+            self.__get_key(principal.id_),
+            principal.model_dump_json(),
+            ex=expires_in,
+        )
+
+    async def remove_principals(self, user_ids: list[int]) -> None:
+        """Remove cached principals of users."""
+        if user_ids:
+            await self.pipeline.delete(
+                *(self.__get_key(user_id) for user_id in user_ids)
+            )
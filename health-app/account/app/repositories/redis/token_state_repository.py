@@ -0,0 +1,122 @@
+import uuid
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.models.token_models import TokenState
+from app.repositories.redis.base import RedisRepository
+from app.repositories.redis.blacklist_token_repository import (
+    BlacklistTokenRepository,
+)
+from app.repositories.sqlalchemy.base import AbstractRepository
+
+
+class ITokenStateRepository(AbstractRepository, ABC):
+    """Interface for token state repository."""
+
+    @abstractmethod
+    async def get_epoch(self, user_id: int) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def increment_epoch(self, user_id: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def increment_role_versions(self, user_ids: list[int]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_states(
+        self, tokens: list[tuple[Optional[str | uuid.UUID], int]]
+    ) -> list[TokenState]:
+        raise NotImplementedError
+
+
+class TokenStateRepository(ITokenStateRepository, RedisRepository, ABC):
+    """
+    Repository for revocation state of tokens.
+
+    Every user has a revocation epoch, tokens issued with an older epoch
+    are revoked, so all sessions of a user are revoked with one write.
+    A role version of the user is incremented on every role change,
+    roles claimed by tokens with an older version are not trusted.
+    """
+
+    prefix = 'ms-accounts:token-epochs'
+    role_version_prefix = 'ms-accounts:role-versions'
+
+    @classmethod
+    def __get_key(cls, user_id: int) -> str:
+        return f'{cls.prefix}:{user_id}'
+
+    @classmethod
+    def __get_role_version_key(cls, user_id: int) -> str:
+        return f'{cls.role_version_prefix}:{user_id}'
+
+    @staticmethod
+    def __get_blacklist_key(token_uuid: str | uuid.UUID) -> str:
+        return f'{BlacklistTokenRepository.prefix}:{token_uuid}'
+
+    async def get_epoch(self, user_id: int) -> int:
+        """Get current revocation epoch of user."""
+        result = await self.connection.get(self.__get_key(user_id))
+        return int(result) if result is not None else 0
+
+    async def increment_epoch(self, user_id: int) -> None:
+        """Revoke all tokens of user."""
+        await self.pipeline.incr(self.__get_key(user_id))
+
+    async def increment_role_versions(self, user_ids: list[int]) -> None:
+        """Distrust roles claimed by current tokens of users."""
+        for user_id in user_ids:
+            await self.pipeline.incr(self.__get_role_version_key(user_id))
+
+    async def get_states(
+        self, tokens: list[tuple[Optional[str | uuid.UUID], int]]
+    ) -> list[TokenState]:
+        """
+        Get blacklist flags, user epochs and role versions of tokens
+        with one round-trip.
+
+        :param tokens: Pairs of token identifier and user id,
+        blacklist is not checked for tokens without identifier.
+        :return: Token states in the same order.
+        """
+        if not tokens:
+            return []
+        keys = [self.__get_key(user_id) for _, user_id in tokens]
+        keys.extend(
+            self.__get_role_version_key(user_id) for _, user_id in tokens
+        )
+        keys.extend(
+            self.__get_blacklist_key(token_uuid)
+            for token_uuid, _ in tokens
+            if token_uuid is not None
+        )
+        results = await self.connection.mget(keys)
+
+        count, offset = len(tokens), 2 * len(tokens)
+        role_versions = results[count:offset]
+        blacklist_results = iter(results[offset:])
+        states = []
+        for (token_uuid, _), epoch, role_version in zip(
+            tokens, results, role_versions
+        ):
+            blacklisted = False
+            if token_uuid is not None:
+                value = next(blacklist_results)
+                blacklisted = (
+                    value is not None
+                    and value.decode('ascii')
+                    == BlacklistTokenRepository.default_value
+                )
+            states.append(
+                TokenState(
+                    blacklisted=blacklisted,
+                    epoch=int(epoch) if epoch is not None else 0,
+                    role_version=(
+                        int(role_version) if role_version is not None else 0
+                    ),
+                )
+            )
+        return states
@@ -1,11 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Type, List, Any, Optional
+from typing import Type, List, Any, Callable, Optional, TypeVar
 
 from asyncpg import UniqueViolationError  # type: ignore
-from sqlalchemy import Result
+from sqlalchemy import Result, bindparam
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError, NoResultFound, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ClauseElement
 from sqlmodel import select, update
 
 from app.exceptions import NoResultError, AlreadyExistsError, AppError
@@ -13,6 +14,7 @@ from app.models.base import BaseTableModel
 from app.repositories.base import AbstractRepository
 
 _T = Type[BaseTableModel] | BaseTableModel
+_S = TypeVar('_S')
 
 
 class IDatabaseRepository(AbstractRepository, ABC):
@@ -24,11 +26,20 @@ class IDatabaseRepository(AbstractRepository, ABC):
     async def add_many(self, *args, **kwargs):
         raise NotImplementedError
 
+    @abstractmethod
+    async def upsert_many(self, *args, **kwargs):
+        raise NotImplementedError
+
 
 class SQLModelRepository(IDatabaseRepository, ABC):
     """Repository for working with data via sqlmodel and sqlalchemy."""
 
     model: _T
+    # Bind parameters limit of one PostgreSQL statement
+    max_parameters = 32767
+    # Statements shared by repositories, keyed by model and shape
+    _statements: dict[tuple, Any] = {}
+    max_statements = 1000
 
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -37,30 +48,178 @@ class SQLModelRepository(IDatabaseRepository, ABC):
         statement = insert(self.model).values(**data)
         return statement
 
-    def _get_select_statement(self, **data):
-        statement = select(self.model).filter_by(**data)
+    def _get_insert_many_statement(self, datas: list[dict[str, Any]]):
+        statement = insert(self.model).values(datas)
         return statement
 
-    def _get_update_statement(self, filter_data: dict, **data):
-        statement = (
-            update(self.model)  # type: ignore
-            .filter_by(**filter_data)
-            .values(**data)
-            .returning(self.model)  # type: ignore
-        )
+    def _get_insert_many_batch_size(self) -> int:
+        columns = len(self.model.__table__.columns)  # type: ignore
+        return (self.max_parameters - columns) // columns
+
+    def _get_cached_statement(self, key: tuple, build: Callable[[], _S]) -> _S:
+        """
+        Get statement built once per model and key.
+
+        Cached statements take values as bind parameters, so they are
+        not rebuilt on every call and their SQL is compiled once into
+        the compiled cache of the engine.
+
+        :param key: Hashable shape of the statement.
+        :param build: Function building the statement.
+        :return: Cached statement.
+        """
+        key = (self.model, *key)
+        statement = self._statements.get(key)
+        if statement is None:
+            statement = build()
+            if len(self._statements) < self.max_statements:
+                self._statements[key] = statement
         return statement
 
+    @staticmethod
+    def _is_cacheable(*datas: dict) -> bool:
+        return not any(
+            isinstance(value, ClauseElement)
+            for data in datas
+            for value in data.values()
+        )
+
+    @staticmethod
+    def _get_filter_shape(data: dict) -> tuple:
+        return tuple(
+            sorted((key, value is None) for key, value in data.items())
+        )
+
+    def _get_criteria(self, shape: tuple) -> list:
+        return [
+            (
+                getattr(self.model, key).is_(None)
+                if is_none
+                else getattr(self.model, key) == bindparam(f'filter_{key}')
+            )
+            for key, is_none in shape
+        ]
+
+    @staticmethod
+    def _get_params(
+        prefix: str, data: dict, skip_none: bool = False
+    ) -> dict[str, Any]:
+        return {
+            f'{prefix}_{key}': value
+            for key, value in data.items()
+            if value is not None or not skip_none
+        }
+
+    def _get_select_statement(self, **data) -> tuple[Any, dict[str, Any]]:
+        """
+        Get select by column values and its parameters.
+
+        :param data: Filters of model columns.
+        :return: Statement and parameters of its execution.
+        """
+        if not self._is_cacheable(data):
+            return select(self.model).filter_by(**data), {}
+        shape = self._get_filter_shape(data)
+        statement = self._get_cached_statement(
+            ('select', shape),
+            lambda: select(self.model).where(*self._get_criteria(shape)),
+        )
+        return statement, self._get_params('filter', data, True)
+
+    def _get_update_statement(
+        self, filter_data: dict, **data
+    ) -> tuple[Any, dict[str, Any]]:
+        """
+        Get update by column values returning updated rows.
+
+        Updated instances of the session are refreshed from the returned
+        rows instead of evaluating the statement in Python.
+
+        :param filter_data: Filters of model columns.
+        :param data: New values of model columns.
+        :return: Statement and parameters of its execution.
+        """
+        options = {'synchronize_session': False, 'populate_existing': True}
+        if not self._is_cacheable(filter_data, data):
+            statement = (
+                update(self.model)  # type: ignore
+                .filter_by(**filter_data)
+                .values(**data)
+                .returning(self.model)  # type: ignore
+                .execution_options(**options)
+            )
+            return statement, {}
+        shape = self._get_filter_shape(filter_data)
+        columns = tuple(sorted(data))
+        statement = self._get_cached_statement(
+            ('update', shape, columns),
+            lambda: (
+                update(self.model)  # type: ignore
+                .where(*self._get_criteria(shape))
+                .values(
+                    **{
+                        column: bindparam(f'value_{column}')
+                        for column in columns
+                    }
+                )
+                .returning(self.model)  # type: ignore
+                .execution_options(**options)
+            ),
+        )
+        params = self._get_params('filter', filter_data, True)
+        params.update(self._get_params('value', data))
+        return statement, params
+
     def _get_insert_update_statement(
         self,
         data: dict,
         constraint: str | None = None,
         index_elements: list | None = None,
         set_data: dict | None = None,
-    ):
-        statement = self._get_insert_statement(**data).on_conflict_do_update(
-            constraint=constraint, index_elements=index_elements, set_=set_data
+    ) -> tuple[Any, dict[str, Any]]:
+        """
+        Get insert of a row updating the conflicting one.
+
+        :param data: Row data.
+        :param constraint: Name of the conflicting unique constraint.
+        :param index_elements: Columns of the conflicting unique index.
+        :param set_data: Values set on conflict.
+        :return: Statement and parameters of its execution.
+        """
+        set_data = set_data or {}
+        if not self._is_cacheable(data, set_data):
+            statement = self._get_insert_statement(
+                **data
+            ).on_conflict_do_update(
+                constraint=constraint,
+                index_elements=index_elements,
+                set_=set_data,
+            )
+            return statement, {}
+        columns = tuple(sorted(data))
+        set_columns = tuple(sorted(set_data))
+        statement = self._get_cached_statement(
+            (
+                'insert_update',
+                columns,
+                constraint,
+                tuple(index_elements or ()),
+                set_columns,
+            ),
+            lambda: self._get_insert_statement(
+                **{column: bindparam(f'value_{column}') for column in columns}
+            ).on_conflict_do_update(
+                constraint=constraint,
+                index_elements=index_elements,
+                set_={
+                    column: bindparam(f'set_{column}')
+                    for column in set_columns
+                },
+            ),
         )
-        return statement
+        params = self._get_params('value', data)
+        params.update(self._get_params('set', set_data))
+        return statement, params
 
     async def _add(self, instance: object) -> None:
         try:
@@ -68,93 +227,170 @@ class SQLModelRepository(IDatabaseRepository, ABC):
         except SQLAlchemyError:
             raise AppError
 
-    async def _add_many(self, instances: list[object]) -> None:
-        for instance in instances:
-            await self._add(instance)
-
-    async def _execute(self, statement) -> Result:
+    def _get_integrity_error(self, error: IntegrityError) -> AppError:
+        """Get app error of database integrity error."""
+        if (
+            error.orig.sqlstate  # type: ignore
+            == UniqueViolationError.sqlstate
+        ):
+            return AlreadyExistsError(self.model)
+        return AppError()
+
+    async def _execute(
+        self, statement, params: dict[str, Any] | None = None
+    ) -> Result:
         try:
-            return await self.session.execute(statement)
-        except IntegrityError:
-            raise AppError
+            return await self.session.execute(statement, params)
+        except IntegrityError as e:
+            raise self._get_integrity_error(e) from e
 
-    async def _commit(self) -> None:
+    async def _flush(self) -> None:
         try:
-            await self.session.commit()
+            await self.session.flush()
         except IntegrityError as e:
-            if (
-                e.orig.sqlstate  # type: ignore
-                == UniqueViolationError.sqlstate
-            ):
-                raise AlreadyExistsError(self.model)
-            raise AppError
+            raise self._get_integrity_error(e) from e
 
     async def _refresh(self, instance: object) -> None:
         await self.session.refresh(instance)
 
-    async def _refresh_many(self, instances: list[object]) -> None:
-        for instance in instances:
-            await self._refresh(instance)
-
-    async def _fetch_one(self, statement) -> _T:
-        result = await self._execute(statement)
+    async def _fetch_one(
+        self, statement, params: dict[str, Any] | None = None
+    ) -> _T:
+        result = await self._execute(statement, params)
         try:
             return result.unique().scalar_one()
         except NoResultFound:
             raise NoResultError(model=self.model)
 
-    async def _fetch_one_or_none(self, statement) -> _T | None:
-        result = await self._execute(statement)
+    async def _fetch_one_or_none(
+        self, statement, params: dict[str, Any] | None = None
+    ) -> _T | None:
+        result = await self._execute(statement, params)
         return result.unique().scalar_one_or_none()
 
-    async def _fetch_all(self, statement) -> List[_T]:
-        raw_result = await self._execute(statement)
+    async def _fetch_all(
+        self, statement, params: dict[str, Any] | None = None
+    ) -> List[_T]:
+        raw_result = await self._execute(statement, params)
         return list(raw_result.scalars().all())
 
     async def get_one(self, **data) -> _T:
-        statement = self._get_select_statement(**data)
-        return await self._fetch_one(statement)
+        statement, params = self._get_select_statement(**data)
+        return await self._fetch_one(statement, params)
 
     async def get_one_or_none(self, **data) -> _T | None:
-        statement = self._get_select_statement(**data)
-        return await self._fetch_one_or_none(statement)
+        statement, params = self._get_select_statement(**data)
+        return await self._fetch_one_or_none(statement, params)
 
     async def get_all(
         self, offset: Optional[int] = None, limit: Optional[int] = None, **data
     ) -> list[_T]:
-        statement = self._get_select_statement(**data)
+        statement, params = self._get_select_statement(**data)
         if offset is not None:
             statement = statement.offset(offset)
         if limit is not None:
             statement = statement.limit(limit)
-        return await self._fetch_all(statement)
+        return await self._fetch_all(statement, params)
 
     async def add_one(self, instance: Optional[_T] = None, **data) -> _T:
         if instance is None:
             instance = self.model(**data)
         await self._add(instance)
-        await self._commit()
+        await self._flush()
         await self._refresh(instance)
         return instance
 
+    async def _insert_many(
+        self,
+        datas: list[dict[str, Any]],
+        get_statement: Callable[[list[dict[str, Any]]], Any],
+    ) -> list[_T]:
+        result = []
+        batch_size = self._get_insert_many_batch_size()
+        for start in range(0, len(datas), batch_size):
+            stop = start + batch_size
+            statement = get_statement(datas[start:stop])
+            result.extend(await self._fetch_all(statement))
+        return result
+
     async def add_many(
         self, *datas: dict[str, Any], instances: Optional[List[_T]] = None
     ) -> list[_T]:
-        if instances is None:
-            instances = []
-
-            for data in datas:
-                instances.append(self.model(**data))
-
-        await self._add_many(instances)
-        await self._commit()
-        await self._refresh_many(instances)
-        return instances
+        """
+        Insert rows with multi-row ``INSERT ... RETURNING`` statements.
+
+        Rows are split only to fit the bind parameters limit, so a batch
+        of a few thousand rows takes one round-trip.
+
+        :param datas: Rows data.
+        :param instances: Unsaved instances used instead of ``datas``.
+        :return: Inserted instances built from the returned rows.
+        """
+        rows = list(datas)
+        if instances is not None:
+            rows = [
+                instance.model_dump(exclude_unset=True)  # type: ignore
+                for instance in instances
+            ]
+        if not rows:
+            return []
+
+        def get_statement(batch: list[dict[str, Any]]):
+            return self._get_insert_many_statement(batch).returning(self.model)
+
+        return await self._insert_many(rows, get_statement)
+
+    async def upsert_many(
+        self,
+        datas: list[dict[str, Any]],
+        constraint: str | None = None,
+        index_elements: list | None = None,
+        set_data: dict | None = None,
+        update_columns: list[str] | None = None,
+    ) -> list[_T]:
+        """
+        Insert rows or update conflicting ones with multi-row statements.
+
+        Conflicting rows are skipped if neither ``set_data``
+        nor ``update_columns`` is passed.
+
+        :param datas: Rows data.
+        :param constraint: Name of the conflicting unique constraint.
+        :param index_elements: Columns of the conflicting unique index.
+        :param set_data: Values set on conflict.
+        :param update_columns: Columns set on conflict from the new row.
+        :return: Inserted and updated instances built from the returned
+            rows, skipped rows are not returned.
+        """
+        if not datas:
+            return []
+
+        def get_statement(batch: list[dict[str, Any]]):
+            statement = self._get_insert_many_statement(batch)
+            set_ = dict(set_data or {})
+            for column in update_columns or []:
+                set_[column] = statement.excluded[column]
+            if not set_:
+                statement = statement.on_conflict_do_nothing(
+                    constraint=constraint, index_elements=index_elements
+                )
+            else:
+                statement = statement.on_conflict_do_update(
+                    constraint=constraint,
+                    index_elements=index_elements,
+                    set_=set_,
+                )
+            # Updated rows may already be loaded in the session
+            return statement.returning(self.model).execution_options(
+                populate_existing=True
+            )
+
+        return await self._insert_many(datas, get_statement)
 
     async def update_one(self, filter_data: dict, **data):
-        statement = self._get_update_statement(filter_data, **data)
-        return await self._fetch_one(statement)
+        statement, params = self._get_update_statement(filter_data, **data)
+        return await self._fetch_one(statement, params)
 
     async def update_all(self, filter_data: dict, **data):
-        statement = self._get_update_statement(filter_data, **data)
-        return await self._fetch_all(statement)
+        statement, params = self._get_update_statement(filter_data, **data)
+        return await self._fetch_all(statement, params)
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
 from typing import List
 
+from sqlalchemy import Integer, column, true, tuple_, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased
 from sqlmodel import select
 
-from app.models.user_models import UserRole
+from app.models.user_models import User, UserRole
 from app.repositories.sqlalchemy.base import (
     AbstractRepository,
     SQLModelRepository,
@@ -18,10 +21,28 @@ class IRoleRepository(AbstractRepository, ABC):
     async def add_role(self, user_id: int, role):
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_roles(self, datas: list[dict]) -> List:
+        raise NotImplementedError
+
     @abstractmethod
     async def add_or_activate_role(self, user_id: int, role: Role):
         raise NotImplementedError
 
+    @abstractmethod
+    async def assign_roles(self, user_ids: list[int], role: Role) -> List:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def revoke_roles(self, user_ids: list[int], role: Role) -> List:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def sync_roles(
+        self, roles: dict[int, list[Role]]
+    ) -> dict[int, list]:
+        raise NotImplementedError
+
     @abstractmethod
     async def remove_role(self, user_id: int, role):
         raise NotImplementedError
@@ -34,6 +55,12 @@ class IRoleRepository(AbstractRepository, ABC):
     async def get_roles(self, user_id: int, only_active: bool = True):
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_roles_by_user_ids(
+        self, user_ids: list[int], only_active: bool = True
+    ) -> dict[int, list]:
+        raise NotImplementedError
+
     @abstractmethod
     async def get_all_roles(
         self, roles: list[Role] = None, offset: int = None, limit: int = None
@@ -49,15 +76,147 @@ class RoleRepository(IRoleRepository, SQLModelRepository, ABC):
     async def add_role(self, user_id: int, role: Role) -> UserRole:
         return await self.add_one(user_id=user_id, role=role)
 
+    async def add_roles(self, datas: list[dict]) -> List[UserRole]:
+        """
+        Insert roles with one statement, skipping existing roles.
+
+        :param datas: Roles data with ``user_id`` and ``role``.
+        :return: Inserted roles.
+        """
+        return await self.upsert_many(datas, constraint='user_id_role')
+
     async def add_or_activate_role(self, user_id: int, role: Role) -> UserRole:
         data = {'user_id': user_id, 'role': role}
-        statement = self._get_insert_update_statement(
+        statement, params = self._get_insert_update_statement(
             data, constraint='user_id_role', set_data={'is_active': True}
-        ).returning(self.model)
-        instance = await self._fetch_one(statement)
+        )
+        statement = self._get_cached_statement(
+            ('add_or_activate_role',),
+            lambda: statement.returning(self.model),  # type: ignore
+        )
+        instance = await self._fetch_one(statement, params)
         await self._refresh(instance)
         return instance
 
+    def _get_activate_statement(self, pairs: list[tuple[int, Role]]):
+        """Get upsert of active roles for existing users."""
+        table = self.model.__table__  # type: ignore
+        users = User.__table__  # type: ignore
+        target = values(
+            column('user_id', Integer),
+            column('role', table.c.role.type),
+            name='target',
+        ).data(pairs)
+        rows = (
+            select(target.c.user_id, target.c.role, true())
+            .select_from(target)
+            .join(users, users.c.id == target.c.user_id)
+        )
+        return (
+            insert(table)
+            .from_select(['user_id', 'role', 'is_active'], rows)
+            .on_conflict_do_update(
+                constraint='user_id_role', set_={'is_active': True}
+            )
+            .returning(*table.c)
+        )
+
+    async def assign_roles(
+        self, user_ids: list[int], role: Role
+    ) -> List[UserRole]:
+        """
+        Add or activate role of users with one statement.
+
+        :param user_ids: Users ids, unknown users are skipped.
+        :param role: Assigned role.
+        :return: Assigned roles.
+        """
+        if not user_ids:
+            return []
+        pairs = [(user_id, role) for user_id in sorted(set(user_ids))]
+        upserted = self._get_activate_statement(pairs).cte('upserted')
+        statement = select(aliased(self.model, upserted)).execution_options(
+            populate_existing=True
+        )
+        return await self._fetch_all(statement)
+
+    async def revoke_roles(
+        self, user_ids: list[int], role: Role
+    ) -> List[UserRole]:
+        """
+        Deactivate role of users with one statement.
+
+        :param user_ids: Users ids.
+        :param role: Revoked role.
+        :return: Revoked roles.
+        """
+        if not user_ids:
+            return []
+        statement = (
+            update(self.model)
+            .where(
+                self.model.user_id.in_(user_ids),  # type: ignore
+                self.model.role == role,  # type: ignore
+                self.model.is_active_ == True,  # type: ignore  # noqa: E712
+            )
+            .values(is_active_=False)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        return await self._fetch_all(statement)
+
+    async def sync_roles(
+        self, roles: dict[int, list[Role]]
+    ) -> dict[int, list[UserRole]]:
+        """
+        Replace active roles of users with one statement.
+
+        Target roles are upserted as active and other active roles of the
+        users are deactivated by data-modifying CTEs of one query.
+
+        :param roles: Target roles by user id.
+        :return: Active roles by user id.
+        """
+        result: dict[int, list[UserRole]] = {user_id: [] for user_id in roles}
+        if not roles:
+            return result
+        table = self.model.__table__  # type: ignore
+        pairs = sorted(
+            {
+                (user_id, role)
+                for user_id, user_roles in roles.items()
+                for role in user_roles
+            }
+        )
+        deactivate = (
+            update(table)
+            .where(
+                table.c.user_id.in_(list(roles)),
+                table.c.is_active == True,  # noqa: E712
+            )
+            .values(is_active=False)
+        )
+        if not pairs:
+            await self._execute(deactivate)
+            return result
+
+        deactivated = (
+            deactivate.where(
+                tuple_(table.c.user_id, table.c.role).not_in(pairs)
+            )
+            .returning(table.c.id)
+            .cte('deactivated')
+        )
+        upserted = self._get_activate_statement(pairs).cte('upserted')
+        statement = (
+            select(aliased(self.model, upserted))
+            .add_cte(deactivated)
+            .execution_options(populate_existing=True)
+        )
+        for user_role in await self._fetch_all(statement):
+            result[user_role.user_id].append(user_role)
+        return result
+
     async def remove_role(self, user_id: int, role: Role) -> UserRole:
         return await self.update_one(
             {'user_id': user_id, 'role': role}, is_active_=False
@@ -74,12 +233,31 @@ class RoleRepository(IRoleRepository, SQLModelRepository, ABC):
             statement = statement.filter_by(is_active_=True)
         return await self._fetch_all(statement)
 
+    async def get_roles_by_user_ids(
+        self, user_ids: list[int], only_active: bool = True
+    ) -> dict[int, list[UserRole]]:
+        result: dict[int, list[UserRole]] = {
+            user_id: [] for user_id in user_ids
+        }
+        if not user_ids:
+            return result
+        statement = select(self.model).where(
+            self.model.user_id.in_(user_ids)  # type: ignore
+        )
+        if only_active:
+            statement = statement.filter_by(is_active_=True)
+        for user_role in await self._fetch_all(statement):
+            result[user_role.user_id].append(user_role)
+        return result
+
     async def get_all_roles(
         self, roles: list[Role] = None, offset: int = None, limit: int = None
     ) -> List[UserRole]:
         statement = select(self.model)
         if roles:
-            statement = statement.filter_by(role__in=roles)
+            statement = statement.where(
+                self.model.role.in_(roles)  # type: ignore
+            )
         if offset:
             statement = statement.offset(offset)
         if limit:
@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, List
 
+from sqlalchemy import func, literal, literal_column, tuple_
+from sqlalchemy.orm import joinedload
 from sqlmodel import select
 
+from app.models.role_models import UserRole
 from app.models.user_models import User
+from app.utils.enums import Role
 from app.repositories.sqlalchemy.base import (
     SQLModelRepository,
     AbstractRepository,
@@ -17,10 +21,22 @@ class IUserRepository(AbstractRepository, ABC):
     async def add_user(self, data):
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_users(self, datas: list[dict]):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_existing_usernames(self, usernames: list[str]):
+        raise NotImplementedError
+
     @abstractmethod
     async def get_user(self, only_active: bool = True, **data):
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_user_with_roles(self, only_active: bool = True, **data):
+        raise NotImplementedError
+
     @abstractmethod
     async def get_all_users(
         self,
@@ -42,6 +58,41 @@ class IUserRepository(AbstractRepository, ABC):
     ):
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_users_page(
+        self,
+        sort_by: str = 'id',
+        after: tuple[Any, int] = None,
+        offset: int = None,
+        limit: int = None,
+        role: Role = None,
+        is_active: bool | None = True,
+    ):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_users_by_role(
+        self,
+        role: Role,
+        only_active: bool = True,
+        after_id: int = None,
+        offset: int = None,
+        limit: int = None,
+        full_name: str = None,
+    ):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search_users_by_role(
+        self,
+        role: Role,
+        query: str,
+        only_active: bool = True,
+        offset: int = None,
+        limit: int = None,
+    ):
+        raise NotImplementedError
+
     @abstractmethod
     async def update_user(self, user_id: int, **data):
         raise NotImplementedError
@@ -55,16 +106,75 @@ class UserRepository(IUserRepository, SQLModelRepository, ABC):
     """User repository for working with data via sqlmodel and sqlalchemy."""
 
     model = User
+    sort_columns = {
+        'id': User.id_,
+        'username': User.username,
+        'first_name': User.first_name,
+        'last_name': User.last_name,
+    }
+    # Must match the trigram index expression, so the separator is a literal
+    full_name = User.first_name + literal_column("' '") + User.last_name
 
     async def add_user(self, data: dict) -> User:
         instance = self.model(**data)
         return await self.add_one(instance)
 
+    async def add_users(self, datas: list[dict]) -> list[User]:
+        """
+        Insert users with one statement, skipping taken usernames.
+
+        :param datas: Users data.
+        :return: Inserted users.
+        """
+        return await self.upsert_many(datas, index_elements=['username'])
+
+    async def get_existing_usernames(self, usernames: list[str]) -> set[str]:
+        if not usernames:
+            return set()
+        statement = select(self.model.username).where(
+            self.model.username.in_(usernames)  # type: ignore
+        )
+        return set(await self._fetch_all(statement))
+
     async def get_user(self, only_active: bool = True, **data) -> User:
         if only_active:
             data['is_active_'] = True
         return await self.get_one(**data)
 
+    async def get_user_with_roles(
+        self, only_active: bool = True, **data
+    ) -> User:
+        """
+        Get user with active roles loaded by one joined query.
+
+        ``User.roles`` of the result holds active roles only.
+
+        :param only_active: Get active user only.
+        :param data: Filters of user columns.
+        :return: User with roles.
+        """
+        if only_active:
+            data['is_active_'] = True
+        statement, params = self._get_select_statement(**data)
+        if self._is_cacheable(data):
+            select_statement = statement
+            statement = self._get_cached_statement(
+                ('select_with_roles', self._get_filter_shape(data)),
+                lambda: self._with_active_roles(select_statement),
+            )
+        else:
+            statement = self._with_active_roles(statement)
+        return await self._fetch_one(statement, params)
+
+    def _with_active_roles(self, statement):
+        return statement.options(
+            joinedload(
+                self.model.roles.and_(  # type: ignore
+                    UserRole.is_active_ == True  # noqa: E712
+                )
+            )
+        ).execution_options(populate_existing=True)
+
     async def get_all_users(
         self,
         only_active: bool = True,
@@ -88,13 +198,144 @@ class UserRepository(IUserRepository, SQLModelRepository, ABC):
             self.model.id_.in_(user_ids)  # type: ignore
         )  # type: ignore
         if full_name:
+            statement = statement.where(self.full_name.like(full_name))
+        if only_active:
+            statement = statement.filter_by(is_active_=True)
+        if offset:
+            statement = statement.offset(offset)
+        if limit:
+            statement = statement.limit(limit)
+        return await self._fetch_all(statement)
+
+    async def get_users_page(
+        self,
+        sort_by: str = 'id',
+        after: tuple[Any, int] = None,
+        offset: int = None,
+        limit: int = None,
+        role: Role = None,
+        is_active: bool | None = True,
+    ) -> list[User]:
+        """
+        Get users ordered by column and id.
+
+        :param sort_by: Name of sort column.
+        :param after: Sort column value and id of the last user
+        of the previous page.
+        :param offset: Number of skipped users, used without ``after``.
+        :param limit: Page size.
+        :param role: Filter users with active role.
+        :param is_active: Filter users by active status, None for all.
+        :return: Page of users.
+        """
+        sort_column = self.sort_columns[sort_by]
+        id_column = self.model.id_
+        statement = select(self.model)
+        if role is not None:
+            statement = statement.join(
+                UserRole, UserRole.user_id == id_column  # type: ignore
+            ).where(
+                UserRole.role == role,  # type: ignore
+                UserRole.is_active_ == True,  # type: ignore  # noqa: E712
+            )
+        if is_active is not None:
+            statement = statement.where(
+                self.model.is_active_ == is_active  # type: ignore
+            )
+        if sort_column is id_column:
+            if after is not None:
+                statement = statement.where(id_column > after[1])
+            statement = statement.order_by(id_column)
+        else:
+            if after is not None:
+                statement = statement.where(
+                    tuple_(sort_column, id_column) > tuple_(*after)
+                )
+            statement = statement.order_by(sort_column, id_column)
+        if offset and after is None:
+            statement = statement.offset(offset)
+        if limit:
+            statement = statement.limit(limit)
+        return await self._fetch_all(statement)
+
+    async def get_users_by_role(
+        self,
+        role: Role,
+        only_active: bool = True,
+        after_id: int = None,
+        offset: int = None,
+        limit: int = None,
+        full_name: str = None,
+    ) -> list[User]:
+        statement = (
+            select(self.model)
+            .join(UserRole, UserRole.user_id == self.model.id_)  # type: ignore
+            .where(
+                UserRole.role == role,  # type: ignore
+                UserRole.is_active_ == True,  # type: ignore  # noqa: E712
+            )
+            .order_by(self.model.id_)  # type: ignore
+        )
+        if full_name:
+            statement = statement.where(self.full_name.like(full_name))
+        if only_active:
             statement = statement.where(
-                (  # type: ignore
-                    self.model.first_name + ' ' + self.model.last_name
-                ).like(full_name)
+                self.model.is_active_ == True  # type: ignore  # noqa: E712
             )
+        if after_id is not None:
+            statement = statement.where(
+                self.model.id_ > after_id  # type: ignore
+            )
+        if offset:
+            statement = statement.offset(offset)
+        if limit:
+            statement = statement.limit(limit)
+        return await self._fetch_all(statement)
+
+    async def search_users_by_role(
+        self,
+        role: Role,
+        query: str,
+        only_active: bool = True,
+        offset: int = None,
+        limit: int = None,
+    ) -> list[User]:
+        """
+        Search users with role by full name.
+
+        Names starting with the query go first, then names containing
+        words similar to it (``pg_trgm`` word similarity).
+
+        :param role: Active role of users.
+        :param query: Part of the full name.
+        :param only_active: Search only active users.
+        :param offset: Number of skipped users.
+        :param limit: Page size.
+        :return: Users ordered by relevance.
+        """
+        pattern = (
+            query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            + '%'
+        )
+        is_prefix = self.full_name.ilike(pattern)
+        statement = (
+            select(self.model)
+            .join(UserRole, UserRole.user_id == self.model.id_)  # type: ignore
+            .where(
+                UserRole.role == role,  # type: ignore
+                UserRole.is_active_ == True,  # type: ignore  # noqa: E712
+                is_prefix | literal(query).op('<%')(self.full_name),
+            )
+            .order_by(
+                is_prefix.desc(),
+                func.word_similarity(query, self.full_name).desc(),
+                self.model.id_,  # type: ignore
+            )
+        )
         if only_active:
-            statement = statement.filter_by(is_active_=True)
+            statement = statement.where(
+                self.model.is_active_ == True  # type: ignore  # noqa: E712
+            )
         if offset:
             statement = statement.offset(offset)
         if limit:
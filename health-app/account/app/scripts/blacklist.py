@@ -0,0 +1,40 @@
+"""
+Maintenance of the token blacklist keyspace.
+
+Usage::
+
+    python -m app.scripts.blacklist compact
+    python -m app.scripts.blacklist report
+"""
+
+import argparse
+import asyncio
+import json
+
+from app.core.redis import close_redis
+from app.services import TokenService
+from app.uow.inmemory import create_inmemory_uow
+
+
+async def main(command: str, count: int) -> dict[str, int]:
+    uow = create_inmemory_uow()
+    try:
+        if command == 'compact':
+            return await TokenService.compact_blacklist(uow, count=count)
+        return await TokenService.get_blacklist_memory_usage(uow, count=count)
+    finally:
+        await close_redis()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        'command',
+        choices=['compact', 'report'],
+        help='set TTL on or delete stale keys, or report memory usage',
+    )
+    parser.add_argument(
+        '--count', type=int, default=1000, help='keys scanned per round-trip'
+    )
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(main(args.command, args.count))))
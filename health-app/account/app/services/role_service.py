@@ -1,5 +1,7 @@
+from functools import partial
 from typing import Optional
 
+from app.core.principal_cache import principal_cache
 from app.uow.database import IDatabaseUnitOfWork
 from app.utils.enums import Role
 
@@ -14,6 +16,15 @@ class RoleService:
         async with uow:
             return await uow.role_repository.get_roles(user_id, only_active)
 
+    @staticmethod
+    async def get_roles_by_user_ids(
+        uow: IDatabaseUnitOfWork, user_ids: list[int], only_active: bool = True
+    ):
+        async with uow:
+            return await uow.role_repository.get_roles_by_user_ids(
+                user_ids, only_active
+            )
+
     @staticmethod
     async def get_role(uow: IDatabaseUnitOfWork, user_id: int, role: Role):
         async with uow:
@@ -38,21 +49,68 @@ class RoleService:
         uow: IDatabaseUnitOfWork, user_id: int, roles: list[Role]
     ):
         async with uow:
-            await uow.role_repository.remove_all_roles(user_id)
-            result = []
-            for role in roles:
-                result_role = await uow.role_repository.add_or_activate_role(
-                    user_id, role
-                )
-                result.append(result_role)
-            return result
+            uow.add_after_commit(
+                partial(principal_cache.invalidate, [user_id])
+            )
+            result = await uow.role_repository.sync_roles({user_id: roles})
+            return result[user_id]
 
     @staticmethod
-    async def add_role(uow: IDatabaseUnitOfWork, user_id: int, role: Role):
+    async def sync_roles(
+        uow: IDatabaseUnitOfWork, roles: dict[int, list[Role]]
+    ):
+        async with uow:
+            uow.add_after_commit(
+                partial(principal_cache.invalidate, list(roles))
+            )
+            return await uow.role_repository.sync_roles(roles)
+
+    @staticmethod
+    async def assign_role(
+        uow: IDatabaseUnitOfWork, user_ids: list[int], role: Role
+    ):
         async with uow:
+            uow.add_after_commit(partial(principal_cache.invalidate, user_ids))
+            await uow.role_repository.assign_roles(user_ids, role)
+            return await uow.role_repository.get_roles_by_user_ids(user_ids)
+
+    @staticmethod
+    async def revoke_role(
+        uow: IDatabaseUnitOfWork, user_ids: list[int], role: Role
+    ):
+        async with uow:
+            uow.add_after_commit(partial(principal_cache.invalidate, user_ids))
+            await uow.role_repository.revoke_roles(user_ids, role)
+            return await uow.role_repository.get_roles_by_user_ids(user_ids)
+
+    @staticmethod
+    async def add_role(
+        uow: IDatabaseUnitOfWork,
+        user_id: int,
+        role: Role,
+        new_user: bool = False,
+    ):
+        """
+        Add a role to a user.
+
+        :param uow: Database unit of work.
+        :param user_id: User id.
+        :param role: Role.
+        :param new_user: User is created in the same unit of work, so it
+            has no tokens or cached principal and its version is kept.
+        :return: Added role.
+        """
+        async with uow:
+            if not new_user:
+                uow.add_after_commit(
+                    partial(principal_cache.invalidate, [user_id])
+                )
             return await uow.role_repository.add_role(user_id, role)
 
     @staticmethod
     async def remove_role(uow: IDatabaseUnitOfWork, user_id: int, role: Role):
         async with uow:
+            uow.add_after_commit(
+                partial(principal_cache.invalidate, [user_id])
+            )
             return await uow.role_repository.remove_role(user_id, role)
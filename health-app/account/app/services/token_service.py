@@ -1,8 +1,12 @@
 import datetime
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
+from app.core.blacklist_filter import blacklist_filter
+from app.models.token_models import TokenState
 from app.uow.inmemory import IInMemoryUnitOfWork
+from app.utils.datetime import get_now, get_refresh_expires
+from app.utils.enums import Role
 
 
 class TokenService:
@@ -15,20 +19,165 @@ class TokenService:
         expires_in: Optional[datetime.timedelta | int] = None,
         expires_at: Optional[datetime.datetime | int] = None,
     ):
+        """
+        Add token to blacklist until it expires.
+
+        Without expiration token is kept for the refresh token lifetime,
+        already expired tokens are not added.
+
+        :param uow: In-memory unit of work.
+        :param token_uuid: Token identifier.
+        :param expires_in: Time to keep token in blacklist.
+        :param expires_at: Token expiration time, naive datetime is in UTC.
+        """
+        if isinstance(expires_at, datetime.datetime):
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=datetime.UTC)
+            expires_at = int(expires_at.timestamp())
+        if expires_at is not None and expires_at <= get_now(False).timestamp():
+            return
+        if expires_in is None and expires_at is None:
+            expires_in = get_refresh_expires()
         async with uow:
-            return await uow.blacklist_token_repository.add_token(
+            await uow.blacklist_token_repository.add_token(
                 token_uuid, expires_in=expires_in, expires_at=expires_at
             )
+        blacklist_filter.add(token_uuid)
 
     @staticmethod
     async def check_blacklist_token(
         uow: IInMemoryUnitOfWork, token_uuid: UUID | str
     ) -> bool:
+        if not blacklist_filter.might_contain(token_uuid):
+            return False
         async with uow:
             return await uow.blacklist_token_repository.exists_token(
                 token_uuid
             )
 
+    @staticmethod
+    async def check_blacklist_tokens(
+        uow: IInMemoryUnitOfWork, token_uuids: list[UUID | str]
+    ) -> list[bool]:
+        result = [False] * len(token_uuids)
+        indexes = [
+            index
+            for index, token_uuid in enumerate(token_uuids)
+            if blacklist_filter.might_contain(token_uuid)
+        ]
+        if not indexes:
+            return result
+        async with uow:
+            exists = await uow.blacklist_token_repository.exists_tokens(
+                [token_uuids[index] for index in indexes]
+            )
+        for index, is_blacklisted in zip(indexes, exists):
+            result[index] = is_blacklisted
+        return result
+
+    @staticmethod
+    async def get_token_states(
+        uow: IInMemoryUnitOfWork, payloads: list[dict[str, Any]]
+    ) -> list[TokenState]:
+        """
+        Get revocation state and role version of tokens with one lookup.
+
+        :param uow: In-memory unit of work.
+        :param payloads: Verified token payloads.
+        :return: Token states in the same order.
+        """
+        tokens = [
+            (
+                (
+                    payload['jti']
+                    if blacklist_filter.might_contain(payload['jti'])
+                    else None
+                ),
+                payload['user_id'],
+            )
+            for payload in payloads
+        ]
+        async with uow:
+            return await uow.token_state_repository.get_states(tokens)
+
+    @staticmethod
+    async def get_token_state(
+        uow: IInMemoryUnitOfWork, payload: dict[str, Any]
+    ) -> TokenState:
+        result = await TokenService.get_token_states(uow, [payload])
+        return result[0]
+
+    @staticmethod
+    async def get_user_state(
+        uow: IInMemoryUnitOfWork, user_id: int
+    ) -> TokenState:
+        """Get revocation epoch and role version of user."""
+        async with uow:
+            result = await uow.token_state_repository.get_states(
+                [(None, user_id)]
+            )
+            return result[0]
+
+    @staticmethod
+    def is_revoked_token(payload: dict[str, Any], state: TokenState) -> bool:
+        """Check if token is blacklisted or issued before its user epoch."""
+        return state.blacklisted or payload.get('epoch', 0) < state.epoch
+
+    @staticmethod
+    def get_token_roles(
+        payload: dict[str, Any], state: TokenState
+    ) -> list[Role] | None:
+        """
+        Get roles claimed by token.
+
+        :param payload: Verified token payload.
+        :param state: Token state of the payload.
+        :return: Roles or None if token has no roles or they changed
+            after token was issued.
+        """
+        if (
+            payload.get('roles') is None
+            or payload.get('role_version') != state.role_version
+        ):
+            return None
+        return [Role(role) for role in payload['roles']]
+
+    @staticmethod
+    async def check_revoked_tokens(
+        uow: IInMemoryUnitOfWork, payloads: list[dict[str, Any]]
+    ) -> list[bool]:
+        """
+        Check if tokens are blacklisted or revoked with their user epoch.
+
+        :param uow: In-memory unit of work.
+        :param payloads: Verified token payloads.
+        :return: Token is revoked or not, in the same order.
+        """
+        states = await TokenService.get_token_states(uow, payloads)
+        return [
+            TokenService.is_revoked_token(payload, state)
+            for payload, state in zip(payloads, states)
+        ]
+
+    @staticmethod
+    async def check_revoked_token(
+        uow: IInMemoryUnitOfWork, payload: dict[str, Any]
+    ) -> bool:
+        result = await TokenService.check_revoked_tokens(uow, [payload])
+        return result[0]
+
+    @staticmethod
+    async def get_epoch(uow: IInMemoryUnitOfWork, user_id: int) -> int:
+        async with uow:
+            return await uow.token_state_repository.get_epoch(user_id)
+
+    @staticmethod
+    async def revoke_user_tokens(
+        uow: IInMemoryUnitOfWork, user_id: int
+    ) -> None:
+        async with uow:
+            await uow.token_state_repository.increment_epoch(user_id)
+
     @staticmethod
     async def get_all_blocked_tokens(
         uow: IInMemoryUnitOfWork, offset: int = 0, limit: int = 100
@@ -44,3 +193,21 @@ class TokenService:
             return await uow.blacklist_token_repository.remove_token(
                 token_uuid
             )
+
+    @staticmethod
+    async def compact_blacklist(
+        uow: IInMemoryUnitOfWork, count: int = 1000
+    ) -> dict[str, int]:
+        async with uow:
+            return await uow.blacklist_token_repository.compact_tokens(
+                get_refresh_expires(), count=count
+            )
+
+    @staticmethod
+    async def get_blacklist_memory_usage(
+        uow: IInMemoryUnitOfWork, count: int = 1000
+    ) -> dict[str, int]:
+        async with uow:
+            return await uow.blacklist_token_repository.get_memory_usage(
+                count=count
+            )
@@ -1,6 +1,30 @@
-from app.core.security import get_hashed_password
+from functools import partial
+from typing import Any
+
+from pydantic import ValidationError
+
+from app.core.hasher import password_hasher
+from app.core.principal_cache import principal_cache
 from app.exceptions import AppError
+from app.models.user_models import (
+    Principal,
+    UserCreationWithRoles,
+    UserImportResult,
+    UserImportRowError,
+)
 from app.uow.database import IDatabaseUnitOfWork
+from app.utils.enums import Role
+
+
+def _get_error_messages(error: ValidationError) -> list[str]:
+    messages = []
+    for item in error.errors():
+        location = '.'.join(str(part) for part in item['loc'])
+        if location:
+            messages.append(f'{location}: {item["msg"]}')
+        else:
+            messages.append(item['msg'])
+    return messages
 
 
 class UserService:
@@ -9,12 +33,128 @@ class UserService:
     @staticmethod
     async def add_user(uow: IDatabaseUnitOfWork, data: dict):
         password = data['password']
-        hashed_password = get_hashed_password(password)
+        hashed_password = await password_hasher.hash(password)
         data['password'] = hashed_password
         async with uow:
             user = await uow.user_repository.add_user(data)
             return user
 
+    @staticmethod
+    async def import_users(
+        uow: IDatabaseUnitOfWork, records: list[Any], batch_size: int = 1000
+    ) -> UserImportResult:
+        """
+        Create users with roles from import records in batches.
+
+        Invalid records and taken usernames are reported as row errors
+        without aborting other rows. Passwords of a batch are hashed in
+        parallel, users and roles are inserted with one statement each
+        and every batch is committed separately.
+
+        :param uow: Database unit of work.
+        :param records: Records of :class:`UserCreationWithRoles`.
+        :param batch_size: Number of rows in one batch.
+        :return: Number of created users and row errors.
+        """
+        errors: list[UserImportRowError] = []
+        rows: list[tuple[int, UserCreationWithRoles]] = []
+        usernames: set[str] = set()
+        for number, record in enumerate(records, start=1):
+            username = None
+            if isinstance(record, dict):
+                username = record.get('username')
+            if not isinstance(username, str):
+                username = None
+            try:
+                row = UserCreationWithRoles.model_validate(record)
+            except ValidationError as e:
+                errors.append(
+                    UserImportRowError(
+                        row=number,
+                        username=username,
+                        errors=_get_error_messages(e),
+                    )
+                )
+                continue
+            if row.username in usernames:
+                errors.append(
+                    UserImportRowError(
+                        row=number,
+                        username=username,
+                        errors=['Username is repeated in the file'],
+                    )
+                )
+                continue
+            usernames.add(row.username)
+            rows.append((number, row))
+
+        created = 0
+        for start in range(0, len(rows), batch_size):
+            stop = start + batch_size
+            batch = rows[start:stop]
+            async with uow:
+                existing = await uow.user_repository.get_existing_usernames(
+                    [row.username for _, row in batch]
+                )
+                # Release the connection while passwords are hashed
+                await uow.commit()
+            new_rows = []
+            for number, row in batch:
+                if row.username in existing:
+                    errors.append(
+                        UserImportRowError(
+                            row=number,
+                            username=row.username,
+                            errors=['User already exists'],
+                        )
+                    )
+                else:
+                    new_rows.append((number, row))
+            if not new_rows:
+                continue
+
+            hashed_passwords = await password_hasher.hash_many(
+                [row.password.get_secret_value() for _, row in new_rows]
+            )
+            async with uow:
+                users = await uow.user_repository.add_users(
+                    [
+                        {
+                            'first_name': row.first_name,
+                            'last_name': row.last_name,
+                            'username': row.username,
+                            'password': hashed_password,
+                            'is_active_': True,
+                        }
+                        for (_, row), hashed_password in zip(
+                            new_rows, hashed_passwords
+                        )
+                    ]
+                )
+                user_ids = {user.username: user.id_ for user in users}
+                await uow.role_repository.add_roles(
+                    [
+                        {'user_id': user_ids[row.username], 'role': role}
+                        for _, row in new_rows
+                        if row.username in user_ids
+                        for role in set(row.roles)
+                    ]
+                )
+                await uow.commit()
+            created += len(users)
+            for number, row in new_rows:
+                if row.username not in user_ids:
+                    errors.append(
+                        UserImportRowError(
+                            row=number,
+                            username=row.username,
+                            errors=['User already exists'],
+                        )
+                    )
+
+        errors.sort(key=lambda error: error.row)
+        return UserImportResult(created=created, errors=errors)
+
     @staticmethod
     async def get_user(
         uow: IDatabaseUnitOfWork, only_active: bool = True, **data
@@ -29,6 +169,49 @@ class UserService:
         async with uow:
             return await uow.user_repository.get_user(only_active, id_=user_id)
 
+    @staticmethod
+    async def get_user_with_roles(
+        uow: IDatabaseUnitOfWork, user_id: int, only_active: bool = True
+    ):
+        async with uow:
+            return await uow.user_repository.get_user_with_roles(
+                only_active, id_=user_id
+            )
+
+    @staticmethod
+    async def get_principal(
+        uow: IDatabaseUnitOfWork, user_id: int, role_version: int = 0
+    ) -> Principal:
+        """
+        Get active user with active roles, cached between requests.
+
+        :param uow: Database unit of work, used on cache miss.
+        :param user_id: User id.
+        :param role_version: Role version of user read before the call,
+            cached principals with an older one are reloaded. Updates of
+            the user increment it, so a principal loaded before an update
+            and cached after its invalidation is not used.
+        :return: Principal of user.
+        """
+        principal = await principal_cache.get(user_id, role_version)
+        if principal is not None:
+            return principal
+        async with uow:
+            user = await uow.user_repository.get_user_with_roles(
+                True, id_=user_id
+            )
+        principal = Principal(
+            id_=user.id_,
+            username=user.username,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            is_active=user.is_active,
+            roles=[role.role for role in user.roles],
+            role_version=role_version,
+        )
+        await principal_cache.add(principal)
+        return principal
+
     @staticmethod
     async def get_all_users(
         uow: IDatabaseUnitOfWork,
@@ -56,18 +239,68 @@ class UserService:
                 user_ids, only_active, offset, limit, full_name
             )
 
+    @staticmethod
+    async def get_users_page(
+        uow: IDatabaseUnitOfWork,
+        sort_by: str = 'id',
+        after: tuple[Any, int] = None,
+        offset: int = None,
+        limit: int = None,
+        role: Role = None,
+        is_active: bool | None = True,
+    ):
+        async with uow:
+            return await uow.user_repository.get_users_page(
+                sort_by, after, offset, limit, role, is_active
+            )
+
+    @staticmethod
+    async def get_users_by_role(
+        uow: IDatabaseUnitOfWork,
+        role: Role,
+        only_active: bool = True,
+        after_id: int = None,
+        offset: int = None,
+        limit: int = None,
+        full_name: str = None,
+    ):
+        async with uow:
+            return await uow.user_repository.get_users_by_role(
+                role, only_active, after_id, offset, limit, full_name
+            )
+
+    @staticmethod
+    async def search_users_by_role(
+        uow: IDatabaseUnitOfWork,
+        role: Role,
+        query: str,
+        only_active: bool = True,
+        offset: int = None,
+        limit: int = None,
+    ):
+        async with uow:
+            return await uow.user_repository.search_users_by_role(
+                role, query, only_active, offset, limit
+            )
+
     @staticmethod
     async def update_user(uow: IDatabaseUnitOfWork, user_id: int, data: dict):
         if data.get('password'):
             password = data['password']
-            hashed_password = get_hashed_password(password)
+            hashed_password = await password_hasher.hash(password)
             data['password'] = hashed_password
         if len(data) == 0:
             raise AppError
         async with uow:
+            uow.add_after_commit(
+                partial(principal_cache.invalidate, [user_id])
+            )
             return await uow.user_repository.update_user(user_id, **data)
 
     @staticmethod
     async def delete_user(uow: IDatabaseUnitOfWork, user_id: int):
         async with uow:
+            uow.add_after_commit(
+                partial(principal_cache.invalidate, [user_id])
+            )
             return await uow.user_repository.deactivate_user(user_id)
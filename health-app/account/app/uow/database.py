@@ -1,9 +1,17 @@
-from abc import ABC
-
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.core.db import get_db
-from app.repositories import UserRepository, RoleRepository
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.db import ReplicaRouter, get_db, replica_router
+from app.core.settings import settings
+from app.repositories import (
+    FastRoleRepository,
+    FastUserRepository,
+    RoleRepository,
+    UserRepository,
+)
 from app.repositories.sqlalchemy import IRoleRepository, IUserRepository
 from app.uow.base import IUnitOfWork
 
@@ -14,36 +22,120 @@ class IDatabaseUnitOfWork(IUnitOfWork, ABC):
     role_repository: IRoleRepository
     user_repository: IUserRepository
 
+    @abstractmethod
+    def add_after_commit(self, callback: Callable[[], Awaitable[Any]]):
+        raise NotImplementedError
 
-class SQLAlchemyUOW(IDatabaseUnitOfWork, ABC):
-    """Unit-of-work for SQLModel and SQLAlchemy repositories."""
 
-    def __init__(self, session_factory=get_db):
+class SQLAlchemyUOW(IDatabaseUnitOfWork, ABC):
+    """
+    Unit-of-work for SQLModel and SQLAlchemy repositories.
+
+    The unit of work is re-entrant: nested ``async with`` blocks share
+    one session and transaction, which is committed (or rolled back on
+    error) when the outermost block exits. The session checks out a
+    connection only on the first statement.
+
+    A read-only unit of work reads from a replica selected by the
+    router, its session connects eagerly so an unreachable replica is
+    marked unhealthy and the primary is used instead. Commits with
+    writes start the read-your-writes window of ``consistency_key``.
+
+    A lazy unit of work opens the session in the first nested block,
+    so requests served from caches do not touch the database.
+    Callbacks added with :meth:`add_after_commit` run once the
+    transaction is committed and are dropped on rollback.
+
+    With ``fast_path`` the hottest lookups of users and roles run plain
+    SQL and return immutable records instead of ORM instances.
+    """
+
+    def __init__(
+        self,
+        session_factory=get_db,
+        read_only: bool = False,
+        consistency_key: str | None = None,
+        router: ReplicaRouter = replica_router,
+        lazy: bool = False,
+        fast_path: bool = settings.POSTGRES_FAST_PATH,
+    ):
         self._session = None
+        self._replica: AsyncEngine | None = None
+        self._depth = 0
+        self._after_commit: list[Callable[[], Awaitable[Any]]] = []
 
         self.session_factory = session_factory
+        self.read_only = read_only
+        self.consistency_key = consistency_key
+        self.router = router
+        self.lazy = lazy
+        self.fast_path = fast_path
+
+    async def _create_session(self) -> AsyncSession:
+        self._replica = None
+        if self.read_only:
+            replica = self.router.get_engine(self.consistency_key)
+            if replica is not None:
+                session = await self.session_factory(replica)
+                try:
+                    await session.connection()
+                except (DBAPIError, OSError):
+                    await session.close()
+                    self.router.mark_unhealthy(replica)
+                else:
+                    self._replica = replica
+                    return session
+        return await self.session_factory()
 
     async def __aenter__(self):
-        self._session = await self.session_factory()
-
-        self.user_repository = UserRepository(self.session)
-        self.role_repository = RoleRepository(self.session)
+        if self._session is None and (self._depth > 0 or not self.lazy):
+            self._session = await self._create_session()
+
+            if self.fast_path:
+                self.user_repository = FastUserRepository(self.session)
+                self.role_repository = FastRoleRepository(self.session)
+            else:
+                self.user_repository = UserRepository(self.session)
+                self.role_repository = RoleRepository(self.session)
+        self._depth += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if exc_type is not None:
-            await self.rollback()
-        else:
-            await self.commit()
-        await self._session.close()
-
-        self._session = None
+        self._depth -= 1
+        if self._depth > 0 or self._session is None:
+            return
+        try:
+            if exc_type is not None:
+                if (
+                    self._replica is not None
+                    and isinstance(exc_val, DBAPIError)
+                    and exc_val.connection_invalidated
+                ):
+                    self.router.mark_unhealthy(self._replica)
+                await self.rollback()
+            else:
+                await self.commit()
+        finally:
+            await self._session.close()
+            self._session = None
+            self._replica = None
 
     async def commit(self):
         await self._session.commit()
+        if self._session.info.pop('has_writes', False):
+            self.router.record_write(self.consistency_key)
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            await callback()
 
     async def rollback(self):
         await self._session.rollback()
+        self._session.info.pop('has_writes', None)
+        self._after_commit.clear()
+
+    def add_after_commit(self, callback: Callable[[], Awaitable[Any]]):
+        """Run ``callback`` after the transaction is committed."""
+        self._after_commit.append(callback)
 
     @property
     def session(self) -> AsyncSession | None:
@@ -2,10 +2,26 @@ from abc import ABC
 from typing import Callable
 
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
 
+from app.core.local_storage import LocalStorage, create_local_storage
 from app.core.redis import create_redis
-from app.repositories import BlacklistTokenRepository
-from app.repositories.redis import IBlacklistRepository
+from app.core.settings import settings
+from app.repositories import (
+    BlacklistTokenRepository,
+    PrincipalRepository,
+    TokenStateRepository,
+)
+from app.repositories.local import (
+    LocalBlacklistTokenRepository,
+    LocalPrincipalRepository,
+    LocalTokenStateRepository,
+)
+from app.repositories.redis import (
+    IBlacklistRepository,
+    IPrincipalRepository,
+    ITokenStateRepository,
+)
 from app.uow.base import IUnitOfWork
 
 
@@ -13,29 +29,103 @@ class IInMemoryUnitOfWork(IUnitOfWork, ABC):
     """Interface for in-memory unit of-work."""
 
     blacklist_token_repository: IBlacklistRepository
+    principal_repository: IPrincipalRepository
+    token_state_repository: ITokenStateRepository
 
 
 class RedisUOW(IInMemoryUnitOfWork, ABC):
-    """Redis unit of-work."""
+    """
+    Redis unit of-work.
+
+    Reads are executed at once on the shared client, writes are queued
+    on a pipeline and executed in one MULTI/EXEC round-trip on commit.
+    """
 
     def __init__(self, connection_factory: Callable[[], Redis] = create_redis):
         self.connection_factory = connection_factory
 
         self._connection: Redis | None = None
+        self._pipeline: Pipeline | None = None
 
     async def __aenter__(self) -> IInMemoryUnitOfWork:
         self._connection = self.connection_factory()
+        self._pipeline = self._connection.pipeline(transaction=True)
 
         self.blacklist_token_repository = BlacklistTokenRepository(
-            self._connection
+            self._connection, self._pipeline
+        )
+        self.token_state_repository = TokenStateRepository(
+            self._connection, self._pipeline
+        )
+        self.principal_repository = PrincipalRepository(
+            self._connection, self._pipeline
         )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self._connection.close()
+        if exc_type is not None:
+            await self.rollback()
+        else:
+            await self.commit()
+
+        self._pipeline = None
         self._connection = None
 
     async def commit(self) -> None:
-        await self._connection.execute_command()
+        await self._pipeline.execute()
+
+    async def rollback(self) -> None:
+        await self._pipeline.reset()
+
+
+class LocalUOW(IInMemoryUnitOfWork, ABC):
+    """
+    In-process unit of-work.
+
+    Writes are queued and applied together on commit,
+    data is not shared between processes.
+    """
+
+    def __init__(
+        self,
+        storage_factory: Callable[[], LocalStorage] = create_local_storage,
+    ):
+        self.storage_factory = storage_factory
+
+        self._writes: list[Callable[[], None]] = []
+
+    async def __aenter__(self) -> IInMemoryUnitOfWork:
+        storage = self.storage_factory()
+        self._writes = []
+
+        self.blacklist_token_repository = LocalBlacklistTokenRepository(
+            storage, self._writes
+        )
+        self.token_state_repository = LocalTokenStateRepository(
+            storage, self._writes
+        )
+        self.principal_repository = LocalPrincipalRepository(
+            storage, self._writes
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            await self.rollback()
+        else:
+            await self.commit()
+
+    async def commit(self) -> None:
+        for write in self._writes:
+            write()
+        self._writes.clear()
+
+    async def rollback(self) -> None:
+        self._writes.clear()
+
 
-    async def rollback(self) -> None: ...
+def create_inmemory_uow() -> IInMemoryUnitOfWork:
+    """Create and initialize InMemory Unit Of Work instance."""
+    if settings.INMEMORY_BACKEND == 'local':
+        return LocalUOW()
+    return RedisUOW()
@@ -16,6 +16,7 @@ class TokenStatus(str, Enum):
     ACTIVE = 'active'
     EXPIRED = 'expired'
     BLACKLISTED = 'blacklisted'
+    INVALID = 'invalid'
 
 
 class TokenType(str, Enum):
@@ -0,0 +1,34 @@
+import base64
+import json
+from typing import Any
+
+from app.exceptions import InvalidCursorError
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    """
+    Encode keyset pagination cursor.
+
+    :param values: Sort key values of the last row of the page.
+    :return: Opaque URL-safe cursor.
+    """
+    data = json.dumps(values, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, keys: set[str]) -> dict[str, Any]:
+    """
+    Decode keyset pagination cursor.
+
+    :param cursor: Cursor from the previous page.
+    :param keys: Expected sort keys.
+    :return: Sort key values of the last row of the previous page.
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(data)
+    except ValueError:
+        raise InvalidCursorError
+    if not isinstance(values, dict) or set(values) != keys:
+        raise InvalidCursorError
+    return values
@@ -0,0 +1,69 @@
+import csv
+import io
+import json
+from typing import Any
+
+from app.exceptions import InvalidImportFileError
+
+MEDIA_TYPES = ('application/json', 'application/x-ndjson', 'text/csv')
+
+
+def parse_records(
+    content: bytes,
+    media_type: str,
+    list_fields: tuple[str, ...] = (),
+    max_rows: int | None = None,
+) -> list[Any]:
+    """
+    Parse records of JSON array, NDJSON or CSV file.
+
+    CSV fields are strings, items of CSV list fields are separated by
+    ``;``. A malformed NDJSON line or CSV row is parsed as None,
+    so other records are kept.
+
+    :param content: File content in UTF-8.
+    :param media_type: File media type, parameters are ignored.
+    :param list_fields: CSV fields parsed as lists.
+    :param max_rows: Maximum number of records.
+    :return: Records in file order.
+    """
+    media_type = media_type.split(';')[0].strip().lower()
+    if media_type not in MEDIA_TYPES:
+        raise InvalidImportFileError
+    try:
+        text = content.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        raise InvalidImportFileError
+
+    records: list[Any]
+    if media_type == 'application/json':
+        try:
+            records = json.loads(text)
+        except ValueError:
+            raise InvalidImportFileError
+        if not isinstance(records, list):
+            raise InvalidImportFileError
+    elif media_type == 'application/x-ndjson':
+        records = []
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                records.append(None)
+    else:
+        records = []
+        for row in csv.DictReader(io.StringIO(text)):
+            if None in row:
+                records.append(None)
+                continue
+            for field in list_fields:
+                if row.get(field) is not None:
+                    items = [item.strip() for item in row[field].split(';')]
+                    row[field] = [item for item in items if item]
+            records.append(row)
+
+    if max_rows is not None and len(records) > max_rows:
+        raise InvalidImportFileError
+    return records
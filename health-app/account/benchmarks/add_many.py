@@ -0,0 +1,128 @@
+"""
+Benchmark of bulk inserts of database repositories.
+
+Usage::
+
+    python -m benchmarks.add_many --sizes 10 1000 100000
+
+Users are inserted into the configured database in transactions, which
+are rolled back. ``legacy`` is the former ``add_many``: one ``add`` per
+instance, flush and one ``SELECT`` per instance to refresh it.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
+
+from app.core.settings import settings
+from app.models.user_models import User
+from app.repositories import UserRepository
+
+METHODS = ('legacy', 'add_many', 'upsert_many')
+
+
+def get_datas(size: int) -> list[dict[str, Any]]:
+    return [
+        {
+            'first_name': 'Bench',
+            'last_name': 'Mark',
+            'username': f'bench-{uuid.uuid4().hex}',
+            'password': '-',
+        }
+        for _ in range(size)
+    ]
+
+
+async def legacy_add_many(
+    session: AsyncSession, datas: list[dict[str, Any]]
+) -> list[User]:
+    instances = [User(**data) for data in datas]
+    session.add_all(instances)
+    await session.flush()
+    for instance in instances:
+        await session.refresh(instance)
+    return instances
+
+
+async def measure(engine: AsyncEngine, method: str, size: int) -> dict:
+    """
+    Insert users with one method and measure it.
+
+    :param engine: Database engine.
+    :param method: One of :data:`METHODS`.
+    :param size: Number of users.
+    :return: Number of statements sent to the database and latency.
+    """
+    statements = 0
+
+    def count(*_) -> None:
+        nonlocal statements
+        statements += 1
+
+    datas = get_datas(size)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        repository = UserRepository(session)
+        event.listen(engine.sync_engine, 'before_cursor_execute', count)
+        try:
+            started = time.perf_counter()
+            if method == 'legacy':
+                await legacy_add_many(session, datas)
+            elif method == 'add_many':
+                await repository.add_many(*datas)
+            else:
+                await repository.upsert_many(
+                    datas,
+                    index_elements=['username'],
+                    update_columns=['first_name', 'last_name'],
+                )
+            seconds = time.perf_counter() - started
+        finally:
+            event.remove(engine.sync_engine, 'before_cursor_execute', count)
+            await session.rollback()
+    return {
+        'method': method,
+        'rows': size,
+        'round_trips': statements,
+        'seconds': round(seconds, 4),
+    }
+
+
+async def main(sizes: list[int], legacy_max_rows: int) -> None:
+    engine = create_async_engine(settings.POSTGRES_URL)
+    try:
+        for size in sizes:
+            for method in METHODS:
+                if method == 'legacy' and size > legacy_max_rows:
+                    continue
+                print(json.dumps(await measure(engine, method, size)))
+    finally:
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '--sizes',
+        type=int,
+        nargs='+',
+        default=[10, 1000, 100000],
+        help='numbers of inserted rows',
+    )
+    parser.add_argument(
+        '--legacy-max-rows',
+        type=int,
+        default=1000,
+        help='largest size measured with the legacy method',
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.legacy_max_rows))
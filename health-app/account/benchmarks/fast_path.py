@@ -0,0 +1,123 @@
+"""
+Benchmark of ORM and fast path lookups of users and roles.
+
+Usage::
+
+    python -m benchmarks.fast_path --calls 5000
+
+Lookups of the first active user run against the configured database
+in one transaction, which is rolled back. CPU time per call is
+measured with :func:`time.process_time`, so waiting for the database
+is not counted and the difference is the saved client-side work.
+The identity map is cleared after every call, as every request of the
+service starts with a new session.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.db import create_engine
+from app.core.settings import settings
+from app.repositories import (
+    FastRoleRepository,
+    FastUserRepository,
+    RoleRepository,
+    UserRepository,
+)
+
+LOOKUPS = ('user_by_id', 'user_by_username', 'roles', 'user_with_roles')
+
+
+def get_lookup(
+    lookup: str,
+    users: UserRepository,
+    roles: RoleRepository,
+    user_id: int,
+    username: str,
+) -> Callable[[], Awaitable]:
+    if lookup == 'user_by_id':
+        return lambda: users.get_user(id_=user_id)
+    if lookup == 'user_by_username':
+        return lambda: users.get_user(username=username)
+    if lookup == 'roles':
+        return lambda: roles.get_roles(user_id)
+    return lambda: users.get_user_with_roles(id_=user_id)
+
+
+async def measure(engine: AsyncEngine, calls: int) -> list[dict]:
+    """
+    Run every lookup with both repositories and measure them.
+
+    :param engine: Database engine.
+    :param calls: Number of calls of every lookup.
+    :return: CPU and wall time per call in microseconds.
+    """
+    results = []
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        try:
+            user = await UserRepository(session).get_all_users(limit=1)
+            if not user:
+                raise SystemExit('Benchmark needs at least one active user')
+            user_id, username = user[0].id_, user[0].username
+            session.expunge_all()
+            implementations = {
+                'orm': (UserRepository(session), RoleRepository(session)),
+                'fast_path': (
+                    FastUserRepository(session),
+                    FastRoleRepository(session),
+                ),
+            }
+            for lookup in LOOKUPS:
+                for name, (users, roles) in implementations.items():
+                    call = get_lookup(lookup, users, roles, user_id, username)
+                    # Warm up statement caches
+                    for _ in range(10):
+                        await call()
+                        session.expunge_all()
+                    started = time.perf_counter()
+                    cpu_started = time.process_time()
+                    for _ in range(calls):
+                        await call()
+                        session.expunge_all()
+                    cpu_seconds = time.process_time() - cpu_started
+                    seconds = time.perf_counter() - started
+                    results.append(
+                        {
+                            'lookup': lookup,
+                            'implementation': name,
+                            'calls': calls,
+                            'cpu_us_per_call': round(
+                                cpu_seconds / calls * 1e6, 1
+                            ),
+                            'us_per_call': round(seconds / calls * 1e6, 1),
+                        }
+                    )
+        finally:
+            await session.rollback()
+    return results
+
+
+async def main(calls: int) -> None:
+    engine = create_engine(settings.POSTGRES_URL)
+    try:
+        for result in await measure(engine, calls):
+            print(json.dumps(result))
+    finally:
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '--calls',
+        type=int,
+        default=5000,
+        help='number of calls of every lookup',
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.calls))
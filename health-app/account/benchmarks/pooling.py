@@ -0,0 +1,116 @@
+"""
+Benchmark of direct and PgBouncer pooled database connections.
+
+Usage::
+
+    python -m benchmarks.pooling --pooled-url URL --workers 50 --seconds 10
+
+Workers run short read transactions, like the user lookup of every
+authenticated request, through the direct engine with the settings
+profile and through the transaction pooler with ``POSTGRES_PGBOUNCER``
+options, then throughput and latency of both are printed.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.db import create_engine
+from app.core.settings import settings
+
+STATEMENT = text('SELECT id, username FROM users WHERE id = :user_id')
+
+
+async def worker(
+    engine: AsyncEngine, deadline: float, latencies: list[float]
+) -> None:
+    user_id = 0
+    while time.perf_counter() < deadline:
+        user_id += 1
+        started = time.perf_counter()
+        async with engine.begin() as connection:
+            await connection.execute(STATEMENT, {'user_id': user_id})
+        latencies.append(time.perf_counter() - started)
+
+
+async def measure(
+    name: str, engine: AsyncEngine, workers: int, seconds: float
+) -> dict:
+    """
+    Run transactions of concurrent workers and measure them.
+
+    :param name: Name of the measured setup.
+    :param engine: Database engine.
+    :param workers: Number of concurrent workers.
+    :param seconds: Duration of the run.
+    :return: Transactions per second and latency percentiles.
+    """
+    latencies: list[float] = []
+    try:
+        # Warm up the pool before measuring
+        await asyncio.gather(
+            *(
+                worker(engine, time.perf_counter() + 1, [])
+                for _ in range(workers)
+            )
+        )
+        deadline = time.perf_counter() + seconds
+        await asyncio.gather(
+            *(worker(engine, deadline, latencies) for _ in range(workers))
+        )
+    finally:
+        await engine.dispose()
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        'setup': name,
+        'workers': workers,
+        'transactions_per_second': round(len(latencies) / seconds, 1),
+        'p50_ms': round(quantiles[49] * 1000, 2),
+        'p99_ms': round(quantiles[98] * 1000, 2),
+    }
+
+
+async def main(
+    direct_url: str, pooled_url: str, workers: int, seconds: float
+) -> None:
+    config = settings.model_copy(
+        update={
+            'POSTGRES_ECHO': False,
+            'POSTGRES_POOL_SIZE': workers,
+            'POSTGRES_MAX_OVERFLOW': 0,
+        }
+    )
+    pooled_config = config.model_copy(update={'POSTGRES_PGBOUNCER': True})
+    setups = [
+        ('direct', create_engine(direct_url, config)),
+        ('pgbouncer', create_engine(pooled_url, pooled_config)),
+    ]
+    for name, engine in setups:
+        print(json.dumps(await measure(name, engine, workers, seconds)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '--direct-url',
+        default=settings.POSTGRES_URL,
+        help='database URL, by default from the settings',
+    )
+    parser.add_argument(
+        '--pooled-url', required=True, help='PgBouncer URL of the database'
+    )
+    parser.add_argument(
+        '--workers', type=int, default=50, help='concurrent workers'
+    )
+    parser.add_argument(
+        '--seconds', type=float, default=10, help='duration of each run'
+    )
+    args = parser.parse_args()
+    asyncio.run(
+        main(args.direct_url, args.pooled_url, args.workers, args.seconds)
+    )
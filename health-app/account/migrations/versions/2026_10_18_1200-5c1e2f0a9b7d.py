@@ -0,0 +1,37 @@
+"""add index of active roles by role
+
+Revision ID: 5c1e2f0a9b7d
+Revises: 23a978409d88
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e2f0a9b7d'
+down_revision: Union[str, None] = '23a978409d88'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_user_role_active_role_user_id',
+        'user_role',
+        ['role', 'user_id'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_user_role_active_role_user_id',
+        table_name='user_role',
+        postgresql_where=sa.text('is_active'),
+    )
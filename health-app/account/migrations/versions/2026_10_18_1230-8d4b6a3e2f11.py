@@ -0,0 +1,32 @@
+"""add indexes for users keyset pagination
+
+Revision ID: 8d4b6a3e2f11
+Revises: 5c1e2f0a9b7d
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d4b6a3e2f11'
+down_revision: Union[str, None] = '5c1e2f0a9b7d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_users_first_name_id', 'users', ['first_name', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_users_last_name_id', 'users', ['last_name', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_last_name_id', table_name='users')
+    op.drop_index('ix_users_first_name_id', table_name='users')
@@ -0,0 +1,39 @@
+"""add trigram index for users full name search
+
+Revision ID: b7e9c4d2a6f3
+Revises: 8d4b6a3e2f11
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e9c4d2a6f3'
+down_revision: Union[str, None] = '8d4b6a3e2f11'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_users_full_name_trgm',
+        'users',
+        [
+            sa.literal_column("(first_name || ' ' || last_name)").label(
+                'full_name'
+            )
+        ],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'full_name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_full_name_trgm', table_name='users')
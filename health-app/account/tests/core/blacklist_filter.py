@@ -0,0 +1,98 @@
+import uuid
+
+import pytest
+
+from app.core.blacklist_filter import BlacklistFilter, BloomFilter
+from app.services import TokenService
+from tests.repositories.blacklist_token import (  # noqa: F401
+    mock_blacklist_token_repository,
+)
+from tests.repositories.principal import (  # noqa: F401
+    mock_principal_repository,
+)
+from tests.repositories.token_state import (  # noqa: F401
+    mock_token_state_repository,
+)
+from tests.utils.uow import mock_inmemory_uow  # noqa: F401
+
+
+@pytest.fixture(scope='function')
+def blacklist_filter():
+    return BlacklistFilter(capacity=1000, error_rate=0.001)
+
+
+@pytest.fixture(scope='function')
+def ready_blacklist_filter(blacklist_filter):
+    blacklist_filter._bloom = BloomFilter(
+        blacklist_filter.capacity, blacklist_filter.error_rate
+    )
+    return blacklist_filter
+
+
+class TestBloomFilter:
+    @staticmethod
+    def test_no_false_negatives():
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [str(uuid.uuid4()) for _ in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+        assert bloom.count == 1000
+
+    @staticmethod
+    def test_error_rate():
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for _ in range(1000):
+            bloom.add(str(uuid.uuid4()))
+
+        false_positives = sum(str(uuid.uuid4()) in bloom for _ in range(10000))
+        assert false_positives < 300
+
+
+class TestBlacklistFilter:
+    @staticmethod
+    def test_might_contain_not_ready(blacklist_filter):
+        assert blacklist_filter.is_ready is False
+        assert blacklist_filter.might_contain(uuid.uuid4()) is True
+
+    @staticmethod
+    def test_might_contain(ready_blacklist_filter):
+        token_uuid = uuid.uuid4()
+        ready_blacklist_filter.add(token_uuid)
+
+        assert ready_blacklist_filter.might_contain(token_uuid) is True
+        assert ready_blacklist_filter.might_contain(str(token_uuid)) is True
+        assert ready_blacklist_filter.might_contain(uuid.uuid4()) is False
+
+        stats = ready_blacklist_filter.get_stats()
+        assert stats['ready'] is True
+        assert stats['tokens'] == 1
+        assert stats['filtered'] == 1
+        assert stats['passed'] == 2
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_service_skips_redis(
+        ready_blacklist_filter, mock_inmemory_uow, monkeypatch
+    ):
+        monkeypatch.setattr(
+            'app.services.token_service.blacklist_filter',
+            ready_blacklist_filter,
+        )
+        token_uuid = uuid.uuid4()
+        ready_blacklist_filter.add(token_uuid)
+        repository = mock_inmemory_uow.blacklist_token_repository
+        repository.exists_tokens.return_value = [True]
+
+        result = await TokenService.check_blacklist_token(
+            mock_inmemory_uow, uuid.uuid4()
+        )
+        results = await TokenService.check_blacklist_tokens(
+            mock_inmemory_uow, [uuid.uuid4(), token_uuid]
+        )
+
+        assert result is False
+        assert results == [False, True]
+        repository.exists_token.assert_not_called()
+        repository.exists_tokens.assert_called_once_with([token_uuid])
@@ -0,0 +1,151 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from app.core.db import (
+    CompiledCacheStats,
+    PoolStatsMixin,
+    ReplicaRouter,
+    get_engine_options,
+)
+from app.core.settings import Mode, settings
+
+
+class StatsQueuePool(PoolStatsMixin, QueuePool):
+    """Queue pool with checkout statistics."""
+
+    ...  # fmt: off
+
+
+@pytest.fixture(scope='function')
+def replicas():
+    return [MagicMock(name='first'), MagicMock(name='second')]
+
+
+class TestReplicaRouter:
+    @staticmethod
+    def test_round_robin(replicas):
+        router = ReplicaRouter(replicas)
+
+        engines = [router.get_engine() for _ in range(4)]
+
+        assert engines == replicas * 2
+
+    @staticmethod
+    def test_least_connections(replicas):
+        replicas[0].pool.checkedout.return_value = 3
+        replicas[1].pool.checkedout.return_value = 1
+        router = ReplicaRouter(replicas, strategy='least_connections')
+
+        assert router.get_engine() is replicas[1]
+
+    @staticmethod
+    def test_unhealthy_replica_skipped(replicas):
+        router = ReplicaRouter(replicas)
+
+        router.mark_unhealthy(replicas[0])
+        router.mark_unhealthy(replicas[1])
+
+        assert router.get_engine() is None
+        assert router.get_stats()['unhealthy'] == 2
+
+    @staticmethod
+    def test_read_your_writes(replicas):
+        router = ReplicaRouter(replicas)
+
+        router.record_write('writer')
+
+        assert router.get_engine('writer') is None
+        assert router.get_engine('reader') in replicas
+
+    @staticmethod
+    def test_read_your_writes_expired(replicas):
+        router = ReplicaRouter(replicas, read_your_writes_seconds=0)
+
+        router.record_write('writer')
+
+        assert router.get_engine('writer') in replicas
+
+
+class TestEngineOptions:
+    @staticmethod
+    def test_production_profile():
+        config = settings.model_copy(update={'MODE': Mode.PRODUCTION})
+
+        options = get_engine_options(config)
+
+        assert options['echo'] is False
+        assert options['pool_pre_ping'] is True
+
+    @staticmethod
+    def test_settings_override_profile():
+        config = settings.model_copy(
+            update={
+                'MODE': Mode.DEVELOPMENT,
+                'POSTGRES_ECHO': False,
+                'POSTGRES_POOL_SIZE': 7,
+                'POSTGRES_STATEMENT_CACHE_SIZE': 0,
+                'POSTGRES_COMPILED_CACHE_SIZE': 50,
+            }
+        )
+
+        options = get_engine_options(config)
+
+        assert options['echo'] is False
+        assert options['pool_size'] == 7
+        assert options['query_cache_size'] == 50
+        assert options['connect_args'] == {'prepared_statement_cache_size': 0}
+
+    @staticmethod
+    def test_pgbouncer_options():
+        config = settings.model_copy(update={'POSTGRES_PGBOUNCER': True})
+
+        connect_args = get_engine_options(config)['connect_args']
+        get_name = connect_args['prepared_statement_name_func']
+
+        assert connect_args['statement_cache_size'] == 0
+        assert connect_args['prepared_statement_cache_size'] == 0
+        assert get_name() != get_name()
+
+
+class TestPoolStats:
+    @staticmethod
+    def test_checkout_and_timeout():
+        pool = StatsQueuePool(
+            MagicMock, pool_size=1, max_overflow=0, timeout=0.01
+        )
+
+        connection = pool.connect()
+        with pytest.raises(PoolTimeoutError):
+            pool.connect()
+        stats = pool.get_stats()
+        connection.close()
+
+        assert stats['checkouts'] == 1
+        assert stats['timeouts'] == 1
+        assert stats['checked_out'] == 1
+        assert pool.get_stats()['checked_out'] == 0
+
+
+class TestCompiledCacheStats:
+    @staticmethod
+    def test_hits_and_misses():
+        sync_engine = create_engine('sqlite://')
+        stats = CompiledCacheStats()
+        stats.attach(MagicMock(sync_engine=sync_engine))
+
+        with sync_engine.connect() as connection:
+            for _ in range(3):
+                connection.execute(select(1))
+            connection.exec_driver_sql('SELECT 2')
+            connection.execute(text('SELECT 3'))
+
+        result = stats.get_stats()
+        assert result['misses'] == 2
+        assert result['hits'] == 2
+        assert result['uncached'] == 1
+        assert result['size'] == 2
+        assert result['hit_ratio'] == 0.5
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from app.core.hasher import PasswordHasher
+from app.core.security import get_hashed_password
+from app.exceptions import OverloadedError
+
+
+@pytest.fixture(scope='function')
+def password_hasher():
+    hasher = PasswordHasher(executor='thread', workers=1, queue_size=1)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+class TestPasswordHasher:
+    @staticmethod
+    async def test_hash_correct(password_hasher):
+        hashed_password = await password_hasher.hash('Password12/')
+
+        assert hashed_password != 'Password12/'
+        assert await password_hasher.verify('Password12/', hashed_password)
+
+    @staticmethod
+    async def test_hash_many_correct(password_hasher):
+        passwords = ['Password12/', 'Password34/', 'Password56/']
+
+        hashed_passwords = await password_hasher.hash_many(passwords)
+
+        assert len(hashed_passwords) == len(passwords)
+        for password, hashed_password in zip(passwords, hashed_passwords):
+            assert await password_hasher.verify(password, hashed_password)
+
+    @staticmethod
+    async def test_hash_many_leaves_worker_free():
+        hasher = PasswordHasher(executor='thread', workers=3, queue_size=10)
+        running = 0
+        max_running = 0
+        hash_password = hasher.hash
+
+        async def hash(password):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            try:
+                return await hash_password(password)
+            finally:
+                running -= 1
+
+        hasher.hash = hash
+        try:
+            hashed_passwords = await hasher.hash_many(['Password12/'] * 5)
+        finally:
+            hasher.shutdown()
+
+        assert len(hashed_passwords) == 5
+        assert max_running == 2
+
+    @staticmethod
+    async def test_verify_incorrect(password_hasher):
+        hashed_password = get_hashed_password('Password12/')
+
+        result = await password_hasher.verify('Password12', hashed_password)
+
+        assert result is False
+
+    @staticmethod
+    async def test_overloaded(password_hasher):
+        calls = [password_hasher.hash('Password12/') for _ in range(3)]
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        errors = [r for r in results if isinstance(r, OverloadedError)]
+        assert len(errors) == 1
+        assert password_hasher.get_stats()['rejected'] == 1
+
+    @staticmethod
+    async def test_stats(password_hasher):
+        await password_hasher.hash('Password12/')
+
+        stats = password_hasher.get_stats()
+
+        assert stats['hash']['calls'] == 1
+        assert stats['verify']['calls'] == 0
+        assert stats['pending'] == 0
@@ -0,0 +1,61 @@
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.core.keys import KeySet
+
+
+@pytest.fixture(scope='module')
+def rsa_keys():
+    return [
+        rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        for _ in range(2)
+    ]
+
+
+@pytest.fixture(scope='function')
+def key_set(rsa_keys):
+    new_key, old_key = rsa_keys
+    return KeySet(
+        'RS256',
+        new_key,
+        'new',
+        {'new': new_key.public_key(), 'old': old_key.public_key()},
+    )
+
+
+class TestKeySet:
+    @staticmethod
+    def test_get_verification_key(key_set, rsa_keys):
+        token = jwt.encode(
+            {'sub': 'username'},
+            rsa_keys[1],
+            algorithm='RS256',
+            headers={'kid': 'old'},
+        )
+        key_id = jwt.get_unverified_header(token)['kid']
+        key = key_set.get_verification_key(key_id)
+
+        payload = jwt.decode(token, key, algorithms=['RS256'])
+
+        assert payload['sub'] == 'username'
+
+    @staticmethod
+    def test_get_verification_key_unknown(key_set):
+        assert key_set.get_verification_key('unknown') is None
+
+    @staticmethod
+    def test_get_jwks(key_set):
+        jwks = key_set.get_jwks()
+
+        assert {key['kid'] for key in jwks['keys']} == {'new', 'old'}
+        for key in jwks['keys']:
+            assert key['kty'] == 'RSA'
+            assert key['alg'] == 'RS256'
+            assert 'd' not in key
+
+    @staticmethod
+    def test_get_jwks_symmetric():
+        key_set = KeySet('HS256', 'secret')
+
+        assert key_set.get_jwks() == {'keys': []}
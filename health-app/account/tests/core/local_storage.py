@@ -0,0 +1,88 @@
+import time
+
+import pytest
+
+from app.core.local_storage import LocalStorage
+
+
+@pytest.fixture(scope='function')
+def local_storage():
+    return LocalStorage(max_size=2)
+
+
+class TestLocalStorage:
+    @staticmethod
+    def test_set_get(local_storage):
+        local_storage.set('key', 'value')
+
+        assert local_storage.get('key') == 'value'
+        assert local_storage.ttl('key') == -1
+        assert local_storage.get('missing') is None
+        assert local_storage.ttl('missing') == -2
+
+    @staticmethod
+    def test_expiry(local_storage):
+        local_storage.set('expired', 'value', exat=int(time.time()) - 1)
+        local_storage.set('alive', 'value', ex=60)
+
+        assert local_storage.get('expired') is None
+        assert 0 < local_storage.ttl('alive') <= 60
+
+    @staticmethod
+    def test_keepttl_and_incr(local_storage):
+        local_storage.set('key', 'value', ex=60)
+        local_storage.set('key', 'other', keepttl=True)
+
+        assert local_storage.get('key') == 'other'
+        assert local_storage.ttl('key') > 0
+        assert local_storage.incr('counter') == 1
+        assert local_storage.incr('counter') == 2
+
+    @staticmethod
+    def test_lru_eviction(local_storage):
+        local_storage.set('key1', 'value')
+        local_storage.set('key2', 'value')
+        local_storage.get('key1')
+        local_storage.set('key3', 'value')
+
+        assert local_storage.get('key1') == 'value'
+        assert local_storage.get('key2') is None
+        assert local_storage.get_stats()['evictions'] == 1
+
+    @staticmethod
+    def test_scan_iter_and_purge(local_storage):
+        local_storage.set('prefix:1', 'value', exat=int(time.time()) - 1)
+        local_storage.set('prefix:2', 'value')
+
+        assert list(local_storage.scan_iter('prefix:*')) == ['prefix:2']
+        assert local_storage.purge() == 1
+        assert local_storage.get_stats()['size'] == 1
+
+    @staticmethod
+    def test_unevictable_keys_kept(local_storage):
+        local_storage.set('revoked', 'value', ex=60, evictable=False)
+        local_storage.incr('epoch', evictable=False)
+        local_storage.set('key1', 'value')
+        local_storage.set('key2', 'value')
+        local_storage.set('key3', 'value')
+        local_storage.incr('epoch')
+
+        assert local_storage.get('revoked') == 'value'
+        assert local_storage.get('epoch') == '2'
+        assert local_storage.get('key1') is None
+        assert local_storage.get_stats()['pinned'] == 2
+        assert local_storage.get_stats()['evictions'] == 1
+
+    @staticmethod
+    def test_unevictable_keys_expire(local_storage):
+        expired_at = int(time.time()) - 1
+        local_storage.set(
+            'revoked1', 'value', exat=expired_at, evictable=False
+        )
+        local_storage.set(
+            'revoked2', 'value', exat=expired_at, evictable=False
+        )
+        local_storage.set('revoked3', 'value', ex=60, evictable=False)
+
+        assert local_storage.get_stats()['pinned'] == 1
+        assert local_storage.get('revoked3') == 'value'
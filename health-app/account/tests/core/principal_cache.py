@@ -0,0 +1,117 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.core.local_storage import LocalStorage
+from app.core.principal_cache import PrincipalCache
+from app.models.user_models import Principal
+from app.uow.inmemory import LocalUOW
+from app.utils.enums import Role
+
+
+@pytest.fixture(scope='function')
+def storage():
+    return LocalStorage(max_size=100)
+
+
+@pytest.fixture(scope='function')
+def principal_cache(storage):
+    return PrincipalCache(
+        max_size=2,
+        local_ttl=60,
+        ttl=300,
+        uow_factory=lambda: LocalUOW(lambda: storage),
+    )
+
+
+def get_principal(user_id: int) -> Principal:
+    return Principal(
+        id_=user_id,
+        username=f'user{user_id}',
+        first_name='first',
+        last_name='last',
+        roles=[Role.ADMIN],
+    )
+
+
+@pytest.mark.asyncio
+class TestPrincipalCache:
+    @staticmethod
+    async def test_get_local(principal_cache):
+        await principal_cache.add(get_principal(1))
+
+        principal = await principal_cache.get(1)
+
+        assert principal.roles == [Role.ADMIN]
+        assert principal_cache.get_stats()['local_hits'] == 1
+
+    @staticmethod
+    async def test_get_shared(principal_cache):
+        await principal_cache.add(get_principal(1))
+        principal_cache.clear()
+
+        principal = await principal_cache.get(1)
+
+        assert principal.username == 'user1'
+        assert principal_cache.get_stats()['hits'] == 1
+        assert principal_cache.get_stats()['size'] == 1
+
+    @staticmethod
+    async def test_get_missing(principal_cache):
+        assert await principal_cache.get(1) is None
+        assert principal_cache.get_stats()['misses'] == 1
+
+    @staticmethod
+    async def test_get_local_expired(principal_cache):
+        await principal_cache.add(get_principal(1))
+
+        with patch('time.monotonic', return_value=float('inf')):
+            assert principal_cache._get_local(1) is None
+
+    @staticmethod
+    async def test_evicts_least_recently_used(principal_cache):
+        for user_id in (1, 2, 3):
+            await principal_cache.add(get_principal(user_id))
+
+        assert principal_cache._get_local(1) is None
+        assert principal_cache._get_local(3) is not None
+
+    @staticmethod
+    async def test_invalidate(principal_cache):
+        await principal_cache.add(get_principal(1))
+        await principal_cache.add(get_principal(2))
+
+        await principal_cache.invalidate([1, 1])
+
+        assert await principal_cache.get(1) is None
+        assert await principal_cache.get(2) is not None
+        assert principal_cache.get_stats()['invalidations'] == 1
+
+    @staticmethod
+    async def test_get_stale_role_version(principal_cache):
+        await principal_cache.add(get_principal(1))
+
+        assert await principal_cache.get(1, role_version=1) is None
+        assert await principal_cache.get(1, role_version=0) is not None
+
+    @staticmethod
+    async def test_invalidate_increments_version(principal_cache, storage):
+        await principal_cache.invalidate([1])
+
+        async with LocalUOW(lambda: storage) as uow:
+            states = await uow.token_state_repository.get_states([(None, 1)])
+
+        assert states[0].role_version == 1
+
+    @staticmethod
+    async def test_principal_loaded_before_invalidation_stale(
+        principal_cache, storage
+    ):
+        # Principal is loaded with version 0, then user is updated
+        await principal_cache.invalidate([1])
+        await principal_cache.add(get_principal(1))
+
+        async with LocalUOW(lambda: storage) as uow:
+            states = await uow.token_state_repository.get_states([(None, 1)])
+
+        assert await principal_cache.get(1, states[0].role_version) is None
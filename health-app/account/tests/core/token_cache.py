@@ -0,0 +1,51 @@
+import time
+
+import pytest
+
+from app.core.security import create_access_token, decode_token
+from app.core.token_cache import TokenCache
+
+
+@pytest.fixture(scope='function')
+def token_cache():
+    return TokenCache(max_size=2)
+
+
+class TestTokenCache:
+    @staticmethod
+    def test_get_correct(token_cache):
+        token_cache.add('token', {'jti': '1', 'exp': time.time() + 60})
+
+        payload = token_cache.get('token')
+
+        assert payload['jti'] == '1'
+        assert token_cache.get_stats()['hits'] == 1
+
+    @staticmethod
+    def test_get_expired(token_cache):
+        token_cache.add('token', {'jti': '1', 'exp': time.time() - 1})
+
+        assert token_cache.get('token') is None
+        assert token_cache.get_stats()['size'] == 0
+
+    @staticmethod
+    def test_lru_eviction(token_cache):
+        exp = time.time() + 60
+        token_cache.add('token1', {'jti': '1', 'exp': exp})
+        token_cache.add('token2', {'jti': '2', 'exp': exp})
+        token_cache.get('token1')
+        token_cache.add('token3', {'jti': '3', 'exp': exp})
+
+        assert token_cache.get('token1') is not None
+        assert token_cache.get('token2') is None
+        assert token_cache.get('token3') is not None
+
+    @staticmethod
+    def test_decode_token_cached():
+        token = create_access_token(1, 'username')
+
+        first_payload = decode_token(token)
+        first_payload['user_id'] = 2
+        second_payload = decode_token(token)
+
+        assert second_payload['user_id'] == 1
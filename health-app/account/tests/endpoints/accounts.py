@@ -1,7 +1,16 @@
+from unittest.mock import patch
+
 import pytest
 
+from app.core.security import create_access_token
+from app.utils.enums import Role
 from tests.app import client, event_loop, settings, mock_settings  # noqa: F401
-from tests.models.user import user_add_fixtures, user_instance  # noqa: F401
+from tests.models.user import (  # noqa: F401
+    doctor_instance,
+    principal_instance,
+    user_add_fixtures,
+    user_instance,
+)
 from tests.models.role import role_instance  # noqa: F401
 from tests.models.tokens import access_token, access_auth_header  # noqa: F401
 from tests.services.role import mock_role_service
@@ -33,12 +42,108 @@ class TestAccounts:
 
         assert response.status_code == 200
 
+    @staticmethod
+    def test_get_all_users_invalid_cursor(client, access_auth_header):
+        response = client.get(
+            '/api/accounts/',
+            params={'cursor': 'eyJpZCI6MX0', 'sort_by': 'username'},
+            headers=access_auth_header,
+        )
+
+        assert response.status_code == 400
+
     @staticmethod
     def test_get_all_users_correct(client, access_auth_header):
         response = client.get('/api/accounts/', headers=access_auth_header)
 
         assert response.status_code == 200
 
+    @staticmethod
+    def test_get_all_users_trusts_token_roles(client):
+        access_token = create_access_token(
+            1, 'username', roles=[Role.USER], role_version=0
+        )
+
+        response = client.get(
+            '/api/accounts/',
+            headers={'Authorization': f'Bearer {access_token}'},
+        )
+
+        assert response.status_code == 403
+
+    @staticmethod
+    def test_get_all_users_ignores_stale_token_roles(client):
+        access_token = create_access_token(
+            1, 'username', roles=[Role.USER], role_version=-1
+        )
+
+        response = client.get(
+            '/api/accounts/',
+            headers={'Authorization': f'Bearer {access_token}'},
+        )
+
+        assert response.status_code == 200
+
+    @staticmethod
+    def test_import_users_correct(client, access_auth_header):
+        response = client.post(
+            '/api/accounts/import',
+            headers={**access_auth_header, 'Content-Type': 'text/csv'},
+            content=(
+                'first_name,last_name,username,password,roles\n'
+                'first,last,user,Password12/,doctor\n'
+            ),
+        )
+
+        assert response.status_code == 200
+        assert response.json()['created'] == 1
+
+    @staticmethod
+    def test_import_users_unsupported_type(client, access_auth_header):
+        response = client.post(
+            '/api/accounts/import',
+            headers={**access_auth_header, 'Content-Type': 'text/plain'},
+            content='user',
+        )
+
+        assert response.status_code == 400
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'content', [b'x' * 20, iter([b'x' * 8, b'x' * 8, b'x' * 8])]
+    )
+    def test_import_users_too_large(client, access_auth_header, content):
+        with patch('app.api.accounts.settings.USER_IMPORT_MAX_BYTES', 16):
+            response = client.post(
+                '/api/accounts/import',
+                headers={**access_auth_header, 'Content-Type': 'text/csv'},
+                content=content,
+            )
+
+        assert response.status_code == 413
+
+    @staticmethod
+    def test_assign_role_correct(client, access_auth_header):
+        response = client.post(
+            '/api/accounts/roles/assign',
+            headers=access_auth_header,
+            json={'user_ids': [1, 2], 'role': 'doctor'},
+        )
+
+        assert response.status_code == 200
+        assert [item['user_id'] for item in response.json()] == [1, 2]
+
+    @staticmethod
+    def test_revoke_role_correct(client, access_auth_header):
+        response = client.post(
+            '/api/accounts/roles/revoke',
+            headers=access_auth_header,
+            json={'user_ids': [1], 'role': 'doctor'},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [{'user_id': 1, 'roles': []}]
+
     @staticmethod
     def test_create_user_correct(client, access_auth_header):
         response = client.post(
@@ -1,8 +1,15 @@
 import pytest
 
-from app.utils.enums import TokenStatus
+from app.core.security import decode_token
+from app.services import RoleService
+from app.utils.enums import Role, TokenStatus
 from tests.app import client, event_loop, settings, mock_settings  # noqa: F401
-from tests.models.user import user_add_fixtures, user_instance  # noqa: F401
+from tests.models.user import (  # noqa: F401
+    doctor_instance,
+    principal_instance,
+    user_add_fixtures,
+    user_instance,
+)
 from tests.models.role import role_instance  # noqa: F401
 from tests.models.tokens import (
     access_token,
@@ -26,6 +33,10 @@ class TestAuthentication:
         assert response.status_code == 200
         assert response.json().get('access_token') is not None
         assert response.json().get('refresh_token') is not None
+        payload = decode_token(response.json()['access_token'])
+        assert payload['roles'] == [Role.USER.value]
+        assert payload['role_version'] == 0
+        assert RoleService.add_role.call_args.kwargs == {'new_user': True}
 
     @staticmethod
     def test_signin_correct(client, user_instance):
@@ -37,6 +48,9 @@ class TestAuthentication:
         assert response.status_code == 200
         assert response.json().get('access_token') is not None
         assert response.json().get('refresh_token') is not None
+        payload = decode_token(response.json()['access_token'])
+        assert payload['roles'] == [Role.ADMIN.value]
+        assert payload['role_version'] == 0
 
     @staticmethod
     def test_signout_correct(client, refresh_auth_header):
@@ -48,6 +62,16 @@ class TestAuthentication:
         assert response.status_code == 200
         assert response.json()['status'] == 'ok'
 
+    @staticmethod
+    def test_signout_all_correct(client, refresh_auth_header):
+        response = client.put(
+            '/api/authentication/signout/all',
+            headers=refresh_auth_header,
+        )
+
+        assert response.status_code == 200
+        assert response.json()['status'] == 'ok'
+
     @staticmethod
     def test_validate_correct(client, access_token):
         response = client.get(
@@ -63,6 +87,22 @@ class TestAuthentication:
         assert data['user_id'] == 1
         assert data['status'] == TokenStatus.ACTIVE
 
+    @staticmethod
+    def test_introspect_correct(client, access_token):
+        response = client.post(
+            '/api/authentication/introspect',
+            json={'tokens': [access_token, 'invalid-token']},
+        )
+
+        assert response.status_code == 200
+
+        data = response.json()
+
+        assert len(data) == 2
+        assert data[0]['user_id'] == 1
+        assert data[0]['status'] == TokenStatus.ACTIVE
+        assert data[1]['status'] == TokenStatus.INVALID
+
     @staticmethod
     @pytest.mark.parametrize(
         'endpoint',
@@ -1,7 +1,13 @@
 import pytest
 
+from app.utils.pagination import encode_cursor
 from tests.app import client, event_loop, settings, mock_settings  # noqa: F401
-from tests.models.user import user_add_fixtures, user_instance  # noqa: F401
+from tests.models.user import (  # noqa: F401
+    doctor_instance,
+    principal_instance,
+    user_add_fixtures,
+    user_instance,
+)
 from tests.models.role import role_instance  # noqa: F401
 from tests.models.tokens import access_token, access_auth_header  # noqa: F401
 from tests.services.role import mock_role_service
@@ -15,12 +21,58 @@ from tests.services.user import mock_user_service
 class TestDoctor:
     @staticmethod
     def test_get_doctor(client, access_auth_header):
-        response = client.get('/api/doctors/1', headers=access_auth_header)
+        response = client.get('/api/doctors/2', headers=access_auth_header)
 
         assert response.status_code == 200
 
+    @staticmethod
+    def test_get_doctor_not_doctor(
+        client, access_auth_header, doctor_instance
+    ):
+        doctor_instance.roles = []
+
+        response = client.get('/api/doctors/2', headers=access_auth_header)
+
+        assert response.status_code == 400
+        assert response.json()['detail'] == ['Doctor not found']
+
     @staticmethod
     def test_get_all_doctors(client, access_auth_header):
         response = client.get('/api/doctors', headers=access_auth_header)
 
         assert response.status_code == 200
+
+    @staticmethod
+    def test_search_doctors(client, access_auth_header):
+        response = client.get(
+            '/api/doctors',
+            params={'search': 'Jo'},
+            headers=access_auth_header,
+        )
+
+        assert response.status_code == 200
+        assert 'X-Next-Cursor' not in response.headers
+
+    @staticmethod
+    def test_get_all_doctors_invalid_cursor(client, access_auth_header):
+        response = client.get(
+            '/api/doctors',
+            params={'cursor': 'not-a-cursor'},
+            headers=access_auth_header,
+        )
+
+        assert response.status_code == 400
+
+    @staticmethod
+    @pytest.mark.parametrize('cursor_id', ['x', None, True, 1.5])
+    def test_get_all_doctors_cursor_id_not_int(
+        client, access_auth_header, cursor_id
+    ):
+        response = client.get(
+            '/api/doctors',
+            params={'cursor': encode_cursor({'id': cursor_id})},
+            headers=access_auth_header,
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {'detail': ['Invalid pagination cursor']}
@@ -5,7 +5,9 @@ import pytest
 from pydantic_core._pydantic_core import ValidationError
 
 from app.core.security import get_hashed_password
-from app.models.user_models import User, UserAdd
+from app.models.role_models import UserRole
+from app.models.user_models import Principal, User, UserAdd
+from app.utils.enums import Role
 
 
 @pytest.fixture(scope='function')
@@ -88,6 +90,29 @@ def user_instance():
     )
 
 
+@pytest.fixture(scope='function')
+def doctor_instance():
+    return User(
+        id_=2,
+        first_name='first',
+        last_name='last',
+        username='doctor',
+        password=get_hashed_password('<PASSWORD>'),
+        roles=[UserRole(id_=4, user_id=2, role=Role.DOCTOR)],
+    )
+
+
+@pytest.fixture(scope='function')
+def principal_instance():
+    return Principal(
+        id_=1,
+        first_name='first',
+        last_name='last',
+        username='user',
+        roles=[Role.ADMIN],
+    )
+
+
 class TestUser:
     @staticmethod
     def test_user_correct(user_fixtures: list[dict]):
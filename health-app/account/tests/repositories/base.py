@@ -0,0 +1,123 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from asyncpg import UniqueViolationError
+from sqlalchemy import literal_column
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from app.exceptions import AlreadyExistsError, AppError
+from app.repositories import RoleRepository, UserRepository
+from app.utils.enums import Role
+
+
+def compile_statement(statement) -> str:
+    return str(statement.compile(dialect=postgresql.asyncpg.dialect()))
+
+
+@pytest.fixture(scope='function')
+def user_repository():
+    return UserRepository(MagicMock())
+
+
+class TestStatementCache:
+    @staticmethod
+    def test_select_statement_cached_by_shape(user_repository):
+        statement, params = user_repository._get_select_statement(
+            username='user', is_active_=True
+        )
+        other_statement, other_params = user_repository._get_select_statement(
+            is_active_=False, username='other'
+        )
+
+        assert statement is other_statement
+        assert params == {'filter_username': 'user', 'filter_is_active_': True}
+        assert other_params == {
+            'filter_username': 'other',
+            'filter_is_active_': False,
+        }
+
+    @staticmethod
+    def test_select_statement_none_filter(user_repository):
+        statement, params = user_repository._get_select_statement(
+            last_name=None
+        )
+
+        assert 'users.last_name IS NULL' in compile_statement(statement)
+        assert params == {}
+
+    @staticmethod
+    def test_select_statement_expression_not_cached(user_repository):
+        data = {'id_': literal_column('1')}
+
+        statement, params = user_repository._get_select_statement(**data)
+        other_statement, _ = user_repository._get_select_statement(**data)
+
+        assert statement is not other_statement
+        assert params == {}
+
+    @staticmethod
+    def test_update_statement_cached_by_shape(user_repository):
+        statement, params = user_repository._get_update_statement(
+            {'id_': 1}, first_name='first', last_name=None
+        )
+        other_statement, _ = user_repository._get_update_statement(
+            {'id_': 2}, last_name='last', first_name='first'
+        )
+
+        assert statement is other_statement
+        assert params == {
+            'filter_id_': 1,
+            'value_first_name': 'first',
+            'value_last_name': None,
+        }
+        assert statement.get_execution_options()['populate_existing']
+
+    @staticmethod
+    def test_insert_update_statement_cached_by_shape():
+        role_repository = RoleRepository(MagicMock())
+
+        statement, params = role_repository._get_insert_update_statement(
+            {'user_id': 1, 'role': Role.ADMIN},
+            constraint='user_id_role',
+            set_data={'is_active': True},
+        )
+        other_statement, _ = role_repository._get_insert_update_statement(
+            {'user_id': 2, 'role': Role.USER},
+            constraint='user_id_role',
+            set_data={'is_active': True},
+        )
+
+        assert statement is other_statement
+        assert params == {
+            'value_user_id': 1,
+            'value_role': Role.ADMIN,
+            'set_is_active': True,
+        }
+        assert 'ON CONSTRAINT user_id_role' in compile_statement(statement)
+
+
+class TestIntegrityErrors:
+    @staticmethod
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'sqlstate, error',
+        [
+            (UniqueViolationError.sqlstate, AlreadyExistsError),
+            ('23503', AppError),
+        ],
+    )
+    async def test_add_many_integrity_error(sqlstate, error):
+        session = MagicMock()
+        session.execute = AsyncMock(
+            side_effect=IntegrityError(
+                'INSERT', {}, SimpleNamespace(sqlstate=sqlstate)
+            )
+        )
+        user_repository = UserRepository(session)
+
+        with pytest.raises(error) as exc_info:
+            await user_repository.add_many({'username': 'user'})
+
+        assert type(exc_info.value) is error
@@ -60,6 +60,16 @@ class TestBlacklistTokenRepository:
 
         assert result is False
 
+    @staticmethod
+    async def test_exists_tokens(
+        blacklist_tokens_repository: BlacklistTokenRepository,
+        blacklist_tokens,
+    ):
+        token_uuids = [blacklist_tokens[0], uuid.uuid4(), blacklist_tokens[1]]
+        result = await blacklist_tokens_repository.exists_tokens(token_uuids)
+
+        assert result == [True, False, True]
+
     @staticmethod
     async def test_add_token(
         blacklist_tokens_repository: BlacklistTokenRepository,
@@ -71,6 +81,52 @@ class TestBlacklistTokenRepository:
 
         assert result is True
 
+    @staticmethod
+    async def test_scan_tokens(
+        blacklist_tokens_repository: BlacklistTokenRepository,
+        blacklist_tokens,
+    ):
+        result = [
+            token
+            async for token in blacklist_tokens_repository.scan_tokens(count=3)
+        ]
+
+        assert sorted(result) == sorted(map(str, blacklist_tokens))
+
+    @staticmethod
+    async def test_compact_tokens(
+        blacklist_tokens_repository: BlacklistTokenRepository,
+        redis,
+        blacklist_tokens,
+    ):
+        prefix = BlacklistTokenRepository.prefix
+        persistent, revoked = uuid.uuid4(), uuid.uuid4()
+        await redis.set(f'{prefix}:{persistent}', 'blacklisted')
+        await redis.set(f'{prefix}:{revoked}', 'revoked')
+
+        result = await blacklist_tokens_repository.compact_tokens(
+            7200, count=3
+        )
+
+        assert result == {
+            'scanned': len(blacklist_tokens) + 2,
+            'deleted': 1,
+            'expired': 1,
+        }
+        assert await redis.ttl(f'{prefix}:{persistent}') > 3600
+        assert await redis.exists(f'{prefix}:{revoked}') == 0
+
+    @staticmethod
+    async def test_get_memory_usage(
+        blacklist_tokens_repository: BlacklistTokenRepository,
+        blacklist_tokens,
+    ):
+        result = await blacklist_tokens_repository.get_memory_usage()
+
+        assert result['keys'] == len(blacklist_tokens)
+        assert result['persistent_keys'] == 0
+        assert result['bytes'] > 0
+
     @staticmethod
     async def test_remove_token(
         blacklist_tokens_repository: BlacklistTokenRepository, blacklist_tokens
@@ -0,0 +1,87 @@
+import pytest
+
+from app.exceptions import NoResultError
+from app.models.records import RoleRecord, UserRecord
+from app.repositories import (
+    FastRoleRepository,
+    FastUserRepository,
+    UserRepository,
+)
+from app.utils.enums import Role
+from tests.app import settings, event_loop  # noqa: F401
+from tests.database import (
+    engine,
+    init_db,
+    session_factory,
+    session,
+)  # noqa: F401
+from tests.repositories.user import setup_users, setup_user_roles
+from tests.models import *  # noqa: F401
+
+
+@pytest.fixture(scope='function')
+async def fast_user_repository(session, setup_users) -> FastUserRepository:
+    return FastUserRepository(session)
+
+
+@pytest.fixture(scope='function')
+async def fast_role_repository(session, setup_users) -> FastRoleRepository:
+    return FastRoleRepository(session)
+
+
+@pytest.mark.asyncio
+class TestFastUserRepository:
+    @staticmethod
+    async def test_get_user_correct(
+        fast_user_repository: FastUserRepository, user_fixtures
+    ):
+        by_id = await fast_user_repository.get_user(id_=1)
+        by_username = await fast_user_repository.get_user(
+            username=user_fixtures[0]['username']
+        )
+
+        assert isinstance(by_id, UserRecord)
+        assert by_id == by_username
+        assert by_id.username == user_fixtures[0]['username']
+        assert by_id.is_active is True
+
+    @staticmethod
+    async def test_get_user_not_found(fast_user_repository):
+        with pytest.raises(NoResultError):
+            await fast_user_repository.get_user(id_=1000)
+
+    @staticmethod
+    async def test_get_user_other_filters(
+        fast_user_repository: FastUserRepository, user_fixtures
+    ):
+        user = await fast_user_repository.get_user(
+            first_name=user_fixtures[0]['first_name']
+        )
+
+        assert not isinstance(user, UserRecord)
+
+    @staticmethod
+    async def test_get_user_with_roles_correct(
+        fast_user_repository: FastUserRepository, session, setup_user_roles
+    ):
+        user = await fast_user_repository.get_user_with_roles(id_=1)
+        orm_user = await UserRepository(session).get_user_with_roles(id_=1)
+
+        assert {role.role for role in user.roles} == {
+            role.role for role in orm_user.roles
+        }
+        assert user.model_dump() == {
+            key: getattr(orm_user, key) for key in user.model_dump()
+        }
+
+
+@pytest.mark.asyncio
+class TestFastRoleRepository:
+    @staticmethod
+    async def test_get_roles_correct(
+        fast_role_repository: FastRoleRepository, setup_user_roles
+    ):
+        roles = await fast_role_repository.get_roles(1)
+
+        assert all(isinstance(role, RoleRecord) for role in roles)
+        assert {role.role for role in roles} == {Role.USER, Role.ADMIN}
@@ -0,0 +1,62 @@
+import datetime
+from unittest.mock import patch, AsyncMock
+
+import pytest
+
+from app.models.user_models import Principal
+from app.repositories import PrincipalRepository
+from app.utils.enums import Role
+from tests.redis import redis, redis_pool  # noqa: F401
+from tests.app import settings, event_loop  # noqa: F401
+
+
+@pytest.fixture(scope='function')
+def principal_repository(redis) -> PrincipalRepository:
+    return PrincipalRepository(redis)
+
+
+@pytest.fixture(scope='function')
+def mock_principal_repository():
+    with patch(
+        'app.repositories.redis.PrincipalRepository',
+        new_callable=AsyncMock,
+    ) as mock_repository_class:
+        mock_repository_instance = mock_repository_class.return_value
+        mock_repository_instance.get_principal.return_value = None
+
+        yield mock_repository_instance
+
+
+@pytest.mark.asyncio
+class TestPrincipalRepository:
+    @staticmethod
+    async def test_add_principal(principal_repository: PrincipalRepository):
+        principal = Principal(
+            id_=1,
+            username='user',
+            first_name='first',
+            last_name='last',
+            roles=[Role.DOCTOR],
+        )
+
+        await principal_repository.add_principal(
+            principal, datetime.timedelta(minutes=1)
+        )
+
+        assert await principal_repository.get_principal(1) == principal
+        assert await principal_repository.get_principal(2) is None
+
+    @staticmethod
+    async def test_remove_principals(
+        principal_repository: PrincipalRepository,
+    ):
+        principal = Principal(
+            id_=1, username='user', first_name='first', last_name='last'
+        )
+        await principal_repository.add_principal(
+            principal, datetime.timedelta(minutes=1)
+        )
+
+        await principal_repository.remove_principals([1, 2])
+
+        assert await principal_repository.get_principal(1) is None
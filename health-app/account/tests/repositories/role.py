@@ -112,6 +112,32 @@ class TestRoleRepository:
             assert instance.user_id == user_id
             assert instance.is_active is False
 
+    @staticmethod
+    async def test_sync_roles_correct(role_repository):
+        result = await role_repository.sync_roles(
+            {3: [Role.DOCTOR, Role.MANAGER], 100: [Role.USER]}
+        )
+        roles = await role_repository.get_roles(3)
+
+        assert result[100] == []
+        assert {role.role for role in result[3]} == {
+            Role.DOCTOR,
+            Role.MANAGER,
+        }
+        assert all(role.is_active for role in result[3])
+        assert {role.role for role in roles} == {Role.DOCTOR, Role.MANAGER}
+
+    @staticmethod
+    async def test_assign_and_revoke_roles_correct(role_repository):
+        assigned = await role_repository.assign_roles([2, 100], Role.MANAGER)
+        revoked = await role_repository.revoke_roles([1, 2], Role.USER)
+
+        assert [(role.user_id, role.role) for role in assigned] == [
+            (2, Role.MANAGER)
+        ]
+        assert {role.user_id for role in revoked} == {1, 2}
+        assert not any(role.is_active for role in revoked)
+
     @staticmethod
     async def test_get_roles_correct(role_repository, role_fixtures):
         user_id = 1
@@ -122,5 +148,21 @@ class TestRoleRepository:
             assert instance.user_id == user_id
             assert instance.is_active is True
 
+    @staticmethod
+    async def test_get_roles_by_user_ids_correct(
+        role_repository, role_fixtures
+    ):
+        result = await role_repository.get_roles_by_user_ids([1, 2, 100])
+
+        assert set(result) == {1, 2, 100}
+        assert result[100] == []
+        for user_id in (1, 2):
+            expected = {
+                fixture['role']
+                for fixture in role_fixtures
+                if fixture['user_id'] == user_id
+            }
+            assert {role.role for role in result[user_id]} == expected
+
     @staticmethod
     async def test_get_all_roles_correct(role_repository, role_fixtures): ...
@@ -0,0 +1,61 @@
+import uuid
+from unittest.mock import patch, AsyncMock
+
+import pytest
+
+from app.repositories import BlacklistTokenRepository, TokenStateRepository
+from tests.redis import redis, redis_pool  # noqa: F401
+from tests.app import settings, event_loop  # noqa: F401
+
+
+@pytest.fixture(scope='function')
+def token_state_repository(redis) -> TokenStateRepository:
+    return TokenStateRepository(redis)
+
+
+@pytest.fixture(scope='function')
+def mock_token_state_repository():
+    with patch(
+        'app.repositories.redis.TokenStateRepository',
+        new_callable=AsyncMock,
+    ) as mock_repository_class:
+        mock_repository_instance = mock_repository_class.return_value
+
+        yield mock_repository_instance
+
+
+@pytest.mark.asyncio
+class TestTokenStateRepository:
+    @staticmethod
+    async def test_increment_epoch(
+        token_state_repository: TokenStateRepository,
+    ):
+        assert await token_state_repository.get_epoch(1) == 0
+
+        result = await token_state_repository.increment_epoch(1)
+
+        assert result == 1
+        assert await token_state_repository.get_epoch(1) == 1
+        assert await token_state_repository.get_epoch(2) == 0
+
+    @staticmethod
+    async def test_get_states(
+        token_state_repository: TokenStateRepository, redis
+    ):
+        blacklisted, active = uuid.uuid4(), uuid.uuid4()
+        prefix = BlacklistTokenRepository.prefix
+        await redis.set(f'{prefix}:{blacklisted}', 'blacklisted', ex=3600)
+        await token_state_repository.increment_epoch(2)
+        await token_state_repository.increment_role_versions([1])
+
+        result = await token_state_repository.get_states(
+            [(blacklisted, 1), (active, 2), (None, 2)]
+        )
+
+        assert [state.blacklisted for state in result] == [
+            True,
+            False,
+            False,
+        ]
+        assert [state.epoch for state in result] == [0, 1, 1]
+        assert [state.role_version for state in result] == [1, 0, 0]
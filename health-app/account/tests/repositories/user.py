@@ -6,6 +6,7 @@ from app.core.security import get_hashed_password
 from app.exceptions import AlreadyExistsError
 from app.repositories import UserRepository
 from app.repositories.sqlalchemy.user_repository import IUserRepository
+from app.utils.enums import Role
 from tests.app import settings, event_loop  # noqa: F401
 from tests.database import (
     engine,
@@ -22,6 +23,12 @@ async def setup_users(session, user_model_fixtures):
     await session.commit()
 
 
+@pytest.fixture(scope='function')
+async def setup_user_roles(session, setup_users, role_model_fixtures):
+    session.add_all(role_model_fixtures)
+    await session.commit()
+
+
 @pytest.fixture(scope='function', autouse=True)
 async def user_repository(session, setup_users) -> UserRepository:
     return UserRepository(session)
@@ -70,6 +77,51 @@ class TestUserRepository:
         with pytest.raises(AlreadyExistsError):
             await user_repository.add_user(user_fixture)
 
+    @staticmethod
+    async def test_add_many_and_upsert_many_correct(
+        user_repository: IUserRepository, user_add_fixtures, user_fixtures
+    ) -> None:
+        """Test that users are inserted and updated in bulk."""
+
+        new_user = user_add_fixtures[0].copy()
+        new_user.pop('password2')
+        new_user['password'] = new_user.pop('password1')
+        taken_user = user_fixtures[0].copy()
+        taken_user['first_name'] = 'Updated'
+
+        added = await user_repository.add_many(new_user)
+        upserted = await user_repository.upsert_many(
+            [taken_user],
+            index_elements=['username'],
+            update_columns=['first_name'],
+        )
+
+        assert added[0].id_ is not None
+        assert added[0].username == new_user['username']
+        assert upserted[0].username == taken_user['username']
+        assert upserted[0].first_name == 'Updated'
+
+    @staticmethod
+    async def test_add_users_skips_existing(
+        user_repository: IUserRepository, user_add_fixtures, user_fixtures
+    ) -> None:
+        """Test that users are inserted in bulk skipping taken usernames."""
+
+        new_user = user_add_fixtures[0].copy()
+        new_user.pop('password2')
+        new_user['password'] = new_user.pop('password1')
+        taken_user = user_fixtures[0].copy()
+
+        instances = await user_repository.add_users([new_user, taken_user])
+        existing = await user_repository.get_existing_usernames(
+            [new_user['username'], taken_user['username'], 'unknown']
+        )
+
+        assert [instance.username for instance in instances] == [
+            new_user['username']
+        ]
+        assert existing == {new_user['username'], taken_user['username']}
+
     @staticmethod
     async def test_get_user_correct(
         user_repository: IUserRepository, user_fixtures
@@ -107,6 +159,79 @@ class TestUserRepository:
 
         assert len(users) == len(ids)
 
+    @staticmethod
+    async def test_get_user_with_roles_correct(
+        user_repository: IUserRepository, setup_user_roles
+    ) -> None:
+        """Test that a user is retrieved with active roles."""
+
+        instance = await user_repository.get_user_with_roles(id_=1)
+
+        assert {role.role for role in instance.roles} == {
+            Role.USER,
+            Role.ADMIN,
+        }
+
+    @staticmethod
+    async def test_get_users_by_role_correct(
+        user_repository: IUserRepository, setup_user_roles
+    ) -> None:
+        """Test that users with a role can be paginated by cursor."""
+
+        first_page = await user_repository.get_users_by_role(
+            Role.DOCTOR, limit=1
+        )
+        second_page = await user_repository.get_users_by_role(
+            Role.DOCTOR, after_id=first_page[-1].id_, limit=1
+        )
+        last_page = await user_repository.get_users_by_role(
+            Role.DOCTOR, after_id=second_page[-1].id_, limit=1
+        )
+
+        assert [user.id_ for user in first_page + second_page] == [2, 3]
+        assert last_page == []
+
+    @staticmethod
+    async def test_search_users_by_role_correct(
+        user_repository: IUserRepository, setup_user_roles
+    ) -> None:
+        """Test that users with a role can be searched by name."""
+
+        by_prefix = await user_repository.search_users_by_role(
+            Role.DOCTOR, 'alex'
+        )
+        by_word = await user_repository.search_users_by_role(
+            Role.DOCTOR, 'Minecraft'
+        )
+        not_found = await user_repository.search_users_by_role(
+            Role.DOCTOR, 'Doe'
+        )
+
+        assert [user.id_ for user in by_prefix] == [2]
+        assert [user.id_ for user in by_word] == [3]
+        assert not_found == []
+
+    @staticmethod
+    async def test_get_users_page_correct(
+        user_repository: IUserRepository, setup_user_roles
+    ) -> None:
+        """Test that users can be paginated by cursor on any column."""
+
+        users = await user_repository.get_users_page(sort_by='last_name')
+        first_page = await user_repository.get_users_page(
+            sort_by='last_name', limit=2
+        )
+        last_user = first_page[-1]
+        second_page = await user_repository.get_users_page(
+            sort_by='last_name',
+            after=(last_user.last_name, last_user.id_),
+            limit=len(users),
+        )
+        doctors = await user_repository.get_users_page(role=Role.DOCTOR)
+
+        assert first_page + second_page == users
+        assert [user.id_ for user in doctors] == [2, 3]
+
     @staticmethod
     async def test_update_user_correct(
         user_repository: IUserRepository, user_fixtures
@@ -1,8 +1,9 @@
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from app.services import RoleService
+from app.utils.enums import Role
 from tests.models.role import role_fixtures, role_instance
 from tests.repositories.user import mock_user_repository  # noqa: F401
 from tests.repositories.role import mock_role_repository  # noqa: F401
@@ -13,6 +14,13 @@ from tests.utils.uow import mock_db_uow
 def mock_role_service(role_instance):
     with (
         patch.object(RoleService, 'get_roles', return_value=[role_instance]),
+        patch.object(
+            RoleService,
+            'get_roles_by_user_ids',
+            side_effect=lambda _, user_ids, only_active=True: {
+                user_id: [role_instance] for user_id in user_ids
+            },
+        ),
         patch.object(RoleService, 'get_role', return_value=role_instance),
         patch.object(
             RoleService, 'get_all_roles', return_value=[role_instance]
@@ -20,6 +28,20 @@ def mock_role_service(role_instance):
         patch.object(
             RoleService, 'update_roles', return_value=[role_instance]
         ),
+        patch.object(
+            RoleService,
+            'assign_role',
+            side_effect=lambda _, user_ids, role: {
+                user_id: [role_instance] for user_id in user_ids
+            },
+        ),
+        patch.object(
+            RoleService,
+            'revoke_role',
+            side_effect=lambda _, user_ids, role: {
+                user_id: [] for user_id in user_ids
+            },
+        ),
         patch.object(RoleService, 'add_role', return_value=role_instance),
         patch.object(RoleService, 'remove_role', return_value=role_instance),
     ):
@@ -51,6 +73,14 @@ class TestRoleService:
 
         assert args[0] == fixture['user_id']
 
+    @staticmethod
+    async def test_get_roles_by_user_ids(mock_db_uow):
+        await RoleService.get_roles_by_user_ids(mock_db_uow, [1, 2])
+
+        mock_db_uow.role_repository.get_roles_by_user_ids.assert_called_once_with(  # noqa: E501
+            [1, 2], True
+        )
+
     @staticmethod
     async def test_get_role(mock_db_uow, role_fixtures):
         fixture = role_fixtures[0]
@@ -77,3 +107,52 @@ class TestRoleService:
 
         assert args[0] == fixture['user_id']
         assert args[1] == fixture['role']
+
+    @staticmethod
+    async def test_update_roles(mock_db_uow, role_instance):
+        mock_db_uow.role_repository.sync_roles.return_value = {
+            1: [role_instance]
+        }
+
+        result = await RoleService.update_roles(mock_db_uow, 1, [Role.USER])
+
+        mock_db_uow.role_repository.sync_roles.assert_called_once_with(
+            {1: [Role.USER]}
+        )
+        assert result == [role_instance]
+
+    @staticmethod
+    async def test_assign_role(mock_db_uow):
+        await RoleService.assign_role(mock_db_uow, [1, 2], Role.DOCTOR)
+
+        mock_db_uow.role_repository.assign_roles.assert_called_once_with(
+            [1, 2], Role.DOCTOR
+        )
+        mock_db_uow.role_repository.get_roles_by_user_ids.assert_called_once_with(  # noqa: E501
+            [1, 2]
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize('method', ['assign_role', 'revoke_role'])
+    async def test_change_role_invalidates_principals(mock_db_uow, method):
+        with patch(
+            'app.core.principal_cache.principal_cache.invalidate',
+            new_callable=AsyncMock,
+        ) as mock_invalidate:
+            await getattr(RoleService, method)(
+                mock_db_uow, [1, 2], Role.DOCTOR
+            )
+            callback = mock_db_uow.add_after_commit.call_args.args[0]
+            mock_invalidate.assert_not_called()
+            await callback()
+
+        mock_invalidate.assert_awaited_once_with([1, 2])
+
+    @staticmethod
+    @pytest.mark.parametrize('new_user', [False, True])
+    async def test_add_role_invalidates_existing_user(mock_db_uow, new_user):
+        await RoleService.add_role(
+            mock_db_uow, 1, Role.DOCTOR, new_user=new_user
+        )
+
+        assert mock_db_uow.add_after_commit.called is not new_user
@@ -1,11 +1,21 @@
+import datetime
+import time
 from unittest.mock import patch
 
 import pytest
 
 from app.services import TokenService
+from app.models.token_models import TokenState
+from app.utils.enums import Role
 from tests.repositories.blacklist_token import (
     mock_blacklist_token_repository,
 )  # noqa: F401
+from tests.repositories.principal import (
+    mock_principal_repository,
+)  # noqa: F401
+from tests.repositories.token_state import (
+    mock_token_state_repository,
+)  # noqa: F401
 from tests.utils.uow import mock_inmemory_uow
 
 
@@ -16,8 +26,31 @@ async def mock_token_service():
         patch.object(
             TokenService, 'check_blacklist_token', return_value=False
         ),
+        patch.object(
+            TokenService,
+            'check_blacklist_tokens',
+            side_effect=lambda _, token_uuids: [False] * len(token_uuids),
+        ),
+        patch.object(TokenService, 'check_revoked_token', return_value=False),
+        patch.object(
+            TokenService,
+            'check_revoked_tokens',
+            side_effect=lambda _, payloads: [False] * len(payloads),
+        ),
+        patch.object(TokenService, 'get_epoch', return_value=0),
+        patch.object(
+            TokenService, 'get_token_state', return_value=TokenState()
+        ),
+        patch.object(
+            TokenService, 'get_user_state', return_value=TokenState()
+        ),
+        patch.object(TokenService, 'revoke_user_tokens', return_value=None),
         patch.object(TokenService, 'get_all_blocked_tokens', return_value=[]),
         patch.object(TokenService, 'revoke_token', return_value=None),
+        patch.object(TokenService, 'compact_blacklist', return_value={}),
+        patch.object(
+            TokenService, 'get_blacklist_memory_usage', return_value={}
+        ),
     ):
         yield
 
@@ -38,6 +71,41 @@ class TestTokenService:
 
         assert args[0] == token_uuid
 
+    @staticmethod
+    async def test_blacklist_token_default_expires(mock_inmemory_uow):
+        await TokenService.blacklist_token(mock_inmemory_uow, '<token-uuid>')
+
+        kwargs = (
+            mock_inmemory_uow.blacklist_token_repository.add_token.call_args[1]
+        )
+        assert kwargs['expires_in'] == datetime.timedelta(days=180)
+        assert kwargs['expires_at'] is None
+
+    @staticmethod
+    async def test_blacklist_token_naive_expires_at(mock_inmemory_uow):
+        expires_at = datetime.datetime.now(datetime.UTC) + datetime.timedelta(
+            minutes=5
+        )
+        await TokenService.blacklist_token(
+            mock_inmemory_uow,
+            '<token-uuid>',
+            expires_at=expires_at.replace(tzinfo=None),
+        )
+
+        kwargs = (
+            mock_inmemory_uow.blacklist_token_repository.add_token.call_args[1]
+        )
+        assert kwargs['expires_at'] == int(expires_at.timestamp())
+        assert kwargs['expires_in'] is None
+
+    @staticmethod
+    async def test_blacklist_token_expired(mock_inmemory_uow):
+        await TokenService.blacklist_token(
+            mock_inmemory_uow, '<token-uuid>', expires_at=int(time.time()) - 1
+        )
+
+        mock_inmemory_uow.blacklist_token_repository.add_token.assert_not_called()  # noqa: E501
+
     @staticmethod
     async def test_check_blacklist_token(mock_inmemory_uow):
         token_uuid = '<token-uuid>'
@@ -52,6 +120,80 @@ class TestTokenService:
 
         assert args[0] == token_uuid
 
+    @staticmethod
+    async def test_check_blacklist_tokens(mock_inmemory_uow):
+        token_uuids = ['<token-uuid-1>', '<token-uuid-2>']
+        await TokenService.check_blacklist_tokens(
+            mock_inmemory_uow, token_uuids
+        )
+
+        mock_inmemory_uow.blacklist_token_repository.exists_tokens.assert_called_once_with(  # noqa: E501
+            token_uuids
+        )
+
+    @staticmethod
+    async def test_check_revoked_tokens(mock_inmemory_uow):
+        repository = mock_inmemory_uow.token_state_repository
+        repository.get_states.return_value = [
+            TokenState(blacklisted=False, epoch=1),
+            TokenState(blacklisted=True, epoch=0),
+            TokenState(blacklisted=False, epoch=2),
+        ]
+        payloads = [
+            {'jti': '<token-uuid-1>', 'user_id': 1, 'epoch': 1},
+            {'jti': '<token-uuid-2>', 'user_id': 2},
+            {'jti': '<token-uuid-3>', 'user_id': 3, 'epoch': 1},
+        ]
+
+        result = await TokenService.check_revoked_tokens(
+            mock_inmemory_uow, payloads
+        )
+
+        assert result == [False, True, True]
+        repository.get_states.assert_called_once_with(
+            [
+                ('<token-uuid-1>', 1),
+                ('<token-uuid-2>', 2),
+                ('<token-uuid-3>', 3),
+            ]
+        )
+
+    @staticmethod
+    async def test_get_user_state(mock_inmemory_uow):
+        repository = mock_inmemory_uow.token_state_repository
+        repository.get_states.return_value = [
+            TokenState(epoch=1, role_version=2)
+        ]
+
+        result = await TokenService.get_user_state(mock_inmemory_uow, 1)
+
+        assert result.role_version == 2
+        repository.get_states.assert_called_once_with([(None, 1)])
+
+    @staticmethod
+    async def test_get_token_roles():
+        payload = {'roles': ['admin'], 'role_version': 1}
+
+        assert TokenService.get_token_roles(
+            payload, TokenState(role_version=1)
+        ) == [Role.ADMIN]
+        assert (
+            TokenService.get_token_roles(payload, TokenState(role_version=2))
+            is None
+        )
+        assert (
+            TokenService.get_token_roles({}, TokenState(role_version=0))
+            is None
+        )
+
+    @staticmethod
+    async def test_revoke_user_tokens(mock_inmemory_uow):
+        await TokenService.revoke_user_tokens(mock_inmemory_uow, 1)
+
+        mock_inmemory_uow.token_state_repository.increment_epoch.assert_called_once_with(  # noqa: E501
+            1
+        )
+
     @staticmethod
     async def test_get_all_blocked_tokens(mock_inmemory_uow):
         await TokenService.get_all_blocked_tokens(mock_inmemory_uow)
@@ -71,3 +213,11 @@ class TestTokenService:
         ]
 
         assert args == token_uuid
+
+    @staticmethod
+    async def test_compact_blacklist(mock_inmemory_uow):
+        await TokenService.compact_blacklist(mock_inmemory_uow)
+
+        mock_inmemory_uow.blacklist_token_repository.compact_tokens.assert_called_once_with(  # noqa: E501
+            datetime.timedelta(days=180), count=1000
+        )
@@ -1,18 +1,34 @@
+from types import SimpleNamespace
 from unittest.mock import patch, AsyncMock
 
 import pytest
 
+from app.core.principal_cache import principal_cache
+from app.models.user_models import UserImportResult
 from app.services import UserService
-from tests.models.user import user_add_fixtures, user_fixtures, user_instance
+from app.utils.enums import Role
+from tests.models.user import (
+    doctor_instance,
+    principal_instance,
+    user_add_fixtures,
+    user_fixtures,
+    user_instance,
+)
 from tests.repositories.user import mock_user_repository  # noqa: F401
 from tests.repositories.role import mock_role_repository  # noqa: F401
 from tests.utils.uow import mock_db_uow
 
 
 @pytest.fixture(scope='function')
-def mock_user_service(user_instance):
+def mock_user_service(user_instance, doctor_instance, principal_instance):
     with (
         patch.object(UserService, 'add_user', return_value=user_instance),
+        patch.object(
+            UserService, 'get_principal', return_value=principal_instance
+        ),
+        patch.object(
+            UserService, 'get_user_with_roles', return_value=doctor_instance
+        ),
         patch.object(UserService, 'get_user', return_value=user_instance),
         patch.object(
             UserService, 'get_user_by_id', return_value=user_instance
@@ -31,6 +47,20 @@ def mock_user_service(user_instance):
         patch.object(
             UserService, 'get_users_by_ids', return_value=[user_instance]
         ),
+        patch.object(
+            UserService, 'get_users_by_role', return_value=[user_instance]
+        ),
+        patch.object(
+            UserService, 'get_users_page', return_value=[user_instance]
+        ),
+        patch.object(
+            UserService, 'search_users_by_role', return_value=[user_instance]
+        ),
+        patch.object(
+            UserService,
+            'import_users',
+            return_value=UserImportResult(created=1, errors=[]),
+        ),
     ):
         yield
 
@@ -67,6 +97,32 @@ class TestUserService:
 
         mock_db_uow.user_repository.get_all_users.assert_called_once()
 
+    @staticmethod
+    async def test_get_principal(mock_db_uow, doctor_instance):
+        repository = mock_db_uow.user_repository
+        repository.get_user_with_roles.return_value = doctor_instance
+
+        with (
+            patch.object(principal_cache, 'get', return_value=None),
+            patch.object(principal_cache, 'add') as mock_add,
+        ):
+            principal = await UserService.get_principal(mock_db_uow, 1)
+
+        assert principal.id_ == doctor_instance.id_
+        assert principal.roles == [Role.DOCTOR]
+        repository.get_user_with_roles.assert_called_once_with(True, id_=1)
+        mock_add.assert_called_once_with(principal)
+
+    @staticmethod
+    async def test_get_principal_cached(mock_db_uow, principal_instance):
+        with patch.object(
+            principal_cache, 'get', return_value=principal_instance
+        ):
+            principal = await UserService.get_principal(mock_db_uow, 1)
+
+        assert principal is principal_instance
+        mock_db_uow.user_repository.get_user_with_roles.assert_not_called()
+
     @staticmethod
     async def test_update_user(mock_db_uow, user_fixtures):
         new_first_name = user_fixtures[1]['first_name']
@@ -80,6 +136,7 @@ class TestUserService:
 
         assert args[0] == 1
         assert kwargs['first_name'] == new_first_name
+        mock_db_uow.add_after_commit.assert_called_once()
 
     @staticmethod
     async def test_delete_user(mock_db_uow):
@@ -89,3 +146,58 @@ class TestUserService:
         args = mock_db_uow.user_repository.deactivate_user.call_args_list[0][0]
 
         assert args[0] == 1
+
+    @staticmethod
+    async def test_import_users(mock_db_uow):
+        records = [
+            {
+                'first_name': 'first',
+                'last_name': 'last',
+                'username': 'new',
+                'password': 'Password12/',
+                'roles': ['doctor', 'doctor'],
+            },
+            {
+                'first_name': 'first',
+                'last_name': 'last',
+                'username': 'taken',
+                'password': 'Password12/',
+                'roles': [],
+            },
+            {'username': 'invalid'},
+            {
+                'first_name': 'first',
+                'last_name': 'last',
+                'username': 'new',
+                'password': 'Password12/',
+                'roles': [],
+            },
+        ]
+        user_repository = mock_db_uow.user_repository
+        user_repository.get_existing_usernames.return_value = {'taken'}
+        user_repository.add_users.return_value = [
+            SimpleNamespace(id_=10, username='new')
+        ]
+        mock_db_uow.commit = AsyncMock()
+        commits_before_hashing = []
+
+        async def hash_many(passwords):
+            commits_before_hashing.append(mock_db_uow.commit.call_count)
+            return ['hashed']
+
+        with patch(
+            'app.services.user_service.password_hasher.hash_many',
+            side_effect=hash_many,
+        ):
+            result = await UserService.import_users(mock_db_uow, records)
+
+        users = user_repository.add_users.call_args_list[0][0][0]
+        roles = mock_db_uow.role_repository.add_roles.call_args_list[0][0][0]
+
+        assert result.created == 1
+        assert [error.row for error in result.errors] == [2, 3, 4]
+        assert result.errors[1].username == 'invalid'
+        assert [user['password'] for user in users] == ['hashed']
+        assert [role['user_id'] for role in roles] == [10]
+        assert commits_before_hashing == [1]
+        assert mock_db_uow.commit.call_count == 2
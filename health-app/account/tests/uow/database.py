@@ -0,0 +1,152 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.db import ReplicaRouter
+from app.repositories import FastRoleRepository, FastUserRepository
+from app.uow.database import SQLAlchemyUOW
+
+
+@pytest.fixture(scope='function')
+def mock_session():
+    session = AsyncMock()
+    session.info = {}
+    return session
+
+
+@pytest.fixture(scope='function')
+def replica_router():
+    return ReplicaRouter([MagicMock(name='replica')])
+
+
+@pytest.fixture(scope='function')
+def database_uow(mock_session) -> SQLAlchemyUOW:
+    return SQLAlchemyUOW(AsyncMock(return_value=mock_session))
+
+
+@pytest.mark.asyncio
+class TestSQLAlchemyUOW:
+    @staticmethod
+    async def test_nested_commit_once(database_uow, mock_session):
+        async with database_uow as uow:
+            async with uow:
+                assert uow.session is mock_session
+            async with uow:
+                assert uow.session is mock_session
+            mock_session.commit.assert_not_called()
+
+        database_uow.session_factory.assert_called_once()
+        mock_session.commit.assert_called_once()
+        mock_session.close.assert_called_once()
+        assert database_uow.session is None
+
+    @staticmethod
+    async def test_rollback_on_error(database_uow, mock_session):
+        with pytest.raises(ValueError):
+            async with database_uow as uow:
+                async with uow:
+                    raise ValueError
+
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
+        mock_session.close.assert_called_once()
+
+    @staticmethod
+    async def test_read_only_uses_replica(mock_session, replica_router):
+        session_factory = AsyncMock(return_value=mock_session)
+        database_uow = SQLAlchemyUOW(
+            session_factory, read_only=True, router=replica_router
+        )
+
+        async with database_uow:
+            pass
+
+        session_factory.assert_called_once_with(replica_router.engines[0])
+        mock_session.connection.assert_called_once()
+
+    @staticmethod
+    async def test_read_only_falls_back_to_primary(
+        mock_session, replica_router
+    ):
+        mock_session.connection.side_effect = OSError
+        session_factory = AsyncMock(return_value=mock_session)
+        database_uow = SQLAlchemyUOW(
+            session_factory, read_only=True, router=replica_router
+        )
+
+        async with database_uow:
+            pass
+
+        assert session_factory.call_args_list[1].args == ()
+        assert replica_router.get_stats()['unhealthy'] == 1
+
+    @staticmethod
+    async def test_write_starts_read_your_writes(mock_session, replica_router):
+        database_uow = SQLAlchemyUOW(
+            AsyncMock(return_value=mock_session),
+            consistency_key='token',
+            router=replica_router,
+        )
+
+        async with database_uow:
+            mock_session.info['has_writes'] = True
+
+        assert replica_router.get_engine('token') is None
+        assert replica_router.get_engine('other') is not None
+
+    @staticmethod
+    async def test_lazy_opens_session_in_nested_block(
+        database_uow, mock_session
+    ):
+        database_uow.lazy = True
+
+        async with database_uow as uow:
+            assert uow.session is None
+            async with uow:
+                assert uow.session is mock_session
+            mock_session.commit.assert_not_called()
+
+        mock_session.commit.assert_called_once()
+
+    @staticmethod
+    async def test_lazy_without_session(database_uow):
+        database_uow.lazy = True
+
+        async with database_uow:
+            pass
+
+        database_uow.session_factory.assert_not_called()
+
+    @staticmethod
+    async def test_after_commit(database_uow):
+        callback = AsyncMock()
+
+        async with database_uow as uow:
+            uow.add_after_commit(callback)
+            callback.assert_not_called()
+
+        callback.assert_called_once()
+
+    @staticmethod
+    async def test_after_commit_dropped_on_rollback(database_uow):
+        callback = AsyncMock()
+
+        with pytest.raises(ValueError):
+            async with database_uow as uow:
+                uow.add_after_commit(callback)
+                raise ValueError
+
+        async with database_uow:
+            pass
+
+        callback.assert_not_called()
+
+    @staticmethod
+    async def test_fast_path_repositories(mock_session):
+        database_uow = SQLAlchemyUOW(
+            AsyncMock(return_value=mock_session), fast_path=True
+        )
+
+        async with database_uow as uow:
+            assert isinstance(uow.user_repository, FastUserRepository)
+            assert isinstance(uow.role_repository, FastRoleRepository)
@@ -0,0 +1,116 @@
+import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.local_storage import LocalStorage
+from app.models.user_models import Principal
+from app.uow.inmemory import LocalUOW, RedisUOW
+
+
+@pytest.fixture(scope='function')
+def mock_pipeline():
+    return AsyncMock()
+
+
+@pytest.fixture(scope='function')
+def redis_uow(mock_pipeline) -> RedisUOW:
+    connection = MagicMock()
+    connection.pipeline.return_value = mock_pipeline
+    return RedisUOW(lambda: connection)
+
+
+@pytest.fixture(scope='function')
+def local_uow() -> LocalUOW:
+    storage = LocalStorage(max_size=100)
+    return LocalUOW(lambda: storage)
+
+
+@pytest.mark.asyncio
+class TestRedisUOW:
+    @staticmethod
+    async def test_commit_on_exit(redis_uow, mock_pipeline):
+        async with redis_uow as uow:
+            await uow.token_state_repository.increment_epoch(1)
+
+        mock_pipeline.incr.assert_called_once()
+        mock_pipeline.execute.assert_called_once()
+        mock_pipeline.reset.assert_not_called()
+
+    @staticmethod
+    async def test_rollback_on_error(redis_uow, mock_pipeline):
+        with pytest.raises(ValueError):
+            async with redis_uow as uow:
+                await uow.blacklist_token_repository.add_token('<token-uuid>')
+                raise ValueError
+
+        mock_pipeline.set.assert_called_once()
+        mock_pipeline.execute.assert_not_called()
+        mock_pipeline.reset.assert_called_once()
+
+
+@pytest.mark.asyncio
+class TestLocalUOW:
+    @staticmethod
+    async def test_commit_on_exit(local_uow):
+        async with local_uow as uow:
+            await uow.blacklist_token_repository.add_token(
+                '<token-uuid>', expires_in=60
+            )
+            await uow.token_state_repository.increment_epoch(1)
+            assert not await uow.blacklist_token_repository.exists_token(
+                '<token-uuid>'
+            )
+
+        async with local_uow as uow:
+            states = await uow.token_state_repository.get_states(
+                [('<token-uuid>', 1), ('<other-uuid>', 2)]
+            )
+            assert await uow.blacklist_token_repository.exists_tokens(
+                ['<token-uuid>', '<other-uuid>']
+            ) == [True, False]
+
+        assert [state.blacklisted for state in states] == [True, False]
+        assert [state.epoch for state in states] == [1, 0]
+
+    @staticmethod
+    async def test_rollback_on_error(local_uow):
+        with pytest.raises(ValueError):
+            async with local_uow as uow:
+                await uow.token_state_repository.increment_epoch(1)
+                raise ValueError
+
+        async with local_uow as uow:
+            assert await uow.token_state_repository.get_epoch(1) == 0
+
+    @staticmethod
+    async def test_revocations_not_evicted():
+        storage = LocalStorage(max_size=2)
+        local_uow = LocalUOW(lambda: storage)
+
+        async with local_uow as uow:
+            await uow.blacklist_token_repository.add_token(
+                '<token-uuid>', expires_in=60
+            )
+            await uow.token_state_repository.increment_epoch(1)
+            await uow.token_state_repository.increment_role_versions([1])
+            for user_id in range(5):
+                await uow.principal_repository.add_principal(
+                    Principal(
+                        id_=user_id,
+                        username=f'user{user_id}',
+                        first_name='first',
+                        last_name='last',
+                    ),
+                    datetime.timedelta(seconds=60),
+                )
+
+        async with local_uow as uow:
+            states = await uow.token_state_repository.get_states(
+                [('<token-uuid>', 1)]
+            )
+
+        assert states[0].blacklisted
+        assert states[0].epoch == 1
+        assert states[0].role_version == 1
+        assert storage.get_stats()['evictions'] == 3
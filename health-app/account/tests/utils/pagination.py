@@ -0,0 +1,21 @@
+import pytest
+
+from app.exceptions import InvalidCursorError
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+class TestPagination:
+    @staticmethod
+    def test_cursor_roundtrip():
+        cursor = encode_cursor({'id': 42})
+
+        assert '=' not in cursor
+        assert decode_cursor(cursor, {'id'}) == {'id': 42}
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'cursor', ['not-a-cursor', encode_cursor({'name': 'a'}), 'W10']
+    )
+    def test_cursor_invalid(cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, {'id'})
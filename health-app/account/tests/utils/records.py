@@ -0,0 +1,48 @@
+import pytest
+
+from app.exceptions import InvalidImportFileError
+from app.utils.records import parse_records
+
+
+class TestRecords:
+    @staticmethod
+    def test_parse_json():
+        records = parse_records(
+            b'[{"username": "user"}]', 'application/json; charset=utf-8'
+        )
+
+        assert records == [{'username': 'user'}]
+
+    @staticmethod
+    def test_parse_ndjson_keeps_invalid_lines():
+        content = b'{"username": "first"}\n\nnot json\n{"username": "second"}'
+
+        records = parse_records(content, 'application/x-ndjson')
+
+        assert records == [{'username': 'first'}, None, {'username': 'second'}]
+
+    @staticmethod
+    def test_parse_csv_list_fields():
+        content = b'username,roles\nuser,doctor; admin\nother,\n'
+
+        records = parse_records(content, 'text/csv', list_fields=('roles',))
+
+        assert records == [
+            {'username': 'user', 'roles': ['doctor', 'admin']},
+            {'username': 'other', 'roles': []},
+        ]
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'content, media_type',
+        [
+            (b'{"username": "user"}', 'application/json'),
+            (b'[', 'application/json'),
+            (b'username\nuser', 'text/plain'),
+            (b'\xff', 'text/csv'),
+            (b'[{}, {}]', 'application/json'),
+        ],
+    )
+    def test_parse_invalid(content, media_type):
+        with pytest.raises(InvalidImportFileError):
+            parse_records(content, media_type, max_rows=1)
@@ -3,13 +3,17 @@ from unittest.mock import patch
 import pytest
 
 from tests.repositories.blacklist_token import mock_blacklist_token_repository
+from tests.repositories.principal import mock_principal_repository
 from tests.repositories.role import mock_role_repository
+from tests.repositories.token_state import mock_token_state_repository
 from tests.repositories.user import mock_user_repository
 
 
 @pytest.fixture(scope='function')
 def mock_db_uow(mock_user_repository, mock_role_repository):
-    with patch('app.uow.database.SQLAlchemyUOW') as mock_uow_class:
+    with patch(
+        'app.uow.database.SQLAlchemyUOW', autospec=True
+    ) as mock_uow_class:
         mock_uow_instance = mock_uow_class.return_value
 
         mock_uow_instance.role_repository = mock_role_repository
@@ -21,13 +25,19 @@ def mock_db_uow(mock_user_repository, mock_role_repository):
 
 
 @pytest.fixture(scope='function')
-def mock_inmemory_uow(mock_blacklist_token_repository):
+def mock_inmemory_uow(
+    mock_blacklist_token_repository,
+    mock_token_state_repository,
+    mock_principal_repository,
+):
     with patch('app.uow.inmemory.RedisUOW') as mock_uow_class:
         mock_uow_instance = mock_uow_class.return_value
 
         mock_uow_instance.blacklist_token_repository = (
             mock_blacklist_token_repository
         )
+        mock_uow_instance.token_state_repository = mock_token_state_repository
+        mock_uow_instance.principal_repository = mock_principal_repository
 
         mock_uow_instance.__aenter__.return_value = mock_uow_instance
         mock_uow_instance.__aexit__.return_value = None